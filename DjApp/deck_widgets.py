@@ -1,22 +1,111 @@
 import os
+import re
+import contextlib
+import decimal
+import logging
 import time
+import hashlib
+import tempfile
 import traceback
 import unicodedata
+from collections import OrderedDict
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QSlider, QFileDialog, QSizePolicy, QMessageBox,
     QLineEdit, QDial
 )
 from PyQt6.QtCore import (
-    Qt, QTimer, QUrl, pyqtSignal, QThread, QRectF
+    Qt, QTimer, QUrl, pyqtSignal, QThread, QRectF, QObject, QRunnable, QThreadPool, QMutex, QMutexLocker,
+    QSignalBlocker
 )
 from PyQt6.QtGui import  QColor, QLinearGradient, QPainter, QBrush, QPen, QPainterPath, QIntValidator
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput, QMediaDevices
+import numpy as np
 import soundfile as sf
 from waveform import WaveformDisplay, SpectrogramDisplay
 from turntable import Turntable
 from equalizer import ThreeBandEQ
-from tempo_shifter import TempoShifter
+from tempo_shifter import TempoShifter, PYRUBBERBAND_AVAILABLE
+
+logger = logging.getLogger(__name__)
+
+# Player enum members resolved once at import instead of on every state/status check
+_PS_PLAYING = QMediaPlayer.PlaybackState.PlayingState
+_PS_STOPPED = QMediaPlayer.PlaybackState.StoppedState
+_PS_PAUSED = QMediaPlayer.PlaybackState.PausedState
+_MS_LOADED = QMediaPlayer.MediaStatus.LoadedMedia
+_MS_BUFFERED = QMediaPlayer.MediaStatus.BufferedMedia
+_MS_LOADING = QMediaPlayer.MediaStatus.LoadingMedia
+_MS_STALLED = QMediaPlayer.MediaStatus.StalledMedia
+_MS_BUFFERING = QMediaPlayer.MediaStatus.BufferingMedia
+_MS_NO = QMediaPlayer.MediaStatus.NoMedia
+_MS_END = QMediaPlayer.MediaStatus.EndOfMedia
+_MS_INVALID = QMediaPlayer.MediaStatus.InvalidMedia
+_MS_READY = frozenset((_MS_LOADED, _MS_BUFFERED))
+_MS_PENDING = frozenset((_MS_LOADING, _MS_STALLED, _MS_BUFFERING, _MS_NO))
+_MS_SEEKABLE = frozenset((_MS_LOADED, _MS_BUFFERED, _MS_END))
+_PLAYBACK_STATE_NAMES = {_PS_STOPPED: 'Stopped', _PS_PLAYING: 'Playing', _PS_PAUSED: 'Paused'}
+
+# Chromatic root notes for key transposition
+_KEY_NAMES = ('C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B')
+_KEY_INDEX = {name: i for i, name in enumerate(_KEY_NAMES)}
+
+# Directory of this module and the playback-buffer and tempo-processed file directories beneath it
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_AUDIO_TEMP_DIR = os.path.join(_MODULE_DIR, "temp_audio")
+_TEMPO_TEMP_DIR = os.path.join(_MODULE_DIR, "temp_tempo")
+# Ending of the time-stretched files set_deck_tempo writes there, e.g. "deck1_<name>_<ms>_128bpm.wav"
+_TEMPO_FILE_SUFFIX = "bpm.wav"
+
+# EQ renders are rewritten on every EQ apply and read back immediately, so keep them on a
+# RAM-backed filesystem where one exists (MIXLAB_EQ_TMP overrides the location)
+_EQ_TEMP_DIR = (os.environ.get('MIXLAB_EQ_TMP') or
+                ('/dev/shm/mixlab_eq' if os.path.isdir('/dev/shm') else
+                 os.path.join(tempfile.gettempdir(), 'mixlab_eq')))
+
+# EQ renders are cached by source, tempo and gains under this file name prefix, up to this size
+_EQ_CACHE_PREFIX = "eqcache_"
+_EQ_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# EQ renders each deck is playing or about to swap in, by deck number. The cache trim
+# skips them; decks replace their entry as a whole, so workers only ever read a snapshot
+_eq_files_in_use = {}
+
+# Created once here rather than before every write
+for _temp_dir in (_AUDIO_TEMP_DIR, _TEMPO_TEMP_DIR, _EQ_TEMP_DIR):
+    os.makedirs(_temp_dir, exist_ok=True)
+
+# Characters not allowed in the ASCII-safe base name of tempo-processed files
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^A-Za-z0-9 _-]')
+# Plain non-negative decimal seconds as typed into the loop inputs, e.g. "12" or "12.5"
+_SECONDS_RE = re.compile(r'\d+(?:\.\d*)?|\.\d+')
+
+# Playback rate magnitude range applied while scratching the turntable
+_SCRATCH_RATE_MIN = 0.1
+_SCRATCH_RATE_MAX = 3.0
+# Seeks closer than this to the current position are skipped
+_SEEK_TOLERANCE_MS = 50
+
+# How close (ms) a reported position must be to a turntable seek target to count as the seek ack
+_SCRUB_RESUME_TOLERANCE_MS = 50
+
+# Number of recently used playback file URLs kept per deck
+_URL_CACHE_SIZE = 8
+
+# Number of time-stretched renders kept for reuse by the neutral EQ reset
+_TEMPO_CACHE_SIZE = 8
+
+# Frames per block when streaming tempo-processed audio back from disk
+_TEMPO_READ_BLOCK_FRAMES = 1 << 15
+
+# Volume display levels, matched by the QLabel[volLevel=...] rules in styles.qss
+_VOL_LEVELS = ("off", "low", "med", "high")
+
+# Key display label styles
+_KEY_STYLE_TRANSPOSED = "color: #00d4ff; font-weight: bold; text-shadow: 0 0 10px rgba(0, 212, 255, 0.6);"
+_KEY_STYLE_HIGH_CONFIDENCE = "color: #00ff00;"
+_KEY_STYLE_MEDIUM_CONFIDENCE = "color: #ffff00;"
+_KEY_STYLE_LOW_CONFIDENCE = "color: #ff6600;"
 
 def safe_filename_for_logging(filepath):
     """
@@ -66,6 +155,201 @@ def get_display_filename(filepath):
     except Exception as e:
         return "Error reading filename"
 
+def audio_buffer_digest(filepath, audio_data, sample_rate):
+    """
+    Compute a cheap fingerprint of a decoded audio buffer, used to detect whether a deck's
+    playback WAV already holds the same audio.
+
+    Args:
+        filepath (str): Path of the source audio file.
+        audio_data (np.ndarray): Decoded audio samples.
+        sample_rate (int): Sample rate in Hz.
+
+    Returns:
+        str: Hex digest over the source file stats, buffer shape and the first 64 KiB of samples.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        stat = os.stat(filepath)
+        digest.update(f"{filepath}|{stat.st_size}|{stat.st_mtime_ns}".encode('utf-8', 'surrogatepass'))
+    except OSError:
+        digest.update(str(filepath).encode('utf-8', 'surrogatepass'))
+    digest.update(f"{audio_data.shape}|{audio_data.dtype}|{sample_rate}".encode('ascii'))
+    head = audio_data.reshape(-1)[:(1 << 16) // max(audio_data.itemsize, 1)]
+    digest.update(head.tobytes())
+    return digest.hexdigest()
+
+def eq_cache_key(source_path, source_mtime, bpm, gains):
+    """
+    Build the EQ render cache key for a source, tempo and set of band gains.
+
+    Args:
+        source_path (str): Original audio file path.
+        source_mtime (float): Modification time of the original file.
+        bpm (int): Tempo the source was rendered at.
+        gains (tuple): Bass, mid and treble gains.
+
+    Returns:
+        str: 16-character hex key.
+    """
+    knobs = "|".join(str(round(g * 100)) for g in gains)  # Gains come from 0-200 knob steps
+    return hashlib.blake2b(f"{source_path}|{source_mtime}|{bpm}|{knobs}".encode("utf-8"),
+                           digest_size=8).hexdigest()
+
+def is_eq_cache_file(path):
+    """
+    Whether a path is an entry of the shared EQ render cache, which is only ever
+    removed by purge_eq_temp_files.
+
+    Args:
+        path (str): File path.
+
+    Returns:
+        bool: True for EQ cache entries.
+    """
+    return bool(path) and os.path.dirname(path) == _EQ_TEMP_DIR and os.path.basename(path).startswith(_EQ_CACHE_PREFIX)
+
+def purge_eq_temp_files(max_cache_bytes=_EQ_CACHE_MAX_BYTES, remove_partial=True, on_exit=False, keep=(), older_than=None):
+    """
+    Trim the EQ render cache to max_cache_bytes, least recently used first, and remove
+    partially written renders. Renders a deck is playing or about to swap in are kept
+    unless the app is closing.
+
+    Args:
+        max_cache_bytes (int): Size the cache may keep. 0 empties it.
+        remove_partial (bool): Whether to remove unfinished renders. Only safe when no
+            render is running.
+        on_exit (bool): Whether the app is closing. A RAM-backed cache is emptied then,
+            so it doesn't hold memory after the app exits.
+        keep (iterable): Further paths that must not be evicted.
+        older_than (float, optional): Only consider renders last modified before this
+            time, leaving newer ones (this session's, or another running instance's) alone.
+    """
+    protected = set()
+    if on_exit:
+        if _EQ_TEMP_DIR.startswith('/dev/shm'):
+            max_cache_bytes = 0
+    else:
+        protected.update(keep)
+        for paths in list(_eq_files_in_use.values()):
+            protected.update(paths)
+    entries_by_age = []
+    try:
+        with os.scandir(_EQ_TEMP_DIR) as entries:
+            for entry in entries:
+                if not entry.name.startswith(_EQ_CACHE_PREFIX):
+                    continue
+                try:
+                    if older_than is not None and entry.stat().st_mtime >= older_than:
+                        continue
+                    if entry.name.endswith(".part"):
+                        if remove_partial:
+                            os.remove(entry.path)
+                    elif entry.is_file():
+                        st = entry.stat()
+                        entries_by_age.append((st.st_mtime, st.st_size, entry.path))
+                except OSError as e:
+                    logger.warning("Could not remove EQ file %s: %s", entry.name, e)
+    except FileNotFoundError:
+        return
+    except OSError as e:
+        logger.warning("Error scanning EQ temp directory: %s", e)
+        return
+
+    total = sum(size for _, size, _ in entries_by_age)
+    for _, size, path in sorted(entries_by_age):
+        if total <= max_cache_bytes:
+            break
+        if path in protected:
+            continue
+        try:
+            os.remove(path)
+            total -= size
+        except OSError as e:
+            logger.warning("Could not evict EQ cache file %s: %s", os.path.basename(path), e)
+
+def _parse_seconds_ms(text):
+    """
+    Parse a seconds value typed by the user into whole milliseconds, exactly
+    (decimal arithmetic, so "0.1" is 100 ms rather than a binary approximation).
+
+    Args:
+        text (str): Seconds, e.g. "12.5".
+
+    Returns:
+        int or None: Milliseconds, rounded to the nearest millisecond, or None if the
+        text is not a plain non-negative number.
+    """
+    # Validate up front so invalid keystrokes are rejected without raising
+    text = text.strip()
+    if not _SECONDS_RE.fullmatch(text):
+        return None
+    return int((decimal.Decimal(text) * 1000).to_integral_value(rounding=decimal.ROUND_HALF_UP))
+
+def _format_ms_seconds(ms):
+    """
+    Format milliseconds as seconds with one decimal using integer arithmetic.
+
+    Args:
+        ms (int): Non-negative milliseconds.
+
+    Returns:
+        str: Seconds, e.g. "12.5".
+    """
+    tenths = (ms + 50) // 100
+    return f"{tenths // 10}.{tenths % 10}"
+
+# Paths queued for removal on the thread pool. Only the GUI thread adds to it, so a path
+# is never submitted twice; workers discard their path when done
+_pending_removals = set()
+
+def _remove_temp_file(path, deck_number):
+    """
+    Remove a deck's temp file that is no longer played. Runs on the global thread pool so
+    a slow filesystem doesn't stall the GUI thread on the reload path.
+
+    Args:
+        path (str): File to remove.
+        deck_number (int): Deck the file belonged to, for logging.
+    """
+    try:
+        os.remove(path)
+        logger.debug("Deck %d: Cleaned up old temp file: %s", deck_number, path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning("Deck %d: Could not remove old temp file %s: %s", deck_number, os.path.basename(path), e)
+    finally:
+        _pending_removals.discard(path)
+
+def _cleanup_old_tempo_files(temp_dir, deck_number, keep_names):
+    """
+    Remove stale tempo-processed WAV files written by set_deck_tempo for a deck. Runs on
+    the global thread pool so the directory scan and deletes don't stall the GUI thread.
+    Key-shift and cached tempo-reset files in the same directory are left alone.
+
+    Args:
+        temp_dir (str): Directory holding the tempo-processed files.
+        deck_number (int): Deck whose files should be removed.
+        keep_names (frozenset): File names still in use, e.g. the tempo file being produced
+            and the one playing.
+    """
+    prefix = f"deck{deck_number}_"
+    try:
+        with os.scandir(temp_dir) as entries:
+            for entry in entries:
+                f_name = entry.name
+                if not f_name.startswith(prefix) or not f_name.endswith(_TEMPO_FILE_SUFFIX) or f_name in keep_names:
+                    continue
+                try:
+                    if entry.is_file():
+                        os.remove(entry.path)
+                        logger.debug("Deck %d: Cleaned old tempo file: %s", deck_number, f_name)
+                except OSError as e_del:
+                    logger.warning("Deck %d: Could not clean old tempo file %s: %s", deck_number, f_name, e_del)
+    except OSError as e:
+        logger.warning("Deck %d: Could not scan tempo dir for cleanup: %s", deck_number, e)
+
 class GlassWidget(QWidget):
     """
     A custom widget that implements a glass-like effect with hover state handling.
@@ -178,17 +462,40 @@ class GlassWidget(QWidget):
 
 class TempoChangeWorker(QThread):
     """
-    QThread worker for performing tempo changes on audio files in the background.
+    QThread worker for performing tempo changes on audio files in the background, using
+    Rubber Band when pyrubberband is installed and SoundStretch otherwise. A deck keeps
+    one long-lived instance: each job is set up with configure() and started with
+    submit(), so the signal connections are made only once.
     """
     finished = pyqtSignal(int, str, bool, int, object, bool) 
     error = pyqtSignal(int, str)
 
-    def __init__(self, deck_num, analyzer, original_file_path_for_worker, temp_output_path, factor, original_length_sec, target_bpm, target_pos_on_load, was_playing_state):
+    def __init__(self, deck_num, analyzer=None, parent=None):
         """
         Initialize the TempoChangeWorker.
 
         Args:
             deck_num (int): Deck number.
+            analyzer (AudioAnalyzerBridge, optional): Audio analyzer bridge instance.
+            parent (QObject, optional): Parent object.
+        """
+        super().__init__(parent)
+        self.deck_number = deck_num
+        self.audio_analyzer = analyzer
+        self.original_file_path = None
+        self.temp_output_file = None
+        self.stretch_factor = 1.0
+        self.length_seconds_of_original = 0.0
+        self.target_bpm = 0
+        self.target_position_after_load = None
+        self.was_playing_flag = False
+        self._tempo_shifter = None  # Created on first use when Rubber Band is available
+
+    def configure(self, analyzer, original_file_path_for_worker, temp_output_path, factor, original_length_sec, target_bpm, target_pos_on_load, was_playing_state):
+        """
+        Set up the next tempo change job.
+
+        Args:
             analyzer (AudioAnalyzerBridge): Audio analyzer bridge instance.
             original_file_path_for_worker (str): Path to the original audio file.
             temp_output_path (str): Path for the output file.
@@ -198,8 +505,6 @@ class TempoChangeWorker(QThread):
             target_pos_on_load (object): Target position after loading.
             was_playing_state (bool): Whether playback was active before processing.
         """
-        super().__init__()
-        self.deck_number = deck_num
         self.audio_analyzer = analyzer
         self.original_file_path = original_file_path_for_worker
         self.temp_output_file = temp_output_path
@@ -209,51 +514,438 @@ class TempoChangeWorker(QThread):
         self.target_position_after_load = target_pos_on_load
         self.was_playing_flag = was_playing_state
 
+    def submit(self):
+        """
+        Run the configured job on this worker's thread.
+
+        Returns:
+            bool: False if a previous job is still running, True otherwise.
+        """
+        if self.isRunning():
+            return False
+        self.start()
+        return True
+
     def run(self):
         """
         Execute the tempo change operation. Emits signals on completion or error.
         """
         success = False
         try:
-            print(f"Worker (Deck {self.deck_number}): Starting tempo change. Original='{safe_filename_for_logging(self.original_file_path)}', Factor={self.stretch_factor:.3f}, OrigLenSec={self.length_seconds_of_original:.2f}")
+            logger.debug("Worker (Deck %d): Starting tempo change. Original='%s', Factor=%.3f, OrigLenSec=%.2f", self.deck_number, safe_filename_for_logging(self.original_file_path), self.stretch_factor, self.length_seconds_of_original)
             if not self.original_file_path or not os.path.exists(self.original_file_path):
                 raise FileNotFoundError(f"Worker (Deck {self.deck_number}): Original file for tempo change not found: {self.original_file_path}")
 
-            # Call the AudioAnalyzer's method to change tempo
-            success = self.audio_analyzer.change_tempo(
-                self.original_file_path, 
-                self.temp_output_file, 
-                self.stretch_factor, 
-                self.length_seconds_of_original
-            )
+            # Prefer Rubber Band when installed; SoundStretch via the AudioAnalyzer is the fallback
+            if PYRUBBERBAND_AVAILABLE:
+                if self._tempo_shifter is None:
+                    self._tempo_shifter = TempoShifter(native_bridge=self.audio_analyzer)
+                success = self._tempo_shifter.change_tempo(
+                    self.original_file_path,
+                    self.temp_output_file,
+                    self.stretch_factor,
+                    engine="rubberband"
+                )
+                if not success:
+                    logger.warning("Worker (Deck %d): Rubber Band tempo change failed, falling back to SoundStretch.", self.deck_number)
+            if not success:
+                success = self.audio_analyzer.change_tempo(
+                    self.original_file_path, 
+                    self.temp_output_file, 
+                    self.stretch_factor, 
+                    self.length_seconds_of_original
+                )
             
             if success:
                  if not os.path.exists(self.temp_output_file) or os.path.getsize(self.temp_output_file) == 0:
-                     print(f"Worker (Deck {self.deck_number}): Output file '{safe_filename_for_logging(self.temp_output_file)}' invalid after change_tempo reported success!"); success = False
+                     logger.warning("Worker (Deck %d): Output file '%s' invalid after change_tempo reported success!", self.deck_number, safe_filename_for_logging(self.temp_output_file)); success = False
                      try: os.remove(self.temp_output_file) 
                      except OSError: pass 
             else:
-                print(f"Worker (Deck {self.deck_number}): audio_analyzer.change_tempo reported failure.")
+                logger.warning("Worker (Deck %d): audio_analyzer.change_tempo reported failure.", self.deck_number)
 
             self.finished.emit(self.deck_number, self.temp_output_file, success, self.target_bpm, self.target_position_after_load, self.was_playing_flag)
         except FileNotFoundError as fnf_e:
             error_msg = f"Worker (Deck {self.deck_number}) FileNotFoundError: {fnf_e}"
-            print(error_msg); traceback.print_exc()
+            logger.error("%s", error_msg, exc_info=logger.isEnabledFor(logging.DEBUG))
             self.error.emit(self.deck_number, error_msg)
         except Exception as e:
              error_msg = f"Worker (Deck {self.deck_number}) Exception in TempoChangeWorker: {type(e).__name__}: {e} (File: {safe_filename_for_logging(self.original_file_path)})"
-             print(error_msg); traceback.print_exc()
+             logger.error("%s", error_msg, exc_info=logger.isEnabledFor(logging.DEBUG))
              # Attempt to clean up failed output file
              if os.path.exists(self.temp_output_file):
                  try: os.remove(self.temp_output_file)
                  except OSError: pass
              self.error.emit(self.deck_number, error_msg)
 
+class TrackAnalysisSignals(QObject):
+    """
+    Defines signals available from a track analysis worker.
+    Signals:
+        finished (int, object): Load sequence number and the analysis result dict.
+        error (int, str): Load sequence number and error message.
+    """
+    finished = pyqtSignal(int, object)
+    error = pyqtSignal(int, str)
+
+class TrackAnalysisWorker(QRunnable):
+    """
+    Worker for running BPM, beat, key and playback-audio analysis of a newly loaded track
+    off the GUI thread.
+
+    Args:
+        signals (QObject): Signal object for thread communication.
+        load_seq (int): Sequence number of the load request this analysis belongs to.
+        analyzer (AudioAnalyzerBridge): Audio analyzer bridge instance.
+        file_path (str): Path to the audio file.
+        temp_output_path (str): Path of the deck's persistent playback WAV file.
+        buffer_lock (QMutex): Lock serializing writes to the playback WAV file.
+        is_current (callable): Returns False once a newer load has superseded this one.
+        buffer_state (dict): Holds under 'hash' the digest of the audio in the playback
+            WAV on disk. Shared by the deck's workers and guarded by buffer_lock.
+        cached_bpm (int, optional): BPM from the cache, if any.
+        cached_beats (list, optional): Beat positions from the cache, if any.
+    """
+    def __init__(self, signals, load_seq, analyzer, file_path, temp_output_path, buffer_lock, is_current,
+                 buffer_state, cached_bpm=None, cached_beats=None):
+        super().__init__()
+        self.signals = signals
+        self._load_seq = load_seq
+        self._audio_analyzer = analyzer
+        self._file_path = file_path
+        self._temp_output_path = temp_output_path
+        self._buffer_lock = buffer_lock
+        self._is_current = is_current
+        self._buffer_state = buffer_state
+        self._cached_bpm = cached_bpm
+        self._cached_beats = cached_beats
+
+    def run(self):
+        """
+        Analyze the track, write the decoded audio to the playback WAV file and emit a
+        result dict with the keys 'file_path', 'file_info', 'bpm', 'beat_positions', 'key',
+        'key_confidence', 'audio_data', 'sample_rate', 'temp_file' and 'buffer_hash'.
+        """
+        file_name = self._file_path
+        result = {'file_path': file_name, 'file_info': None, 'bpm': 0, 'beat_positions': [], 'key': "",
+                  'key_confidence': 0.0, 'audio_data': None, 'sample_rate': None, 'temp_file': None,
+                  'buffer_hash': None}
+        try:
+            # Header info of the original file, reused by every tempo change of this track
+            try:
+                result['file_info'] = sf.info(file_name)
+            except Exception as info_error:
+                logger.debug("Could not read file info for %s: %s", safe_filename_for_logging(file_name), info_error)
+
+            bpm = 0
+            beat_positions = []
+            try:
+                if self._cached_bpm is not None and self._cached_bpm > 0:
+                    bpm = self._cached_bpm
+                if self._cached_beats is not None and len(self._cached_beats) > 0:
+                    beat_positions = self._cached_beats
+
+                # If we don't have cached data, analyze the file
+                if bpm == 0 or not beat_positions:
+                    logger.debug("Analyzing BPM for: %s", file_name)
+                    try:
+                        # Get BPM from regular analysis (30 seconds)
+                        bpm, _ = self._audio_analyzer.analyze_file(file_name)
+                    except Exception as bpm_error:
+                        logger.warning("BPM analysis failed: %s", bpm_error); bpm = 0
+                    try:
+                        # Always get full track beat positions (entire song)
+                        full_beats = self._audio_analyzer.get_full_track_beat_positions_ms(file_name)
+                        if full_beats:
+                            beat_positions = full_beats
+                        logger.debug("Detected BPM: %s, %s beats (full track)", bpm, len(beat_positions))
+                    except Exception as beat_error:
+                        logger.warning("Full track beat analysis failed: %s", beat_error)
+                else:
+                    logger.debug("Using cached data - BPM: %s, %s beats", bpm, len(beat_positions))
+                    # Upgrade cached beats to full-track if available
+                    try:
+                        full_beats = self._audio_analyzer.get_full_track_beat_positions_ms(file_name)
+                        if full_beats and len(full_beats) > len(beat_positions):
+                            beat_positions = full_beats
+                            logger.debug("Upgraded to full-track beats: %s beats", len(beat_positions))
+                    except Exception as beat_error:
+                        logger.warning("Full track beat analysis failed: %s", beat_error)
+            except Exception as bpm_error:
+                logger.warning("BPM analysis failed: %s", bpm_error); bpm = 0; beat_positions = []
+            result['bpm'] = bpm
+            result['beat_positions'] = beat_positions
+
+            # Detect musical key for harmonic mixing
+            try:
+                logger.debug("Detecting musical key for: %s", file_name)
+                key, confidence = self._audio_analyzer.detect_key(file_name)
+                if key:
+                    result['key'] = key
+                    result['key_confidence'] = confidence
+            except Exception as key_error:
+                logger.warning("Key detection error: %s", key_error)
+
+            logger.debug("Loading high-quality audio for playback")
+            try:
+                audio_data, sample_rate = self._audio_analyzer.load_audio_for_playback(file_name)
+                result['audio_data'] = audio_data
+                result['sample_rate'] = sample_rate
+            except Exception as audio_error:
+                logger.warning("Error loading audio data: %s", audio_error)
+
+            if result['audio_data'] is not None and result['sample_rate'] and result['sample_rate'] > 0:
+                buffer_hash = audio_buffer_digest(file_name, result['audio_data'], result['sample_rate'])
+                with QMutexLocker(self._buffer_lock):
+                    # A newer load owns the playback file now - leave it alone
+                    if self._is_current():
+                        if buffer_hash == self._buffer_state['hash'] and os.path.exists(self._temp_output_path):
+                            logger.debug("Reusing playback WAV file: %s", self._temp_output_path)
+                        else:
+                            logger.debug("Writing playback WAV file: %s", self._temp_output_path)
+                            # Unknown contents until the write completes
+                            self._buffer_state['hash'] = None
+                            # 16-bit PCM is plenty for playback and halves the bytes written vs float
+                            sf.write(self._temp_output_path, result['audio_data'], result['sample_rate'], subtype='PCM_16')
+                            if not os.path.exists(self._temp_output_path):
+                                raise RuntimeError(f"Failed to create temporary file: {self._temp_output_path}")
+                            self._buffer_state['hash'] = buffer_hash
+                        result['temp_file'] = self._temp_output_path
+                        result['buffer_hash'] = buffer_hash
+
+            try:
+                self.signals.finished.emit(self._load_seq, result)
+            except RuntimeError:
+                # Signals object was deleted during app shutdown - ignore silently
+                pass
+        except Exception as e:
+            logger.warning("Error analyzing track: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            try:
+                self.signals.error.emit(self._load_seq, str(e))
+            except RuntimeError:
+                pass
+
+class TempoAudioLoadSignals(QObject):
+    """
+    Defines signals available from a tempo audio load worker.
+    Signals:
+        finished (int, object, int): Load sequence number, decoded audio and sample rate.
+        error (int, str): Load sequence number and error message.
+    """
+    finished = pyqtSignal(int, object, int)
+    error = pyqtSignal(int, str)
+
+class TempoAudioLoadWorker(QRunnable):
+    """
+    Worker for decoding a tempo-processed WAV file off the GUI thread.
+
+    Args:
+        signals (QObject): Signal object for thread communication.
+        load_seq (int): Sequence number of the tempo change this load belongs to.
+        file_path (str): Path to the tempo-processed file.
+    """
+    def __init__(self, signals, load_seq, file_path):
+        super().__init__()
+        self.signals = signals
+        self._load_seq = load_seq
+        self._file_path = file_path
+
+    def run(self):
+        """
+        Stream the file in blocks into a mono float32 buffer and emit it with the sample rate.
+        Multi-channel audio is downmixed block by block, so the full interleaved float32 file
+        is never held in memory.
+        """
+        try:
+            with sf.SoundFile(self._file_path) as f:
+                sr = f.samplerate
+                if f.channels == 1:
+                    audio_data = f.read(dtype='float32')
+                else:
+                    audio_data = np.empty(f.frames, dtype=np.float32)
+                    pos = 0
+                    for block in f.blocks(blocksize=_TEMPO_READ_BLOCK_FRAMES, dtype='float32', always_2d=True):
+                        n = len(block)
+                        np.mean(block, axis=1, out=audio_data[pos:pos + n])
+                        pos += n
+                    audio_data = audio_data[:pos]
+            self.signals.finished.emit(self._load_seq, audio_data, sr)
+        except Exception as e:
+            self.signals.error.emit(self._load_seq, str(e))
+
+class KeyShiftSignals(QObject):
+    """
+    Defines signals available from a key shift worker.
+    Signals:
+        finished (int, str, bool): Shift sequence number, output file path and success flag.
+    """
+    finished = pyqtSignal(int, str, bool)
+
+class KeyShiftWorker(QRunnable):
+    """
+    Worker for pitch shifting a deck's playback file without changing its tempo.
+
+    Args:
+        signals (QObject): Signal object for thread communication.
+        shift_seq (int): Sequence number of the transposition this shift belongs to.
+        shifter (TempoShifter): Tempo/pitch shifter instance.
+        input_path (str): Path of the unshifted playback file.
+        output_path (str): Path for the shifted file.
+        semitones (int): Number of semitones to shift.
+    """
+    def __init__(self, signals, shift_seq, shifter, input_path, output_path, semitones):
+        super().__init__()
+        self.signals = signals
+        self._shift_seq = shift_seq
+        self._shifter = shifter
+        self._input_path = input_path
+        self._output_path = output_path
+        self._semitones = semitones
+
+    def run(self):
+        """
+        Run the pitch shift and emit the output path and whether it succeeded.
+        """
+        success = False
+        try:
+            success = self._shifter.pitch_shift(self._input_path, self._output_path, self._semitones)
+            success = success and os.path.exists(self._output_path) and os.path.getsize(self._output_path) > 0
+        except Exception as e:
+            logger.warning("Key shift failed for %s: %s", safe_filename_for_logging(self._input_path), e)
+        self.signals.finished.emit(self._shift_seq, self._output_path, success)
+
+class TempoRenderSignals(QObject):
+    """
+    Defines signals available from a tempo render worker.
+    Signals:
+        finished (int, str, bool): Job id, output file path and success flag.
+    """
+    finished = pyqtSignal(int, str, bool)
+
+class TempoRenderWorker(QRunnable):
+    """
+    Worker for time-stretching a deck's original file to its current tempo when the
+    EQ is reset and no render at that tempo is cached.
+
+    Args:
+        signals (QObject): Signal object for thread communication.
+        job_id (int): Id of the EQ reset this render belongs to.
+        audio_analyzer (AudioAnalyzerBridge): Analyzer that performs the time-stretch.
+        input_path (str): Path of the original file.
+        output_path (str): Path for the tempo-processed file.
+        stretch_factor (float): Ratio of original to target BPM.
+        length_seconds (float): Duration of the original file in seconds.
+    """
+    def __init__(self, signals, job_id, audio_analyzer, input_path, output_path, stretch_factor, length_seconds):
+        super().__init__()
+        self.signals = signals
+        self._job_id = job_id
+        self._audio_analyzer = audio_analyzer
+        self._input_path = input_path
+        self._output_path = output_path
+        self._stretch_factor = stretch_factor
+        self._length_seconds = length_seconds
+
+    def run(self):
+        """
+        Run the time-stretch and emit the output path and whether it succeeded.
+        """
+        success = False
+        try:
+            success = self._audio_analyzer.change_tempo(self._input_path, self._output_path,
+                                                        self._stretch_factor, self._length_seconds)
+            success = success and os.path.exists(self._output_path) and os.path.getsize(self._output_path) > 0
+            if not success:
+                logger.warning("Tempo processing failed or produced empty file for %s", safe_filename_for_logging(self._input_path))
+        except Exception as e:
+            logger.warning("Error during tempo processing for %s: %s", safe_filename_for_logging(self._input_path), e)
+        if not success:
+            with contextlib.suppress(OSError):
+                os.remove(self._output_path)
+        self.signals.finished.emit(self._job_id, self._output_path, success)
+
+class EqRenderSignals(QObject):
+    """
+    Defines signals available from an EQ render worker.
+    Signals:
+        finished (int, object, int, str): Job id, mono processed audio for display, sample rate and output file path.
+        error (int, str): Job id and error message.
+        decoded (int, object, int): Job id, source audio the worker had to decode itself and its sample rate.
+    """
+    finished = pyqtSignal(int, object, int, str)
+    decoded = pyqtSignal(int, object, int)
+    error = pyqtSignal(int, str)
+
+class EqRenderWorker(QRunnable):
+    """
+    Worker for rendering a deck's audio through the equalizer into a playable WAV file.
+
+    Args:
+        signals (QObject): Signal object for thread communication.
+        job_id (int): Id of the EQ apply this render belongs to.
+        equalizer (Equalizer): Equalizer instance.
+        audio_data (np.ndarray or None): Decoded audio to process, or None to read base_file.
+        sample_rate (int): Sample rate of audio_data.
+        base_file (str): File to decode when audio_data is None.
+        gains (tuple): Bass, mid and treble gains.
+        output_path (str): EQ cache path for the processed file.
+    """
+    def __init__(self, signals, job_id, equalizer, audio_data, sample_rate, base_file, gains, output_path):
+        super().__init__()
+        self.signals = signals
+        self._job_id = job_id
+        self._equalizer = equalizer
+        self._audio_data = audio_data
+        self._sample_rate = sample_rate
+        self._base_file = base_file
+        self._gains = gains
+        self._output_path = output_path
+
+    def run(self):
+        """
+        Process the audio, write the result and emit a mono copy of it and the file path.
+        """
+        try:
+            audio_data, sample_rate = self._audio_data, self._sample_rate
+            if audio_data is None:
+                audio_data, sample_rate = sf.read(self._base_file, dtype='float32')
+                # Hand the decoded source back so later applies skip the decode
+                self.signals.decoded.emit(self._job_id, audio_data, sample_rate)
+
+            processed_audio = audio_data
+            if self._equalizer:
+                processed_audio = self._equalizer.process(audio_data, sample_rate, *self._gains)
+            if processed_audio is None or processed_audio.size == 0:
+                logger.warning("EQ processing failed, using unprocessed audio")
+                processed_audio = audio_data
+
+            # Write to a partial file of this job's own and rename it into place, so a cached
+            # file is never seen half-written and concurrent renders of a key don't collide
+            fd, partial_path = tempfile.mkstemp(dir=_EQ_TEMP_DIR, prefix=_EQ_CACHE_PREFIX, suffix=".part")
+            os.close(fd)
+            try:
+                sf.write(partial_path, processed_audio, sample_rate, format='WAV')
+                os.replace(partial_path, self._output_path)
+            except Exception:
+                with contextlib.suppress(OSError):
+                    os.remove(partial_path)
+                raise
+            purge_eq_temp_files(remove_partial=False, keep=(self._output_path,))
+            # The result is only shown in the spectrogram, which works on mono - downmix here
+            # so the GUI thread neither averages the channels nor keeps the stereo copy alive
+            if processed_audio.ndim > 1:
+                processed_audio = processed_audio.mean(axis=1, dtype=np.float32)
+            self.signals.finished.emit(self._job_id, processed_audio, sample_rate, self._output_path)
+        except Exception as e:
+            self.signals.error.emit(self._job_id, str(e))
+
 class DeckWidget(GlassWidget):
     """
     Main deck widget for audio playback, visualization, tempo/EQ control, and user interaction.
     """
     volumeChanged = pyqtSignal()
+    playingChanged = pyqtSignal(bool)
+    positionChanged = pyqtSignal(int)
     tempoProcessing = pyqtSignal(bool)
 
     def __init__(self, deck_number, main_app, audio_analyzer, parent=None):
@@ -269,38 +961,135 @@ class DeckWidget(GlassWidget):
         super().__init__(parent)
         self.deck_number = deck_number
         self.main_app = main_app
+        # Bound once so tempo changes on the sync master don't probe main_app on every step
+        self._sync_slave_cb = getattr(main_app, 'sync_slave_deck_tempo', None)
+        self._url_cache = OrderedDict()  # path -> QUrl, most recently used last
+        self._tempo_cache = OrderedDict()  # (original path, stretch factor) -> tempo file, most recently used last
+        self._notify_cb = getattr(main_app, 'notify', None)
         self.audio_analyzer = audio_analyzer
         self.current_file = None
         self.original_file_path = None  # Always keep reference to the original file
+        self._original_info = None  # sf.info of original_file_path, read once per load
         self.temp_file = None
+        # Persistent per-deck playback WAV, rewritten in place on each load
+        self._buffer_file = os.path.join(_AUDIO_TEMP_DIR, f"deck{deck_number}_buffer.wav")
+        self._buffer_lock = QMutex()
+        # Digest of the audio in the playback WAV on disk; only read or written under _buffer_lock
+        self._buffer_state = {'hash': None}
         self._is_playing = False
         self.original_bpm = 0
         self.current_bpm = 0
         self.beat_positions = []
         self._current_volume = 1.0
+        self._last_vol_bucket = 3  # Volume display level currently applied (starts at 100%)
         self._seek_after_load_fraction = None
         self._resume_after_load = False
         self.sync_button = None
-        self.tempo_worker = None
+        # Created later in __init__/setup_ui; bound up front so callers can test for None
+        self.audio_output = None
+        self.equalizer = None
+        self.spectrogram = None
+        self.play_btn = None
+        self.eq_status_label = None
+        self._sync_active = False  # True while the sync button shows SYNCED/MASTER
+        self.tempo_worker = TempoChangeWorker(deck_number, audio_analyzer, self)
+        self.tempo_worker.finished.connect(self._handle_tempo_change_finished)
+        self.tempo_worker.error.connect(self._handle_tempo_change_error)
+        # (target_position, should_resume) waiting for a processed file to finish loading
+        self._pending_seek_resume = None
+        # Set by _set_source_if_changed until the player reports a status for the new source,
+        # since mediaStatus() can still describe the previous one right after setSource
+        self._source_load_pending = False
+        self._seek_resume_timeout = QTimer(self)
+        self._seek_resume_timeout.setSingleShot(True)
+        self._seek_resume_timeout.setInterval(5000)
+        self._seek_resume_timeout.timeout.connect(self._on_seek_resume_timeout)
+        # Turntable seek target to resume playback at once the backend reports it
+        self._scrub_resume_target = None
+        self._scrub_resume_fallback = QTimer(self)
+        self._scrub_resume_fallback.setSingleShot(True)
+        self._scrub_resume_fallback.setInterval(40)
+        self._scrub_resume_fallback.timeout.connect(self._resume_after_scrub)
         
         # Key detection and transposition
         self.detected_key = ""
         self.key_confidence = 0.0
         self.key_transpose = 0  # Semitones to transpose
+        self._last_key_render = None  # (key, transpose, confidence) last shown in the key label
+        self._last_key_style = None
+        self.tempo_shifter = TempoShifter(native_bridge=audio_analyzer)
+        self._key_base_file = None  # Unshifted file that was playing when transposition started
+        self._key_shift_file = None  # Pitch-shifted file currently set as the player source
+        self._key_shift_seq = 0  # Bumped per shift so stale results are discarded
+        self._key_shift_signals = KeyShiftSignals()
+        self._key_shift_signals.finished.connect(self._on_key_shift_done)
+        self._current_eq_job_id = 0  # Bumped per EQ apply so stale renders are discarded
+        self._eq_reapply_pending = None  # (position, resume) awaiting the tempo file's EQ buffer
+        self._eq_job_restore = (None, None)  # Position/resume override for the current EQ render
+        self._eq_render_signals = EqRenderSignals()
+        self._eq_render_signals.finished.connect(self._on_eq_render_done)
+        self._eq_render_signals.error.connect(self._on_eq_render_error)
+        self._eq_render_signals.decoded.connect(self._on_eq_source_decoded)
+        self._eq_job_tempo_seq = 0  # Tempo load sequence the current EQ job decodes against
+        self._tempo_render_signals = TempoRenderSignals()
+        self._tempo_render_signals.finished.connect(self._on_tempo_render_done)
+        self._tempo_render_keys = {}  # Job id -> tempo cache key of EQ reset renders in flight
+        # Coalesce rapid key button presses into one pitch-shift pass
+        self._key_shift_debounce = QTimer(self)
+        self._key_shift_debounce.setSingleShot(True)
+        self._key_shift_debounce.setInterval(250)
+        self._key_shift_debounce.timeout.connect(self._apply_key_shift)
         
         # Add loop state variables
         self._loop_enabled = False
         self._loop_start_time = 0  # in milliseconds
         self._loop_length = 4000   # default 4 seconds in milliseconds
-        self._loop_end_time = 0    # calculated from start + length
+        # Coalesce loop button restyles from rapid toggling into one polish per frame
+        self._style_refresh_timer = QTimer(self)
+        self._style_refresh_timer.setSingleShot(True)
+        self._style_refresh_timer.setInterval(16)
+        self._style_refresh_timer.timeout.connect(self._flush_loop_style)
+        self._loop_end_time = 0    # start + length, recomputed only by the loop input handlers so the tick is one int compare
         
         # Optimized update intervals for better performance
-        self._last_position_update = 0
-        self._position_update_interval = 33  # 30 FPS for smoother performance
-        self._last_ui_update = 0
-        self._ui_update_interval = 100  # UI updates at 10 Hz (sufficient for labels)
+        # Throttle state in integer nanoseconds from time.monotonic_ns()
+        self._last_position_update_ns = 0
+        self._position_update_interval_ns = 33_000_000  # 30 FPS for smoother performance
+        self._last_progress = -1  # Progress slider only changes when its 0-1000 value does
+        self._last_displayed_sec = -1  # Time labels only change once per second
+        self._last_displayed_total_sec = -1
+        self._cached_duration_ms = 0  # Kept in sync by update_duration (durationChanged)
+        self._inv_duration_x1000 = 0.0  # 1000 / duration, maps position to the 0-1000 progress range
+        self._last_wave_px = -1  # Last display pixel pushed to the waveform/spectrogram
+        self._position_quantum_ms = 0.0  # Milliseconds per display pixel, 0 = recompute
         self._last_eq_output_file = None
         self._load_retries = 0
+        self._analysis_seq = 0  # Bumped per load so stale analysis results are ignored
+        self._awaiting_source_clear = False  # load_file waits for NoMedia before continuing
+        self._pending_load_path = None
+        self._awaiting_media_load = False  # _on_media_status finishes the load when set
+        self._tempo_load_seq = 0  # Bumped per tempo change so stale decoded audio is ignored
+        self._tempo_scaled_beats = []
+        self._tempo_load_signals = TempoAudioLoadSignals()
+        self._tempo_load_signals.finished.connect(self._on_tempo_audio_loaded)
+        self._tempo_load_signals.error.connect(self._on_tempo_audio_load_error)
+        
+        # Precomputed beat indicator styles - only re-applied when the LED state changes
+        self._beat_css = {
+            'off': "color: #333333; font-size: 16px; font-weight: bold; "
+                   "background: rgba(50, 50, 50, 0.5); border-radius: 10px;",
+            'synced_bright': "color: #00d4ff; font-size: 16px; font-weight: bold; "
+                             "background: rgba(0, 212, 255, 0.3); border-radius: 10px; "
+                             "box-shadow: 0 0 10px rgba(0, 212, 255, 0.8);",
+            'synced_dim': "color: #004466; font-size: 16px; font-weight: bold; "
+                          "background: rgba(0, 68, 102, 0.5); border-radius: 10px;",
+            'playing_bright': "color: #00ff00; font-size: 16px; font-weight: bold; "
+                              "background: rgba(0, 255, 0, 0.3); border-radius: 10px; "
+                              "box-shadow: 0 0 10px rgba(0, 255, 0, 0.6);",
+            'playing_dim': "color: #444444; font-size: 16px; font-weight: bold; "
+                           "background: rgba(68, 68, 68, 0.5); border-radius: 10px;",
+        }
+        self._beat_state = None
         
         # Optimized position timer for better performance (30 FPS)
         self.position_timer = QTimer()
@@ -319,38 +1108,90 @@ class DeckWidget(GlassWidget):
         if available_devices:
             # Create a unique audio output instance for each deck
             if default_device and not default_device.isNull():
-                print(f"Deck {self.deck_number}: Creating unique audio output instance using default device: {default_device.description()}")
+                logger.debug("Deck %d: Creating unique audio output instance using default device: %s", self.deck_number, default_device.description())
                 self.audio_output = QAudioOutput(default_device)
             else:
                 # Fallback to first available device if no default
-                print(f"Deck {self.deck_number}: Using first available Audio Output Device: {available_devices[0].description()}")
+                logger.debug("Deck %d: Using first available Audio Output Device: %s", self.deck_number, available_devices[0].description())
                 self.audio_output = QAudioOutput(available_devices[0])
         else:
-            print(f"Deck {self.deck_number}: WARNING - No audio output device found! Using default constructor.")
+            logger.warning("Deck %d: WARNING - No audio output device found! Using default constructor.", self.deck_number)
             self.audio_output = QAudioOutput()
             
         # Connect the audio output to the player
         self.player.setAudioOutput(self.audio_output)
         self.audio_output.setVolume(1.0) 
-        print(f"Deck {self.deck_number}: Setting initial volume to 1.0")
+        logger.debug("Deck %d: Setting initial volume to 1.0", self.deck_number)
         self.audio_output.setMuted(False)
     
-        self.player.durationChanged.connect(self.update_duration)
-        self.player.errorOccurred.connect(self.handle_player_error)
-        self.player.playbackStateChanged.connect(self._update_turntable_state)
-        
-        self.turntable = Turntable()
-        self.turntable.positionScrubbed.connect(self.adjust_position_from_turntable)
-        self.turntable.pitchChanged.connect(self.adjust_playback_rate)
-        self.turntable.scratchSpeed.connect(self.handle_vinyl_scratch)
-        self.turntable.vinylStopStart.connect(self.handle_vinyl_stop_start)
+        for signal, slot in self._player_connections(self.player):
+            signal.connect(slot)
+        
+        # Second player that loads finished EQ renders while playback continues on the
+        # current one; the two are swapped once the render is ready, so switching EQ
+        # never waits on a decoder pipeline being rebuilt
+        self._shadow_player = QMediaPlayer(self)
+        self._shadow_player.mediaStatusChanged.connect(self._on_shadow_media_status)
+        self._shadow_swap = None  # (job id, render path, mono audio, sample rate) being loaded
+        self._shadow_load_timeout = QTimer(self)
+        self._shadow_load_timeout.setSingleShot(True)
+        self._shadow_load_timeout.setInterval(5000)
+        self._shadow_load_timeout.timeout.connect(self._on_shadow_load_timeout)
+        
+        # Turntable and beat indicator are created on first use by _lazy_init_playback_widgets
+        self.turntable = None
+        self.beat_indicator = None
         
         self.equalizer = ThreeBandEQ(audio_analyzer=self.audio_analyzer)
         self._eq_bass_gain = 1.0
         self._eq_mid_gain = 1.0
         self._eq_treble_gain = 1.0
+        self._eq_avg_gain = 1.0  # Weighted band average used for the instant volume-based EQ
+        
+        # Coalesce spectrogram spectrum/EQ-overlay updates to at most one repaint per ~30 Hz frame
+        self._pending_spec = None  # (audio or None, sample rate, gains) to push on the next refresh
+        self._spec_refresh_timer = QTimer(self)
+        self._spec_refresh_timer.setSingleShot(True)
+        self._spec_refresh_timer.setInterval(33)
+        self._spec_refresh_timer.timeout.connect(self._refresh_spectrogram)
+        
+        # Coalesce rapid EQ knob movements into at most one EQ update per interval
+        self._eq_debounce = QTimer(self)
+        self._eq_debounce.setSingleShot(True)
+        self._eq_debounce.setInterval(80)
+        self._eq_debounce.timeout.connect(self._apply_eq_now)
+        # One owned timer hides the EQ status; restarting it lets a newer status replace an older one
+        self._eq_status_timer = QTimer(self)
+        self._eq_status_timer.setSingleShot(True)
+        self._eq_status_timer.timeout.connect(self._hide_eq_status)
+        
+        # Coalesce tempo fader ticks into one tempo apply per interval
+        self._pending_tempo_slider_value = 0
+        self._tempo_slider_debounce = QTimer(self)
+        self._tempo_slider_debounce.setSingleShot(True)
+        self._tempo_slider_debounce.setInterval(40)
+        self._tempo_slider_debounce.timeout.connect(self._apply_tempo_slider)
         
         self.setup_ui()
+        
+        # Bound methods used on every position timer tick, resolved once
+        self._player_position = self.player.position
+        self._progress_slider_down = self.progress.isSliderDown
+        self._progress_set_value = self.progress.setValue
+        self._current_time_set_text = self.current_time.setText
+        # Nearest widget holding all tempo readouts - repainted once per tempo step
+        container = self.tempo_slider.parentWidget()
+        while container is not None and not (container.isAncestorOf(self.tempo_text) and
+                                             container.isAncestorOf(self.tempo_percent_label)):
+            container = container.parentWidget()
+        self._tempo_controls = container or self
+        # Widgets toggled by set_controls_enabled, including the tempo input's container
+        # and the EQ section (the knobs' grandparent)
+        eq_section = self.bass_knob.parentWidget().parentWidget() if self.bass_knob.parentWidget() else None
+        self._enableable_widgets = tuple(dict.fromkeys(w for w in (
+            self.play_btn, self.volume_slider, self.tempo_text.parentWidget(), self.progress,
+            self.sync_button, self.bass_knob, self.mid_knob, self.treble_knob,
+            self.loop_button, self.loop_start_input, self.loop_length_input, eq_section) if w is not None))
 
 
     def setup_ui(self):
@@ -450,7 +1291,7 @@ class DeckWidget(GlassWidget):
         self.volume_display.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.volume_display.setMinimumWidth(42)  # Wide enough for "100%"
         self.volume_display.setMinimumHeight(18)  # Ensure text isn't cut off
-        self.volume_display.setStyleSheet("font-size: 10px; font-weight: bold; color: #f3cf2c;")
+        self.volume_display.setProperty("volLevel", "high")
         
         volume_layout.addWidget(volume_label)
         volume_layout.addWidget(self.volume_slider)
@@ -477,6 +1318,7 @@ class DeckWidget(GlassWidget):
         self.tempo_slider.setTickInterval(4)
         self.tempo_slider.setProperty("class", "tempoSlider")
         self.tempo_slider.valueChanged.connect(self.handle_tempo_slider_change)
+        self.tempo_slider.sliderReleased.connect(self._flush_tempo_slider_now)
         
         self.tempo_percent_label = QLabel("0%")
         self.tempo_percent_label.setProperty("class", "neonText")
@@ -584,15 +1426,9 @@ class DeckWidget(GlassWidget):
         
         # tempo_panel will be added to controls_layout later (line 553)
         
-        # Beat indicator LED - Professional size and visibility
-        self.beat_indicator = QLabel("●")
-        self.beat_indicator.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.beat_indicator.setFixedSize(24, 24)  # Slightly larger for better visibility
-        self.beat_indicator.setStyleSheet(
-            "color: #333333; font-size: 18px; font-weight: bold; "
-            "background: rgba(50, 50, 50, 0.5); border-radius: 12px;"
-        )
-        self.beat_indicator.setToolTip("Beat Indicator - Flashes on beats when synced")
+        # Beat indicator LED placeholder - the real LED is created on first load
+        self._beat_indicator_placeholder = QWidget()
+        self._beat_indicator_placeholder.setFixedSize(24, 24)
         
         # Sync Button - Professional size for important feature
         self.sync_button = QPushButton("SYNC")
@@ -636,6 +1472,8 @@ class DeckWidget(GlassWidget):
         eq_layout = QHBoxLayout(eq_panel)
         eq_layout.setSpacing(10)  # Professional spacing
         eq_layout.setContentsMargins(6, 5, 6, 5)
+        # One panel-level rule instead of a stylesheet per label
+        eq_panel.setStyleSheet('QLabel[class="neonText"] { font-size: 10px; font-weight: bold; }')
         
         eq_label = QLabel("EQ:")
         eq_label.setProperty("class", "neonText")
@@ -651,12 +1489,12 @@ class DeckWidget(GlassWidget):
         self.bass_knob.setValue(100)
         self.bass_knob.setWrapping(False)
         self.bass_knob.setNotchesVisible(True)
-        self.bass_knob.valueChanged.connect(self._on_eq_changed)
+        self.bass_knob.valueChanged.connect(self._schedule_eq)
+        self.bass_knob.sliderReleased.connect(self._flush_eq_now)
         self.bass_knob.setFixedSize(60, 60)  # Professional size for precise control
         bass_label = QLabel("Bass")
         bass_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         bass_label.setProperty("class", "neonText")
-        bass_label.setStyleSheet("font-size: 10px; font-weight: bold;")
         bass_layout.addWidget(self.bass_knob, 0, Qt.AlignmentFlag.AlignCenter)
         bass_layout.addWidget(bass_label)
         eq_layout.addLayout(bass_layout)
@@ -670,12 +1508,12 @@ class DeckWidget(GlassWidget):
         self.mid_knob.setValue(100)
         self.mid_knob.setWrapping(False)
         self.mid_knob.setNotchesVisible(True)
-        self.mid_knob.valueChanged.connect(self._on_eq_changed)
+        self.mid_knob.valueChanged.connect(self._schedule_eq)
+        self.mid_knob.sliderReleased.connect(self._flush_eq_now)
         self.mid_knob.setFixedSize(60, 60)
         mid_label = QLabel("Mid")
         mid_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         mid_label.setProperty("class", "neonText")
-        mid_label.setStyleSheet("font-size: 10px; font-weight: bold;")
         mid_layout.addWidget(self.mid_knob, 0, Qt.AlignmentFlag.AlignCenter)
         mid_layout.addWidget(mid_label)
         eq_layout.addLayout(mid_layout)
@@ -689,12 +1527,12 @@ class DeckWidget(GlassWidget):
         self.treble_knob.setValue(100)
         self.treble_knob.setWrapping(False)
         self.treble_knob.setNotchesVisible(True)
-        self.treble_knob.valueChanged.connect(self._on_eq_changed)
+        self.treble_knob.valueChanged.connect(self._schedule_eq)
+        self.treble_knob.sliderReleased.connect(self._flush_eq_now)
         self.treble_knob.setFixedSize(60, 60)
         treble_label = QLabel("Treble")
         treble_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         treble_label.setProperty("class", "neonText")
-        treble_label.setStyleSheet("font-size: 10px; font-weight: bold;")
         treble_layout.addWidget(self.treble_knob, 0, Qt.AlignmentFlag.AlignCenter)
         treble_layout.addWidget(treble_label)
         eq_layout.addLayout(treble_layout)
@@ -729,6 +1567,8 @@ class DeckWidget(GlassWidget):
         loop_panel_main = QVBoxLayout(loop_panel)
         loop_panel_main.setSpacing(3)
         loop_panel_main.setContentsMargins(6, 4, 6, 4)
+        # One panel-level rule instead of a stylesheet per input
+        loop_panel.setStyleSheet("QLineEdit { font-size: 10px; padding: 2px; font-weight: bold; }")
         
         # Header label - Clear and prominent
         loop_header = QLabel("LOOP")
@@ -761,7 +1601,6 @@ class DeckWidget(GlassWidget):
         self.loop_start_input.setMinimumHeight(28)
         self.loop_start_input.setMaximumHeight(32)
         self.loop_start_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.loop_start_input.setStyleSheet("font-size: 10px; padding: 2px; font-weight: bold;")
         self.loop_start_input.setToolTip("Loop Start (seconds)")
         self.loop_start_input.returnPressed.connect(self._update_loop_start)
         loop_layout.addWidget(self.loop_start_input)
@@ -773,7 +1612,6 @@ class DeckWidget(GlassWidget):
         self.loop_length_input.setMinimumHeight(28)
         self.loop_length_input.setMaximumHeight(32)
         self.loop_length_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.loop_length_input.setStyleSheet("font-size: 10px; padding: 2px; font-weight: bold;")
         self.loop_length_input.setToolTip("Loop Length (seconds)")
         self.loop_length_input.returnPressed.connect(self._update_loop_length)
         loop_layout.addWidget(self.loop_length_input)
@@ -784,76 +1622,105 @@ class DeckWidget(GlassWidget):
         controls_layout.addWidget(tempo_panel)
         controls_layout.addWidget(loop_panel)
         
-        # Turntable - Professional size for visibility
-        self.turntable.setFixedSize(130, 130)  # Larger turntable for better visibility
+        # Turntable placeholder - same size as the turntable created on first load
+        self._turntable_placeholder = QWidget()
+        self._turntable_placeholder.setFixedSize(130, 130)
         
         # Add controls and turntable
         layout.addLayout(controls_layout)
-        layout.addWidget(self.turntable, 0, Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self._turntable_placeholder, 0, Qt.AlignmentFlag.AlignCenter)
         
         # Sync button with beat indicator - Well spaced
         sync_row = QHBoxLayout()
         sync_row.setSpacing(12)
         sync_row.setContentsMargins(0, 2, 0, 0)
-        sync_row.addWidget(self.beat_indicator)
+        sync_row.addWidget(self._beat_indicator_placeholder)
         sync_row.addWidget(self.sync_button)
         sync_row.addStretch()
         layout.addLayout(sync_row)
         
+    def _lazy_init_playback_widgets(self):
+        """
+        Create the turntable and beat indicator on first use and swap them in for their
+        placeholders, keeping them out of the startup cost of the deck.
+        """
+        if self.turntable is not None:
+            return
+        
+        # Turntable - Professional size for visibility
+        self.turntable = Turntable()
+        self.turntable.setFixedSize(130, 130)  # Larger turntable for better visibility
+        self.turntable.colors['primary'] = self._theme_accent_color
+        self.turntable.colors['glow'] = self._theme_accent_color
+        self.turntable.colors['outer_ring'] = self._theme_accent_color.darker(120)
+        self.turntable.positionScrubbed.connect(self.adjust_position_from_turntable)
+        self.turntable.pitchChanged.connect(self.adjust_playback_rate)
+        self.turntable.scratchSpeed.connect(self.handle_vinyl_scratch)
+        self.turntable.vinylStopStart.connect(self.handle_vinyl_stop_start)
+        self.turntable.set_playing(self._is_playing)
+        self.turntable.setEnabled(self.play_btn.isEnabled())
+        # Built after _enableable_widgets, so join it here to be disabled during tempo processing
+        self._enableable_widgets += (self.turntable,)
+        
+        # Beat indicator LED - Professional size and visibility
+        self.beat_indicator = QLabel("●")
+        self.beat_indicator.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.beat_indicator.setFixedSize(24, 24)  # Slightly larger for better visibility
+        self.beat_indicator.setStyleSheet(
+            "color: #333333; font-size: 18px; font-weight: bold; "
+            "background: rgba(50, 50, 50, 0.5); border-radius: 12px;"
+        )
+        self.beat_indicator.setToolTip("Beat Indicator - Flashes on beats when synced")
+        self._beat_state = None
+        
+        for placeholder, widget in ((self._turntable_placeholder, self.turntable),
+                                    (self._beat_indicator_placeholder, self.beat_indicator)):
+            self.layout().replaceWidget(placeholder, widget)
+            placeholder.deleteLater()
+        self._turntable_placeholder = None
+        self._beat_indicator_placeholder = None
+        
     def update_beat_indicator(self):
         """
         Update the beat indicator LED - flashes on beats when synced or playing.
         """
         if not self.beat_positions or not self.is_playing:
             # Off when not playing
-            self.beat_indicator.setStyleSheet(
-                "color: #333333; font-size: 16px; font-weight: bold; "
-                "background: rgba(50, 50, 50, 0.5); border-radius: 10px;"
-            )
+            self._set_beat_state('off')
             return
         
         try:
             current_pos = self.player.position()
-            closest_beat_time, _ = self.find_closest_beat(current_pos)
+            beats = self._beat_positions_np
+            # Distance to the nearest beat on either side, so the flash is centred on the beat
+            i = int(np.searchsorted(beats, current_pos, side='right')) - 1
+            if i < 0:
+                distance_to_beat = beats[0] - current_pos
+            elif i + 1 < len(beats):
+                distance_to_beat = min(current_pos - beats[i], beats[i + 1] - current_pos)
+            else:
+                distance_to_beat = current_pos - beats[i]
             
-            if closest_beat_time is not None:
-                # Calculate distance to closest beat
-                distance_to_beat = abs(current_pos - closest_beat_time)
-                
-                # Flash if within 100ms of a beat
-                if distance_to_beat < 100:
-                    # Bright flash on beat
-                    if self.sync_button.text() == "SYNCED" or self.sync_button.text() == "MASTER":
-                        # Blue when synced
-                        self.beat_indicator.setStyleSheet(
-                            "color: #00d4ff; font-size: 16px; font-weight: bold; "
-                            "background: rgba(0, 212, 255, 0.3); border-radius: 10px; "
-                            "box-shadow: 0 0 10px rgba(0, 212, 255, 0.8);"
-                        )
-                    else:
-                        # Green when playing normally
-                        self.beat_indicator.setStyleSheet(
-                            "color: #00ff00; font-size: 16px; font-weight: bold; "
-                            "background: rgba(0, 255, 0, 0.3); border-radius: 10px; "
-                            "box-shadow: 0 0 10px rgba(0, 255, 0, 0.6);"
-                        )
-                else:
-                    # Dim between beats
-                    if self.sync_button.text() == "SYNCED" or self.sync_button.text() == "MASTER":
-                        # Dim blue
-                        self.beat_indicator.setStyleSheet(
-                            "color: #004466; font-size: 16px; font-weight: bold; "
-                            "background: rgba(0, 68, 102, 0.5); border-radius: 10px;"
-                        )
-                    else:
-                        # Dim gray
-                        self.beat_indicator.setStyleSheet(
-                            "color: #444444; font-size: 16px; font-weight: bold; "
-                            "background: rgba(68, 68, 68, 0.5); border-radius: 10px;"
-                        )
-        except:
+            # Flash if within 100ms of a beat (blue when synced, green when playing normally)
+            if distance_to_beat < 100:
+                self._set_beat_state('synced_bright' if self._sync_active else 'playing_bright')
+            else:
+                self._set_beat_state('synced_dim' if self._sync_active else 'playing_dim')
+        except (AttributeError, RuntimeError, TypeError):
             pass  # Fail silently
     
+    def _set_beat_state(self, state):
+        """
+        Apply the beat indicator style for the given state, skipping the stylesheet
+        update when the state has not changed.
+
+        Args:
+            state (str): Key into the precomputed beat indicator styles.
+        """
+        if state != self._beat_state and self.beat_indicator is not None:
+            self._beat_state = state
+            self.beat_indicator.setStyleSheet(self._beat_css[state])
+    
     def _update_bpm_display(self, bpm):
         """
         Update the BPM display and track label.
@@ -867,14 +1734,14 @@ class DeckWidget(GlassWidget):
             self.tempo_text.setText(str(self.current_bpm))
             display_name = get_display_filename(self.current_file)
             self.track_label.setText(f"{display_name}\nBPM: {self.current_bpm}")
-            print(f"\nDeck {self.deck_number} - Detected BPM: {self.current_bpm}")
+            logger.debug("Deck %d - Detected BPM: %s", self.deck_number, self.current_bpm)
         else:
             self.original_bpm = 0
             self.current_bpm = 0
             self.tempo_text.setText("---")
             display_name = get_display_filename(self.current_file)
             self.track_label.setText(display_name)
-            print(f"\nDeck {self.deck_number} - No BPM detected")
+            logger.debug("Deck %d - No BPM detected", self.deck_number)
 
     def load_file(self, file_path=None):
         """
@@ -887,34 +1754,52 @@ class DeckWidget(GlassWidget):
             bool: True if loading initiated, False otherwise.
         """
         try:
+            self._lazy_init_playback_widgets()
             # First stop any current playback and clear the source
             self.player.stop()
+            self._awaiting_media_load = False
+            self._pending_load_path = file_path
+            self._awaiting_source_clear = True
             self.player.setSource(QUrl())  # Clear current source
-            # Add a small delay to ensure media is cleared
-            QTimer.singleShot(50, lambda: self._continue_load_file(file_path))
+            # Continue as soon as the player reports the source is cleared
+            if self._awaiting_source_clear and self.player.mediaStatus() == _MS_NO:
+                self._awaiting_source_clear = False
+                QTimer.singleShot(0, lambda: self._continue_load_file(file_path))
             return True
         except Exception as e:
-            print(f"Critical error in load_file: {str(e)}"); traceback.print_exc()
+            logger.error("Critical error in load_file: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             self._cleanup_temp_file()
             QMessageBox.critical(self, "Critical Error", f"A critical error occurred:\n{str(e)}")
             return False
 
+    def _on_source_cleared(self, status):
+        """
+        Continue a pending load once the player has released the previous source.
+
+        Args:
+            status (QMediaPlayer.MediaStatus): The new media status.
+        """
+        if self._awaiting_source_clear and status == _MS_NO:
+            self._awaiting_source_clear = False
+            self._continue_load_file(self._pending_load_path)
+
     def _continue_load_file(self, file_path=None):
         """
         Continue loading the audio file after stopping playback and clearing the source.
+        Analysis runs on a TrackAnalysisWorker; loading completes in _on_analysis_done.
 
         Args:
             file_path (str, optional): Path to the audio file.
 
         Returns:
-            bool: True if loading succeeded, False otherwise.
+            bool: True if analysis was started, False otherwise.
         """
         try:
             # Clean up all temporary files and buffers
             self._cleanup_temp_file()
             
             # Reset EQ state
-            if hasattr(self, 'equalizer'):
+            if self.equalizer is not None:
                 self.equalizer.reset_transitions()
             
             file_name = file_path
@@ -929,164 +1814,299 @@ class DeckWidget(GlassWidget):
 
                 self.current_file = file_name
                 self.original_file_path = file_name  # Save the original file path
+                self._original_info = None
                 self.track_label.setText("Analyzing BPM...")
                 
                 try:
                     self._reset_eq()
                     
-                    print(f"Loading track: {file_name}")
+                    logger.debug("Loading track: %s", file_name)
                     
                     # Try to get cached BPM and beat positions first
-                    bpm = 0
                     self.beat_positions = []
-                    
+                    cached_bpm, cached_beats = None, None
                     try:
-                        # Check if we have cached data
                         if hasattr(self.main_app, 'cache_manager') and self.main_app.cache_manager:
                             cached_bpm, cached_beats = self.main_app.cache_manager.get_bpm_data(file_name)
                             if cached_bpm is not None and cached_bpm > 0:
-                                bpm = cached_bpm
-                                print(f"Using cached BPM: {bpm}")
-                            
+                                logger.debug("Using cached BPM: %s", cached_bpm)
                             if cached_beats is not None and len(cached_beats) > 0:
-                                self.beat_positions = cached_beats
-                                print(f"Using cached beat positions: {len(self.beat_positions)} beats")
-                        
-                        # If we don't have cached data, analyze the file
-                        if bpm == 0 or not self.beat_positions:
-                            print(f"Analyzing BPM for: {file_name}")
-                            try:
-                                # Get BPM from regular analysis (30 seconds)
-                                bpm, _ = self.main_app.audio_analyzer.analyze_file(file_name)
-                            except Exception as bpm_error:
-                                print(f"BPM analysis failed: {bpm_error}"); bpm = 0
-                            try:
-                                # Always get full track beat positions (entire song)
-                                full_beats = self.main_app.audio_analyzer.get_full_track_beat_positions_ms(file_name)
-                                if full_beats:
-                                    self.beat_positions = full_beats
-                                print(f"Detected BPM: {bpm}, {len(self.beat_positions)} beats (full track)")
-                            except Exception as beat_error:
-                                print(f"Full track beat analysis failed: {beat_error}")
-                                if not self.beat_positions:
-                                    self.beat_positions = []
-                        else:
-                            print(f"Using cached data - BPM: {bpm}, {len(self.beat_positions)} beats")
-                            # Upgrade cached beats to full-track if available
-                            try:
-                                full_beats = self.main_app.audio_analyzer.get_full_track_beat_positions_ms(file_name)
-                                if full_beats and len(full_beats) > len(self.beat_positions):
-                                    self.beat_positions = full_beats
-                                    print(f"Upgraded to full-track beats: {len(self.beat_positions)} beats")
-                            except Exception as beat_error:
-                                print(f"Full track beat analysis failed: {beat_error}")
-                            
-                    except Exception as bpm_error:
-                        print(f"BPM analysis failed: {bpm_error}"); bpm = 0; self.beat_positions = []
+                                logger.debug("Using cached beat positions: %s beats", len(cached_beats))
+                    except Exception as cache_error:
+                        logger.warning("BPM cache lookup failed: %s", cache_error)
                     
-                    self._update_bpm_display(bpm)
-                    if self.beat_positions: print(f"First few beats at: {self.beat_positions[:5]} ms")
-                    
-                    # Detect musical key for harmonic mixing
-                    try:
-                        print(f"Detecting musical key for: {file_name}")
-                        self.detected_key, self.key_confidence = self.main_app.audio_analyzer.detect_key(file_name)
-                        if self.detected_key:
-                            print(f"Detected key: {self.detected_key} (confidence: {self.key_confidence:.2f})")
-                            self._update_key_display()
-                        else:
-                            print("Key detection failed or not available")
-                            self.detected_key = ""
-                            self.key_confidence = 0.0
-                            self.key_display_label.setText("---")
-                    except Exception as key_error:
-                        print(f"Key detection error: {key_error}")
-                        self.detected_key = ""
-                        self.key_confidence = 0.0
-                        self.key_display_label.setText("---")
-                    
-                    print(f"Loading high-quality audio for playback")
-                    try:
-                        audio_data, sample_rate = self.main_app.audio_analyzer.load_audio_for_playback(file_name)
-                    except Exception as audio_error:
-                        print(f"Error loading audio data: {audio_error}"); audio_data = None; sample_rate = None
-                    
-                    if audio_data is not None and sample_rate > 0:
-                        # Set file path for caching before setting waveform data
-                        self.waveform.set_current_file_path_waveform(file_name)
-                        self.spectrogram.set_current_file_path_spectrogram(file_name)
-                        
-                        self.waveform.set_waveform_data(audio_data, sample_rate, self.beat_positions)
-                        self.spectrogram.set_spectrum_data(audio_data, sample_rate)
-                        
-                        temp_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp_audio")
-                        os.makedirs(temp_dir, exist_ok=True)
-                        temp_filename = f"deck{self.deck_number}_temp_{int(time.time())}.wav"
-                        self.temp_file = os.path.abspath(os.path.join(temp_dir, temp_filename))
-                        
-                        print(f"Creating temporary WAV file: {self.temp_file}")
-                        sf.write(self.temp_file, audio_data, sample_rate)
-                        if not os.path.exists(self.temp_file): raise RuntimeError(f"Failed to create temporary file: {self.temp_file}")
-                        
-                        source_url = QUrl.fromLocalFile(self.temp_file)
-                        self.player.setSource(source_url)
-                        QTimer.singleShot(35, self._check_media_loaded)
-                        
-                        try:
-                            if audio_data is not None and sample_rate > 0:
-                                self._eq_buffer = audio_data.copy(); self._eq_buffer_rate = sample_rate
-                                print(f"Stored audio buffer for EQ processing: {self._eq_buffer.shape}")
-                        except Exception as e: print(f"Failed to store EQ buffer: {e}")
-                        return True
-                    else:
-                        print("Attempting to load file directly...")
-                        self.player.setSource(QUrl.fromLocalFile(file_name))
-                        QTimer.singleShot(35, self._check_media_loaded)
-                        return True
+                    # Run the heavy analysis and WAV write in the background and finish loading in _on_analysis_done
+                    self._analysis_seq += 1
+                    load_seq = self._analysis_seq
+                    signals = TrackAnalysisSignals()
+                    worker = TrackAnalysisWorker(
+                        signals,
+                        load_seq,
+                        self.main_app.audio_analyzer,
+                        file_name,
+                        self._buffer_file,
+                        self._buffer_lock,
+                        lambda: load_seq == self._analysis_seq,
+                        self._buffer_state,
+                        cached_bpm,
+                        cached_beats
+                    )
+                    signals.finished.connect(self._on_analysis_done)
+                    signals.error.connect(self._on_analysis_error)
+                    QThreadPool.globalInstance().start(worker)
+                    return True
                 except Exception as e:
-                    print(f"Error loading file: {str(e)}"); traceback.print_exc()
+                    logger.warning("Error loading file: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
                     self._cleanup_temp_file()
                     QMessageBox.warning(self, "Load Error", f"Error loading file:\n{str(e)}")
                     return False
             return False
         except Exception as e:
-            print(f"Critical error in _continue_load_file: {str(e)}"); traceback.print_exc()
+            logger.error("Critical error in _continue_load_file: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             self._cleanup_temp_file()
             QMessageBox.critical(self, "Critical Error", f"A critical error occurred:\n{str(e)}")
             return False
 
-    def _check_media_loaded(self):
+    def _on_analysis_done(self, load_seq, result):
         """
-        Check the media status after loading and handle errors or retries.
+        Finish loading a track once its background analysis has completed.
+
+        Args:
+            load_seq (int): Sequence number of the load request the result belongs to.
+            result (dict): Analysis result from TrackAnalysisWorker.
         """
-        status = self.player.mediaStatus()
-        print(f"Media status check for Deck {self.deck_number}: {status}")
-        if status in [QMediaPlayer.MediaStatus.LoadedMedia, QMediaPlayer.MediaStatus.BufferedMedia]:
-            print(f"Deck {self.deck_number}: Media loaded successfully")
-            self.update_duration(self.player.duration())
-            if not self.position_timer.isActive(): self.position_timer.start()
-            self.force_visualization_update()
-            self._load_retries = 0 # Reset retries on success
-        elif status == QMediaPlayer.MediaStatus.InvalidMedia:
-            error_string = self.player.errorString()
-            print(f"Deck {self.deck_number}: Media load error - InvalidMedia: {error_string}")
-            QMessageBox.warning(self, "Media Load Error", f"Failed to load audio (Invalid Media):\n{error_string}")
-            self._cleanup_temp_file()
-        elif status in [QMediaPlayer.MediaStatus.LoadingMedia, QMediaPlayer.MediaStatus.StalledMedia, QMediaPlayer.MediaStatus.BufferingMedia, QMediaPlayer.MediaStatus.NoMedia]:
-            print(f"Deck {self.deck_number}: Media still loading or no media (status: {status}), checking again...")
-            QTimer.singleShot(100, self._check_media_loaded)
-        else: # UnknownError, EndOfMedia (if trying to check after it ended before play)
-            self._load_retries += 1
-            if self._load_retries < 5:
-                print(f"Deck {self.deck_number}: Media status {status}, retrying... (attempt {self._load_retries})")
-                QTimer.singleShot(200 * self._load_retries, self._check_media_loaded) # Increasing delay
-            else:
-                if self.player.duration() <= 0: # Still no duration after retries
-                    print(f"Deck {self.deck_number}: Failed to load media after multiple attempts (status {status})")
+        if load_seq != self._analysis_seq or result.get('file_path') != self.original_file_path:
+            logger.debug("Deck %d: Discarding stale analysis result for %s", self.deck_number, safe_filename_for_logging(result.get('file_path')))
+            return
+        
+        file_name = result['file_path']
+        self._original_info = result.get('file_info')
+        try:
+            self.beat_positions = result['beat_positions']
+            self._update_bpm_display(result['bpm'])
+            if self.beat_positions: logger.debug("First few beats at: %s ms", self.beat_positions[:5])
+            
+            self.detected_key = result['key']
+            self.key_confidence = result['key_confidence']
+            if self.detected_key:
+                logger.debug("Detected key: %s (confidence: %.2f)", self.detected_key, self.key_confidence)
+                self._update_key_display()
+            else:
+                logger.debug("Key detection failed or not available")
+                self._update_key_display()
+            
+            audio_data = result['audio_data']
+            sample_rate = result['sample_rate']
+            if audio_data is not None and sample_rate > 0 and result['temp_file']:
+                # Set file path for caching before setting waveform data
+                self.waveform.set_current_file_path_waveform(file_name)
+                self.spectrogram.set_current_file_path_spectrogram(file_name)
+                
+                self.waveform.set_waveform_data(audio_data, sample_rate, self.beat_positions)
+                self.spectrogram.set_spectrum_data(audio_data, sample_rate)
+                
+                # The worker has already written the playable WAV
+                self.temp_file = result['temp_file']
+                self._await_media_load(self._url_for(self.temp_file))
+                
+                try:
+                    # Share the decoded buffer with the waveform instead of copying it - treat as read-only
+                    self._eq_buffer = audio_data; self._eq_buffer_rate = sample_rate
+                    logger.debug("Stored audio buffer for EQ processing: %s", self._eq_buffer.shape)
+                except Exception as e: logger.warning("Failed to store EQ buffer: %s", e)
+                
+                # Design the EQ filters for this track's rate now, once per track, rather
+                # than inside the first EQ render on the worker thread
+                if self.equalizer is not None:
+                    self.equalizer.set_sample_rate(sample_rate)
+            else:
+                logger.debug("Attempting to load file directly...")
+                self._await_media_load(self._url_for(file_name))
+        except Exception as e:
+            logger.warning("Error loading file: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            self._cleanup_temp_file()
+            QMessageBox.warning(self, "Load Error", f"Error loading file:\n{str(e)}")
+
+    def _on_analysis_error(self, load_seq, error_message):
+        """
+        Handle a failure of the background track analysis.
+
+        Args:
+            load_seq (int): Sequence number of the load request that failed.
+            error_message (str): Error message.
+        """
+        if load_seq != self._analysis_seq:
+            return
+        logger.warning("Deck %d: Track analysis failed: %s", self.deck_number, error_message)
+        self._cleanup_temp_file()
+        QMessageBox.warning(self, "Load Error", f"Error loading file:\n{error_message}")
+
+    def _on_media_status(self, status):
+        """
+        Handle media status changes after a track's playback file was set, finishing the
+        load once the media is ready or reporting errors.
+
+        Args:
+            status (QMediaPlayer.MediaStatus): The new media status.
+        """
+        if not self._awaiting_media_load:
+            return
+        logger.debug("Media status change for Deck %d: %s", self.deck_number, status)
+        if status in _MS_READY:
+            logger.debug("Deck %d: Media loaded successfully", self.deck_number)
+            self._awaiting_media_load = False
+            self.update_duration(self.player.duration())
+            if not self.position_timer.isActive(): self.position_timer.start()
+            self.force_visualization_update()
+            self._load_retries = 0 # Reset retries on success
+        elif status == _MS_INVALID:
+            self._awaiting_media_load = False
+            error_string = self.player.errorString()
+            logger.warning("Deck %d: Media load error - InvalidMedia: %s", self.deck_number, error_string)
+            QMessageBox.warning(self, "Media Load Error", f"Failed to load audio (Invalid Media):\n{error_string}")
+            self._cleanup_temp_file()
+        elif status in _MS_PENDING:
+            pass # Transient - the next status change will arrive on its own
+        else: # UnknownError, EndOfMedia (if the status changed after it ended before play)
+            self._load_retries += 1
+            if self._load_retries >= 5:
+                if self.player.duration() <= 0: # Still no duration after retries
+                    logger.warning("Deck %d: Failed to load media after multiple attempts (status %s)", self.deck_number, status)
                     QMessageBox.warning(self, "Media Load Error", "Failed to load audio after multiple attempts.")
                     self._cleanup_temp_file()
+                self._awaiting_media_load = False
                 self._load_retries = 0 # Reset after max retries
 
+    def _notify(self, title, message, level="warning"):
+        """
+        Report a problem without blocking the event loop, through the main window's status bar
+        notification. Falls back to a message box when there is no main window.
+
+        Args:
+            title (str): Short notification title.
+            message (str): Notification text.
+            level (str): "info", "warning" or "error".
+        """
+        if self._notify_cb is not None:
+            self._notify_cb(f"Deck {self.deck_number} - {title}", message, level)
+        elif level == "error":
+            QMessageBox.critical(self, title, message)
+        else:
+            QMessageBox.warning(self, title, message)
+
+    def _url_for(self, path):
+        """
+        Get the QUrl for a local file, reusing the one built for recent paths.
+
+        Args:
+            path (str): Local file path.
+
+        Returns:
+            QUrl: URL of the file.
+        """
+        url = self._url_cache.get(path)
+        if url is None:
+            url = QUrl.fromLocalFile(path)
+            self._url_cache[path] = url
+            if len(self._url_cache) > _URL_CACHE_SIZE:
+                self._url_cache.popitem(last=False)
+        else:
+            self._url_cache.move_to_end(path)
+        return url
+
+    def _remove_file_later(self, path):
+        """
+        Delete a temp file on the global thread pool instead of the GUI thread.
+
+        Args:
+            path (str): File to remove.
+        """
+        if path in _pending_removals:
+            return
+        _pending_removals.add(path)
+        deck_number = self.deck_number
+        QThreadPool.globalInstance().start(lambda: _remove_temp_file(path, deck_number))
+
+    def _is_shared_temp_file(self, path):
+        """
+        Whether a temp file belongs to the tempo or EQ render cache and must not be
+        deleted when playback moves off it.
+
+        Args:
+            path (str): File path.
+
+        Returns:
+            bool: True for cached renders.
+        """
+        return path in self._tempo_cache.values() or is_eq_cache_file(path)
+
+    def _cached_tempo_file(self, key):
+        """
+        Get a previously rendered tempo file for a (original path, stretch factor) key.
+
+        Args:
+            key (tuple): Original file path and rounded stretch factor.
+
+        Returns:
+            str or None: Path of the cached file, or None if there is none on disk.
+        """
+        path = self._tempo_cache.get(key)
+        if path is None:
+            return None
+        if not os.path.exists(path):
+            del self._tempo_cache[key]  # Removed by a tempo change or track unload
+            return None
+        self._tempo_cache.move_to_end(key)
+        return path
+
+    def _remember_tempo_file(self, key, path):
+        """
+        Add a rendered tempo file to the cache, deleting the least recently used
+        file when the cache is full.
+
+        Args:
+            key (tuple): Original file path and rounded stretch factor.
+            path (str): Path of the rendered file.
+        """
+        self._tempo_cache[key] = path
+        self._tempo_cache.move_to_end(key)
+        while len(self._tempo_cache) > _TEMPO_CACHE_SIZE:
+            _, evicted = self._tempo_cache.popitem(last=False)
+            if evicted in (self.temp_file, self._key_base_file):
+                continue  # Still playing from it
+            self._remove_file_later(evicted)
+
+    def _set_source_if_changed(self, path):
+        """
+        Set a local file as the player source unless it already is, so a no-op switch
+        doesn't re-initialize the decoder. Callers that wait for the media to load via
+        _check_media_and_seek_resume proceed immediately when nothing was reloaded.
+
+        Args:
+            path (str): Local file path.
+
+        Returns:
+            bool: True if the source was changed.
+        """
+        url = self._url_for(path)
+        if self.player.source() == url:
+            logger.debug("Deck %d: Source unchanged, skipping reload of %s", self.deck_number, safe_filename_for_logging(path))
+            return False
+        self._source_load_pending = True
+        self.player.setSource(url)
+        return True
+
+    def _await_media_load(self, source_url):
+        """
+        Set the player source and let _on_media_status finish the load when it is ready.
+
+        Args:
+            source_url (QUrl): The playback source.
+        """
+        self._load_retries = 0
+        self._awaiting_media_load = True
+        self.player.setSource(source_url)
+
     def force_visualization_update(self):
         """
         Force an immediate update of the visualization.
@@ -1099,103 +2119,104 @@ class DeckWidget(GlassWidget):
             duration = 0
             
             # For QMediaPlayer
-            if self.player and self.player.mediaStatus() in [
-                QMediaPlayer.MediaStatus.LoadedMedia,
-                QMediaPlayer.MediaStatus.BufferedMedia,
-                QMediaPlayer.MediaStatus.EndOfMedia
-            ]:
+            if self.player and self.player.mediaStatus() in _MS_SEEKABLE:
                 position = self.player.position()
                 duration = self.player.duration()
             
             if duration > 0:
-                print(f"Force updating waveform position for Deck {self.deck_number}: pos={position}, dur={duration}")
+                logger.debug("Force updating waveform position for Deck %d: pos=%s, dur=%s", self.deck_number, position, duration)
                 self.waveform.set_position(position, duration)
                 
         except Exception as e:
-            print(f"Error in force_visualization_update for Deck {self.deck_number}: {e}")
+            logger.warning("Error in force_visualization_update for Deck %d: %s", self.deck_number, e)
             import traceback
-            traceback.print_exc()
+            if logger.isEnabledFor(logging.DEBUG): traceback.print_exc()
 
     def _cleanup_temp_file(self):
         """
         Clean up temporary files used for playback, EQ, or tempo processing.
         """
         try:
-            # Clean up the main temp file
-            if hasattr(self, 'temp_file') and self.temp_file and os.path.exists(self.temp_file):
-                try:
-                    os.remove(self.temp_file)
-                    print(f"Deck {self.deck_number}: Removed temp file: {os.path.basename(self.temp_file)}")
-                except Exception as e:
-                    print(f"Deck {self.deck_number}: Could not remove temp file: {e}")
+            # Clean up the main temp file (the persistent playback buffer is rewritten in place
+            # instead, and cached renders are removed by their cache)
+            if (self.temp_file and self.temp_file != self._buffer_file
+                    and not is_eq_cache_file(self.temp_file)):
+                self._remove_file_later(self.temp_file)
             
             # Clean up any EQ-processed files
             if self._last_eq_output_file:
-                try:
-                    if os.path.exists(self._last_eq_output_file):
-                        os.remove(self._last_eq_output_file)
-                        print(f"Deck {self.deck_number}: Removed last EQ file: {os.path.basename(self._last_eq_output_file)}")
-                except Exception as e:
-                    print(f"Deck {self.deck_number}: Could not remove last EQ file: {e}")
+                self._remove_file_later(self._last_eq_output_file)
+            
+            # Drop any pitch-shifted copy or EQ render - they were made from the file being replaced
+            self._key_shift_seq += 1
+            self._current_eq_job_id += 1
+            self._pending_spec = None
+            self._eq_reapply_pending = None
+            if self._key_shift_file:
+                self._remove_file_later(self._key_shift_file)
             
             # Reset file paths and buffers
+            self._key_shift_file = None
+            self._key_base_file = None
             self.temp_file = None
             self._last_eq_output_file = None
             self._eq_buffer = None
             self._eq_buffer_rate = None
         except Exception as e:
-            print(f"Deck {self.deck_number}: Error in cleanup: {e}")
+            logger.warning("Deck %d: Error in cleanup: %s", self.deck_number, e)
 
     def _position_timer_tick(self):
         """
         Update UI and waveform/spectrogram position based on playback timer.
         """
-        if self.is_playing:
-            try:
-                current_timestamp = time.time() * 1000
-                position = self.player.position()
-                duration = self.player.duration()
-                
-                # Check for loop condition
-                if self._loop_enabled and position >= self._loop_end_time:
-                    self.player.setPosition(self._loop_start_time)
-                    position = self._loop_start_time
-                
-                if position >= 0 and duration > 0:
-                    if not self.progress.isSliderDown() and current_timestamp - self._last_ui_update >= self._ui_update_interval:
-                        self.progress.setValue(int((position / duration) * 1000))
-                        current_s = position / 1000
-                        self.current_time.setText(f"{int(current_s // 60)}:{int(current_s % 60):02d}")
-                        self._last_ui_update = current_timestamp
-                    if current_timestamp - self._last_position_update >= self._position_update_interval:
-                        self.waveform.set_position(position, duration, self.beat_positions)
-                        self.spectrogram.update_position(position, duration)
-                        self._last_position_update = current_timestamp
-            except Exception as e:
-                print(f"Deck {self.deck_number}: Error in position timer update: {e}")
-                if "read-only" in str(e).lower(): 
-                    print(f"Deck {self.deck_number}: Detected read-only error, stopping playback")
-                    self.player.stop()
-                    if hasattr(self, 'position_timer') and self.position_timer.isActive():
-                        self.position_timer.stop()
+        if not self.is_playing:
+            return
+        try:
+            now_ns = time.monotonic_ns()
+            position = self._player_position()
+            duration = self._cached_duration_ms
+            
+            # Check for loop condition
+            if self._loop_enabled and position >= self._loop_end_time:
+                self.player.setPosition(self._loop_start_time)
+                position = self._loop_start_time
+            
+            if position >= 0 and duration > 0:
+                # The value deltas are the throttle for the progress slider and time label
+                prog = int(position * self._inv_duration_x1000)
+                if prog != self._last_progress and not self._progress_slider_down():
+                    self._progress_set_value(prog)
+                    self._last_progress = prog
+                self._set_current_time_label(position)
+                if now_ns - self._last_position_update_ns >= self._position_update_interval_ns:
+                    self._update_visual_position(position, duration)
+                    self._last_position_update_ns = now_ns
+        except Exception as e:
+            logger.warning("Deck %d: Error in position timer update: %s", self.deck_number, e)
+            if "read-only" in str(e).lower(): 
+                logger.warning("Deck %d: Detected read-only error, stopping playback", self.deck_number)
+                self.player.stop()
+                if hasattr(self, 'position_timer') and self.position_timer.isActive():
+                    self.position_timer.stop()
 
     def toggle_playback(self):
         """
         Toggle playback state (play/pause) for the current track.
         """
         if not self.current_file: 
-            QMessageBox.information(self, "Playback Error", f"Deck {self.deck_number}: No file loaded to play/pause"); return
+            self._notify("Playback Error", "No file loaded to play/pause", "info"); return
+        self._lazy_init_playback_widgets()
         try:
             if self.is_playing:
                 self.player.pause() 
             else:
                 # Ensure media is loaded before trying to play, especially if at end of track
-                if self.player.mediaStatus() == QMediaPlayer.MediaStatus.EndOfMedia:
+                if self.player.mediaStatus() == _MS_END:
                     self.player.setPosition(0) # Rewind if at end
                 self.player.play()  
                 if not self.position_timer.isActive(): self.position_timer.start()
         except Exception as e: 
-            print(f"Deck {self.deck_number}: Error in toggle_playback: {e}")
+            logger.warning("Deck %d: Error in toggle_playback: %s", self.deck_number, e)
 
     def find_closest_beat(self, current_position_ms: int) -> tuple[int | None, int | None]:
         """
@@ -1207,19 +2228,14 @@ class DeckWidget(GlassWidget):
         Returns:
             tuple[int | None, int | None]: (Last beat time in ms, index of last beat) or (None, None) if not found.
         """
-        if not self.beat_positions or current_position_ms < 0: return None, None
+        beats = self._beat_positions_np
+        if beats.size == 0 or current_position_ms < 0: return None, None
         # Handle case where current_position_ms is before the first beat
-        if current_position_ms < self.beat_positions[0]: return self.beat_positions[0], 0
-        
-        last_beat_time = None; last_beat_idx = None
-        for i, beat_time in enumerate(self.beat_positions):
-            if beat_time <= current_position_ms: 
-                last_beat_time = beat_time
-                last_beat_idx = i
-            else: # Found the first beat after current_position_ms
-                break 
-        # If loop finishes, last_beat_time is the last beat in the list (or None if list was empty, covered by first check)
-        return last_beat_time, last_beat_idx
+        if current_position_ms < beats[0]: return int(beats[0]), 0
+        
+        # Index of the last beat at or before current_position_ms
+        last_beat_idx = int(np.searchsorted(beats, current_position_ms, side='right')) - 1
+        return int(beats[last_beat_idx]), last_beat_idx
         
     def seek(self, value):
         """
@@ -1241,30 +2257,82 @@ class DeckWidget(GlassWidget):
         Args:
             position (int): Current playback position in milliseconds.
         """
-        duration = self.player.duration()
+        duration = self._cached_duration_ms
         if duration > 0:
             if not self.progress.isSliderDown(): 
-                self.progress.setValue(int((position / duration) * 1000))
-        current_s = position / 1000
-        self.current_time.setText(f"{int(current_s // 60)}:{int(current_s % 60):02d}")
-        self.waveform.set_position(position, duration, self.beat_positions)
-        self.spectrogram.update_position(position, duration)
+                self._last_progress = int(position * self._inv_duration_x1000)
+                self.progress.setValue(self._last_progress)
+        self._set_current_time_label(position)
+        self._update_visual_position(position, duration)
         
         # Update beat indicator LED
         self.update_beat_indicator()
         
     def update_duration(self, duration):
         """
-        Update the total duration label for the track.
+        Update the total duration label and the cached duration used by the position updates.
 
         Args:
             duration (int): Duration in milliseconds.
         """
-        if duration > 0:
-            total_s = duration / 1000
-            self.total_time.setText(f"{int(total_s // 60)}:{int(total_s % 60):02d}")
-        else:
-            self.total_time.setText("0:00")
+        self._cached_duration_ms = duration if duration > 0 else 0
+        self._inv_duration_x1000 = 1000.0 / duration if duration > 0 else 0.0
+        self._invalidate_visual_position()
+        total_sec = int(duration // 1000) if duration > 0 else 0
+        if total_sec != self._last_displayed_total_sec:
+            self._last_displayed_total_sec = total_sec
+            self.total_time.setText(f"{total_sec // 60}:{total_sec % 60:02d}")
+
+    def _update_visual_position(self, position, duration):
+        """
+        Push the position to the waveform and spectrogram, skipping the update when it
+        would not move either display by a pixel.
+
+        Args:
+            position (int): Current playback position in milliseconds.
+            duration (int): Track duration in milliseconds.
+        """
+        if not self._position_quantum_ms:
+            # The scrolling waveform has the finest resolution; the spectrogram spans the whole track
+            quantum = self.waveform.ms_per_pixel()
+            if duration > 0:
+                quantum = min(quantum, duration / max(1, self.spectrogram.width()))
+            self._position_quantum_ms = max(quantum, 1.0)
+        px = int(position / self._position_quantum_ms)
+        if px == self._last_wave_px:
+            return
+        self._last_wave_px = px
+        self.waveform.set_position(position, duration, self.beat_positions)
+        self.spectrogram.update_position(position, duration)
+
+    def _invalidate_visual_position(self):
+        """
+        Force the next position update through to the displays and recompute the pixel size.
+        """
+        self._last_wave_px = -1
+        self._position_quantum_ms = 0.0
+
+    def resizeEvent(self, event):
+        """
+        Handle resize events by invalidating the cached display pixel size.
+
+        Args:
+            event: The QResizeEvent instance.
+        """
+        super().resizeEvent(event)
+        self._invalidate_visual_position()
+
+    def _set_current_time_label(self, position):
+        """
+        Update the elapsed time label, skipping the update when the displayed second is unchanged.
+
+        Args:
+            position (int): Current playback position in milliseconds.
+        """
+        sec = int(position // 1000)
+        if sec != self._last_displayed_sec:
+            self._last_displayed_sec = sec
+            self._current_time_set_text(f"{sec // 60}:{sec % 60:02d}")
 
     def handle_player_error(self, error: QMediaPlayer.Error):
         """
@@ -1275,7 +2343,7 @@ class DeckWidget(GlassWidget):
         """
         error_string = self.player.errorString()
         error_name = error.name if hasattr(error, 'name') else str(error) 
-        print(f"Deck {self.deck_number} Error: {error_name} - {error_string}")
+        logger.warning("Deck %d Error: %s - %s", self.deck_number, error_name, error_string)
         msg = f"Media Error (Deck {self.deck_number}): {error_string}"
         if error == QMediaPlayer.Error.FormatError or error == QMediaPlayer.Error.ResourceError:
             msg += "\n\nThis may be due to an unsupported format or a corrupted file."
@@ -1283,7 +2351,7 @@ class DeckWidget(GlassWidget):
                 source_path = self.player.source().toLocalFile()
                 if source_path: msg += f"\nProblem file: {safe_filename_for_logging(source_path)}"
             except: pass # Ignore if source cannot be read
-        QMessageBox.warning(self, "Playback Error", msg)
+        self._notify("Playback Error", msg)
 
     def adjust_position_from_turntable(self, angle_fraction):
         """
@@ -1292,27 +2360,51 @@ class DeckWidget(GlassWidget):
         Args:
             angle_fraction (float): Fractional position from the turntable.
         """
-        duration = self.player.duration()
+        # Duration is cached by update_duration; only ask the backend if it isn't known yet
+        duration = self._cached_duration_ms or self.player.duration()
         if not duration > 0: return
         try:
             new_pos = int(duration * angle_fraction)
             new_pos = max(0, min(new_pos, duration))
             
-            was_playing = (self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState)
-            if was_playing: self.player.pause() 
+            was_playing = (self.player.playbackState() == _PS_PLAYING)
+            if was_playing:
+                self.player.pause()
+                # Resume as soon as the backend acknowledges the seek, with a timer as fallback.
+                # Armed before seeking, since positionChanged may be emitted synchronously
+                self._scrub_resume_target = new_pos
+                self._scrub_resume_fallback.start()
             self.player.setPosition(new_pos)
             self.update_position(new_pos) # Immediate UI update
-            if was_playing: 
-                QTimer.singleShot(20, self.player.play)
         except Exception as e:
-            print(f"Deck {self.deck_number}: Error in turntable seek: {e}")
+            logger.warning("Deck %d: Error in turntable seek: %s", self.deck_number, e)
             if "stream" in str(e).lower(): self._recover_from_stream_error()
                 
+    def _on_scrub_position(self, position):
+        """
+        Resume playback once the player reports a position near a pending turntable seek target.
+
+        Args:
+            position (int): New player position in milliseconds.
+        """
+        if self._scrub_resume_target is not None and abs(position - self._scrub_resume_target) <= _SCRUB_RESUME_TOLERANCE_MS:
+            self._resume_after_scrub()
+
+    def _resume_after_scrub(self):
+        """
+        Resume playback after a turntable seek, whether acknowledged or timed out.
+        """
+        if self._scrub_resume_target is None:
+            return
+        self._scrub_resume_target = None
+        self._scrub_resume_fallback.stop()
+        self.player.play()
+
     def _recover_from_stream_error(self):
         """
         Attempt to recover from a stream error by reloading the current file.
         """
-        print(f"Deck {self.deck_number}: Attempting to recover from stream error.")
+        logger.warning("Deck %d: Attempting to recover from stream error.", self.deck_number)
         try:
             was_playing = self.is_playing # Use the property which reflects actual state
             position = self.player.position()
@@ -1322,15 +2414,15 @@ class DeckWidget(GlassWidget):
             file_to_reload = self.temp_file if (self.temp_file and os.path.exists(self.temp_file)) else self.current_file
             
             if file_to_reload and os.path.exists(file_to_reload):
-                print(f"Deck {self.deck_number}: Reloading source: {file_to_reload}")
-                self.player.setSource(QUrl.fromLocalFile(file_to_reload))
+                logger.debug("Deck %d: Reloading source: %s", self.deck_number, file_to_reload)
+                self.player.setSource(self._url_for(file_to_reload))
                 # Media status check before setting position
                 QTimer.singleShot(100, lambda: self._finalize_recovery(position, was_playing))
             else:
-                print(f"Deck {self.deck_number}: No valid file to recover with.")
+                logger.warning("Deck %d: No valid file to recover with.", self.deck_number)
                 self.handle_player_error(QMediaPlayer.Error.ResourceError)
         except Exception as e:
-            print(f"Deck {self.deck_number}: Critical error during stream recovery: {e}")
+            logger.error("Deck %d: Critical error during stream recovery: %s", self.deck_number, e)
             self.handle_player_error(QMediaPlayer.Error.ResourceError)
 
     def _finalize_recovery(self, position, was_playing):
@@ -1341,13 +2433,13 @@ class DeckWidget(GlassWidget):
             position (int): Playback position to restore.
             was_playing (bool): Whether playback was active before the error.
         """
-        if self.player.mediaStatus() in [QMediaPlayer.MediaStatus.LoadedMedia, QMediaPlayer.MediaStatus.BufferedMedia]:
+        if self.player.mediaStatus() in _MS_READY:
             self.player.setPosition(position)
             if was_playing: 
                 self.player.play()
-            print(f"Deck {self.deck_number}: Stream recovery successful.")
+            logger.debug("Deck %d: Stream recovery successful.", self.deck_number)
         else:
-            print(f"Deck {self.deck_number}: Media not loaded after recovery attempt. Status: {self.player.mediaStatus()}")
+            logger.warning("Deck %d: Media not loaded after recovery attempt. Status: %s", self.deck_number, self.player.mediaStatus())
             self.handle_player_error(QMediaPlayer.Error.ResourceError) 
 
     def _update_turntable_state(self, state: QMediaPlayer.PlaybackState):
@@ -1357,17 +2449,20 @@ class DeckWidget(GlassWidget):
         Args:
             state (QMediaPlayer.PlaybackState): The new playback state.
         """
-        current_is_playing = (state == QMediaPlayer.PlaybackState.PlayingState)
+        current_is_playing = (state == _PS_PLAYING)
         if self._is_playing != current_is_playing:
             self.is_playing = current_is_playing 
         
-        state_map = { QMediaPlayer.PlaybackState.StoppedState: 'Stopped', QMediaPlayer.PlaybackState.PlayingState: 'Playing', QMediaPlayer.PlaybackState.PausedState: 'Paused' }
-        print(f"---> Deck {self.deck_number}: Playback state changed to: {state_map.get(state, state.value if hasattr(state, 'value') else state)}")
-        self.turntable.set_playing(current_is_playing)
+        logger.debug("---> Deck %d: Playback state changed to: %s", self.deck_number, _PLAYBACK_STATE_NAMES.get(state, state.value if hasattr(state, 'value') else state))
+        if self.turntable is not None:
+            self.turntable.set_playing(current_is_playing)
         
+        # Only a stop can mean end of media - skip the backend queries for other states
+        if state != _PS_STOPPED:
+            return
         duration = self.player.duration()
-        if state == QMediaPlayer.PlaybackState.StoppedState and duration > 0 and self.player.position() >= duration:
-            print(f"Deck {self.deck_number}: End of media reached.")
+        if duration > 0 and self.player.position() >= duration:
+            logger.debug("Deck %d: End of media reached.", self.deck_number)
             self.player.setPosition(0) 
             if self.is_playing: self.player.pause() 
             self.update_position(0)
@@ -1380,43 +2475,66 @@ class DeckWidget(GlassWidget):
             change (int): Amount to change the BPM by.
         """
         if self.original_bpm == 0: 
-            print(f"Deck {self.deck_number}: Cannot adjust tempo - Original BPM not set."); return
+            logger.warning("Deck %d: Cannot adjust tempo - Original BPM not set.", self.deck_number); return
         new_bpm = max(20, min(self.current_bpm + change, 300))
         if new_bpm != self.current_bpm:
-            print(f"Deck {self.deck_number}: ⚡ INSTANT tempo change from {self.current_bpm} to {new_bpm} BPM")
-            if self.main_app and hasattr(self.main_app, 'sync_master') and self.main_app.sync_master == self.deck_number:
-                 if hasattr(self.main_app, 'sync_slave_deck_tempo'):
-                    self.main_app.sync_slave_deck_tempo(new_bpm)
+            logger.debug("Deck %d: ⚡ INSTANT tempo change from %s to %s BPM", self.deck_number, self.current_bpm, new_bpm)
+            self._sync_slaves_if_master(new_bpm)
             self.set_deck_tempo_instant(new_bpm)
 
+    def _sync_slaves_if_master(self, new_bpm):
+        """
+        Propagate a tempo change to the slave deck when this deck is the sync master.
+
+        Args:
+            new_bpm (int): The master's new BPM.
+        """
+        if self._sync_slave_cb is not None and self.main_app.sync_master == self.deck_number:
+            self._sync_slave_cb(new_bpm)
+
+    @contextlib.contextmanager
+    def _tempo_ui_batch(self):
+        """
+        Suspend repaints of the tempo controls while several of them are updated, so the
+        changes land in a single paint. Nested use only toggles updates at the outermost level.
+        """
+        container = self._tempo_controls
+        if not container.updatesEnabled():
+            yield
+            return
+        container.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            container.setUpdatesEnabled(True)
+
     def reset_tempo(self):
         """
         Reset the deck's tempo to the original BPM INSTANTLY, reset slider, and reset key transpose.
         """
         if self.original_bpm == 0: 
-            print(f"Deck {self.deck_number}: Cannot reset tempo - Original BPM not set."); return
+            logger.warning("Deck %d: Cannot reset tempo - Original BPM not set.", self.deck_number); return
         if self.current_bpm != self.original_bpm or self.key_transpose != 0:
-            print(f"Deck {self.deck_number}: ⚡ INSTANT tempo reset to {self.original_bpm} BPM")
+            logger.debug("Deck %d: ⚡ INSTANT tempo reset to %s BPM", self.deck_number, self.original_bpm)
             
-            # Reset tempo slider to center (0%)
-            if hasattr(self, 'tempo_slider'):
+            with self._tempo_ui_batch():
+                # Reset tempo slider to center (0%)
                 self.tempo_slider.blockSignals(True)  # Prevent recursive calls
                 self.tempo_slider.setValue(0)
                 self.tempo_percent_label.setText("0%")
                 self.tempo_slider.blockSignals(False)
-            
-            # Reset key transpose when unsyncing
-            if self.key_transpose != 0:
-                print(f"Deck {self.deck_number}: Resetting key transpose from {self.key_transpose:+d} semitones")
-                self.key_transpose = 0
-                self._update_key_display()
-            
-            if self.main_app and hasattr(self.main_app, 'sync_master') and self.main_app.sync_master == self.deck_number:
-                 if hasattr(self.main_app, 'sync_slave_deck_tempo'):
-                    self.main_app.sync_slave_deck_tempo(self.original_bpm)
-            self.set_deck_tempo_instant(self.original_bpm)
+                
+                # Reset key transpose when unsyncing
+                if self.key_transpose != 0:
+                    logger.debug("Deck %d: Resetting key transpose from %+d semitones", self.deck_number, self.key_transpose)
+                    self.key_transpose = 0
+                    self._update_key_display()
+                    self._key_shift_debounce.start()
+                
+                self._sync_slaves_if_master(self.original_bpm)
+                self.set_deck_tempo_instant(self.original_bpm)
         else: 
-            print(f"Deck {self.deck_number}: Tempo already at original {self.current_bpm} BPM.")
+            logger.debug("Deck %d: Tempo already at original %s BPM.", self.deck_number, self.current_bpm)
     
     def transpose_key(self, semitones):
         """
@@ -1426,7 +2544,7 @@ class DeckWidget(GlassWidget):
             semitones (int): Number of semitones to transpose (positive = up, negative = down).
         """
         if not self.original_file_path:
-            print(f"Deck {self.deck_number}: No track loaded for key transposition.")
+            logger.debug("Deck %d: No track loaded for key transposition.", self.deck_number)
             return
         
         # Update transpose value
@@ -1434,25 +2552,15 @@ class DeckWidget(GlassWidget):
         new_transpose = max(-12, min(12, new_transpose))  # Limit to ±12 semitones (1 octave)
         
         if new_transpose == self.key_transpose:
-            print(f"Deck {self.deck_number}: Key transpose limit reached (±12 semitones).")
+            logger.debug("Deck %d: Key transpose limit reached (±12 semitones).", self.deck_number)
             return
         
         self.key_transpose = new_transpose
-        print(f"Deck {self.deck_number}: Transposing key by {self.key_transpose:+d} semitones")
+        logger.debug("Deck %d: Transposing key by %+d semitones", self.deck_number, self.key_transpose)
         
-        # Update key display
+        # Update key display, then pitch shift the audio once the presses settle
         self._update_key_display()
-        
-        # Note: Key transposition requires pitch shifting which would need additional audio processing
-        # This is a placeholder for future implementation with a pitch-shifting library like pyrubberband
-        # For now, we just update the display to show the transposed key
-        QMessageBox.information(
-            self,
-            "Key Transposition",
-            f"Key transposed by {self.key_transpose:+d} semitone(s).\n\n"
-            "Note: Real-time pitch shifting requires additional audio libraries.\n"
-            "This feature displays the transposed key for DJ reference."
-        )
+        self._key_shift_debounce.start()
     
     def reset_key(self):
         """
@@ -1461,14 +2569,82 @@ class DeckWidget(GlassWidget):
         if self.key_transpose != 0:
             self.key_transpose = 0
             self._update_key_display()
-            print(f"Deck {self.deck_number}: Key transposition reset to original.")
+            self._key_shift_debounce.start()
+            logger.debug("Deck %d: Key transposition reset to original.", self.deck_number)
         else:
-            print(f"Deck {self.deck_number}: Key already at original.")
+            logger.debug("Deck %d: Key already at original.", self.deck_number)
+
+    def _apply_key_shift(self):
+        """
+        Pitch shift the deck's unshifted playback file to the current transposition in the
+        background, or switch back to the unshifted file when the transposition is zero.
+        """
+        self._key_shift_seq += 1
+        if self.key_transpose == 0:
+            if self._key_shift_file is not None and self._key_base_file and os.path.exists(self._key_base_file):
+                self._switch_key_source(self._key_base_file)
+            self._key_base_file = None
+            return
+
+        if self._key_base_file is None:
+            self._key_base_file = self.temp_file or self.original_file_path
+        if not self._key_base_file or not os.path.exists(self._key_base_file):
+            logger.warning("Deck %d: No playback file available for key transposition.", self.deck_number)
+            self._key_base_file = None
+            return
+
+        output_file = os.path.join(_TEMPO_TEMP_DIR, f"deck{self.deck_number}_key{self.key_transpose:+d}_{int(time.time()*1000)}.wav")
+        logger.debug("Deck %d: Pitch shifting %+d semitones", self.deck_number, self.key_transpose)
+        QThreadPool.globalInstance().start(KeyShiftWorker(
+            self._key_shift_signals, self._key_shift_seq, self.tempo_shifter,
+            self._key_base_file, output_file, self.key_transpose))
+
+    def _on_key_shift_done(self, shift_seq, output_file, success):
+        """
+        Switch playback to a finished pitch-shifted file.
+
+        Args:
+            shift_seq (int): Sequence number of the shift.
+            output_file (str): Path of the shifted file.
+            success (bool): Whether the shift succeeded.
+        """
+        if shift_seq != self._key_shift_seq or not success:
+            if not success:
+                logger.warning("Deck %d: Key transposition failed, keeping current audio.", self.deck_number)
+            try:
+                if os.path.exists(output_file): os.remove(output_file)
+            except OSError:
+                pass
+            return
+        self._switch_key_source(output_file)
+
+    def _switch_key_source(self, file_path):
+        """
+        Set a (pitch-shifted or unshifted) file as the player source, keeping the playback
+        position and state, and remove the previously shifted file.
+
+        Args:
+            file_path (str): The file to play.
+        """
+        was_playing = (self.player.playbackState() == _PS_PLAYING)
+        position = self.player.position()
+        old_shift_file = self._key_shift_file
+        self._key_shift_file = file_path if file_path != self._key_base_file else None
+        if was_playing: self.player.pause()
+        self._set_source_if_changed(file_path)
+        self._check_media_and_seek_resume(position, was_playing)
+        if old_shift_file and old_shift_file != file_path:
+            self._remove_file_later(old_shift_file)
     
     def _update_key_display(self):
         """
         Update the key display label with current key and transposition.
         """
+        key_state = (self.detected_key, self.key_transpose, round(self.key_confidence, 2))
+        if key_state == self._last_key_render:
+            return
+        self._last_key_render = key_state
+
         if not self.detected_key:
             self.key_display_label.setText("---")
             return
@@ -1476,22 +2652,14 @@ class DeckWidget(GlassWidget):
         if self.key_transpose == 0:
             display_text = self.detected_key
         else:
-            # Calculate transposed key
-            key_part = self.detected_key.split("(")[0].strip()  # Get "C Major" part
-            camelot_part = self.detected_key.split("(")[-1].strip(")")  # Get "8B" part
-            
-            # Extract root note from key
-            key_names = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
-            for i, key_name in enumerate(key_names):
-                if key_part.startswith(key_name):
-                    # Calculate new key index
-                    new_index = (i + self.key_transpose) % 12
-                    new_key_name = key_names[new_index]
-                    
-                    # Preserve Major/Minor
-                    quality = "Major" if "Major" in key_part else "Minor"
-                    display_text = f"{new_key_name} {quality} ({camelot_part}) {self.key_transpose:+d}st"
-                    break
+            # Calculate transposed key from the parts parsed when detected_key was set
+            i = self._detected_root_index
+            if i is not None:
+                # Calculate new key index
+                new_key_name = _KEY_NAMES[(i + self.key_transpose) % 12]
+                
+                # Preserve Major/Minor
+                display_text = f"{new_key_name} {self._detected_quality} ({self._detected_camelot_part}) {self.key_transpose:+d}st"
             else:
                 # Fallback if key name not recognized
                 display_text = f"{self.detected_key} {self.key_transpose:+d}st"
@@ -1501,16 +2669,17 @@ class DeckWidget(GlassWidget):
         # Color code based on transpose state and confidence
         if self.key_transpose != 0:
             # Key is transposed/synced - use cyan/blue to indicate sync
-            self.key_display_label.setStyleSheet(
-                "color: #00d4ff; font-weight: bold; "
-                "text-shadow: 0 0 10px rgba(0, 212, 255, 0.6);"
-            )
+            style = _KEY_STYLE_TRANSPOSED
         elif self.key_confidence > 0.7:
-            self.key_display_label.setStyleSheet("color: #00ff00;")  # Green for high confidence
+            style = _KEY_STYLE_HIGH_CONFIDENCE  # Green for high confidence
         elif self.key_confidence > 0.5:
-            self.key_display_label.setStyleSheet("color: #ffff00;")  # Yellow for medium confidence
+            style = _KEY_STYLE_MEDIUM_CONFIDENCE  # Yellow for medium confidence
         else:
-            self.key_display_label.setStyleSheet("color: #ff6600;")  # Orange for low confidence
+            style = _KEY_STYLE_LOW_CONFIDENCE  # Orange for low confidence
+        # Re-applying a stylesheet re-polishes the label, so only do it when the style changes
+        if style != self._last_key_style:
+            self._last_key_style = style
+            self.key_display_label.setStyleSheet(style)
 
     def set_deck_tempo_instant(self, new_bpm):
         """
@@ -1521,7 +2690,7 @@ class DeckWidget(GlassWidget):
             new_bpm (int): The new BPM to set.
         """
         if self.original_bpm == 0 or not self.original_file_path:
-            print(f"Deck {self.deck_number}: Cannot set tempo - no file loaded")
+            logger.warning("Deck %d: Cannot set tempo - no file loaded", self.deck_number)
             return
         
         try:
@@ -1529,29 +2698,37 @@ class DeckWidget(GlassWidget):
             playback_rate = new_bpm / self.original_bpm
             playback_rate = max(0.5, min(playback_rate, 2.0))  # Limit to reasonable range
             
-            # Apply instantly via QMediaPlayer
-            self.player.setPlaybackRate(playback_rate)
+            # Compare against the player's own rate - scratching and beat nudging also set it
+            rate_unchanged = abs(playback_rate - self.player.playbackRate()) < 1e-4
+            if rate_unchanged and new_bpm == self.current_bpm:
+                return
             
-            # Update UI - BPM display and tempo slider
-            self.current_bpm = new_bpm
-            self.tempo_text.setText(str(new_bpm))
+            # Apply instantly via QMediaPlayer - skip no-op writes, which can reconfigure the audio pipeline
+            if not rate_unchanged:
+                self.player.setPlaybackRate(playback_rate)
             
-            # Update tempo slider to reflect the new BPM
+            # Update UI - BPM display and tempo slider, painted together
+            self.current_bpm = new_bpm
             tempo_change_percent = ((new_bpm - self.original_bpm) / self.original_bpm) * 100
-            # Block signals to prevent triggering tempo_changed while updating
-            self.tempo_slider.blockSignals(True)
-            self.tempo_slider.setValue(int(tempo_change_percent))
-            self.tempo_slider.blockSignals(False)
-            
-            # Update the tempo percentage label
-            if hasattr(self, 'tempo_percent_label'):
+            slider_value = int(tempo_change_percent)
+            with self._tempo_ui_batch():
+                self.tempo_text.setText(str(new_bpm))
+                
+                # Update tempo slider to reflect the new BPM
+                if slider_value != self.tempo_slider.value():
+                    # Block signals to prevent triggering tempo_changed while updating
+                    self.tempo_slider.blockSignals(True)
+                    self.tempo_slider.setValue(slider_value)
+                    self.tempo_slider.blockSignals(False)
+                
+                # Update the tempo percentage label
                 self.tempo_percent_label.setText(f"{tempo_change_percent:+.1f}%")
             
-            print(f"Deck {self.deck_number}: ⚡ INSTANT tempo set to {new_bpm} BPM (rate: {playback_rate:.2f}x, slider: {tempo_change_percent:+.1f}%)")
+            logger.debug("Deck %d: ⚡ INSTANT tempo set to %s BPM (rate: %.2fx, slider: %+.1f%%)", self.deck_number, new_bpm, playback_rate, tempo_change_percent)
             
         except Exception as e:
-            print(f"Deck {self.deck_number}: Error setting instant tempo: {e}")
-            traceback.print_exc()
+            logger.warning("Deck %d: Error setting instant tempo: %s", self.deck_number, e)
+            if logger.isEnabledFor(logging.DEBUG): traceback.print_exc()
     
     def set_deck_tempo(self, new_bpm, target_position_after_load=None):
         """
@@ -1562,29 +2739,29 @@ class DeckWidget(GlassWidget):
             target_position_after_load (int, optional): Position to seek to after loading.
         """
         if self.original_bpm <= 0: 
-            print(f"Deck {self.deck_number}: Original BPM unknown, cannot set tempo."); return
+            logger.warning("Deck %d: Original BPM unknown, cannot set tempo.", self.deck_number); return
         if not self.audio_analyzer or not self.audio_analyzer.is_available():
-            QMessageBox.warning(self, "Tempo Change Failed", "Audio Analyzer unavailable."); return
+            self._notify("Tempo Change Failed", "Audio Analyzer unavailable."); return
         
         # Crucially, the tempo change should ALWAYS be based on the true original file
         if not self.original_file_path or not os.path.exists(self.original_file_path):
-            QMessageBox.warning(self, "Tempo Change Failed", "Original audio file for this deck is missing or not loaded."); return
+            self._notify("Tempo Change Failed", "Original audio file for this deck is missing or not loaded."); return
         
         # Store the original file path to prevent it from being overwritten
         original_file_for_processing = self.original_file_path
         
         # Get duration from the original file for an accurate basis, not player's current duration if it's already processed
         try:
-            info = sf.info(original_file_for_processing)
+            info = self._get_original_info()
             original_dur_ms_from_file = info.duration * 1000
             if original_dur_ms_from_file <= 0:
-                print(f"Deck {self.deck_number}: Original track duration from file info is zero or invalid."); return
+                logger.warning("Deck %d: Original track duration from file info is zero or invalid.", self.deck_number); return
         except Exception as e_info:
-            print(f"Deck {self.deck_number}: Could not get duration from original file info: {e_info}. Player duration: {self.player.duration()}")
+            logger.warning("Deck %d: Could not get duration from original file info: %s. Player duration: %s", self.deck_number, e_info, self.player.duration())
             # Fallback to player duration if info fails, but this might be from a processed file
             original_dur_ms_from_file = self.player.duration()
             if original_dur_ms_from_file <= 0:
-                print(f"Deck {self.deck_number}: Track duration unknown after fallback."); return
+                logger.warning("Deck %d: Track duration unknown after fallback.", self.deck_number); return
 
         # Calculate stretch factor for FFT time stretching:
         # The correct mathematical relationship:
@@ -1596,7 +2773,7 @@ class DeckWidget(GlassWidget):
         # The calculation original_bpm / new_bpm provides the correct factor for this behavior.
         stretch_factor = self.original_bpm / new_bpm
         if not (0.25 <= stretch_factor <= 4.0): # SoundStretch limits
-            QMessageBox.warning(self, "Tempo Change Failed", f"Requested BPM {new_bpm} (factor {stretch_factor:.2f}) is out of reasonable range for original {self.original_bpm}."); return
+            self._notify("Tempo Change Failed", f"Requested BPM {new_bpm} (factor {stretch_factor:.2f}) is out of reasonable range for original {self.original_bpm}."); return
 
         # current_pos_ms should be relative to the current playback, which might be of a processed file.
         # We need to map this position back to the original file's timeline if possible, or use fraction.
@@ -1604,7 +2781,7 @@ class DeckWidget(GlassWidget):
         current_player_dur_ms = self.player.duration() # Duration of currently playing media
         pos_fraction = current_player_pos_ms / current_player_dur_ms if current_player_dur_ms > 0 else 0
         
-        was_playing = (self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState)
+        was_playing = (self.player.playbackState() == _PS_PLAYING)
         
         # Calculate target position for worker based on the *original* file's duration
         if target_position_after_load is None:
@@ -1616,28 +2793,24 @@ class DeckWidget(GlassWidget):
             target_pos_for_worker = target_position_after_load # Use provided if available (e.g., for beat sync)
 
         QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
-        temp_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp_tempo")
+        temp_dir = _TEMPO_TEMP_DIR
         try:
-            os.makedirs(temp_dir, exist_ok=True)
             # Create ASCII-safe filename to avoid encoding issues with Hebrew/Unicode characters
             original_name = os.path.splitext(os.path.basename(original_file_for_processing))[0]
-            # Only keep ASCII alphanumeric characters, spaces, underscores, and hyphens
-            safe_base = "".join(c for c in original_name if c.isascii() and (c.isalnum() or c in (' ', '_', '-'))).strip()
-            # If no safe characters remain, use a generic identifier
-            if not safe_base:
-                safe_base = "track"
+            # Only keep ASCII alphanumeric characters, spaces, underscores, and hyphens;
+            # if no safe characters remain, use a generic identifier
+            safe_base = _UNSAFE_FILENAME_CHARS.sub('', original_name).strip() or "track"
             # More unique filename for temp tempo file with ASCII-safe name
-            temp_output_file = os.path.join(temp_dir, f"deck{self.deck_number}_{safe_base[:20]}_{int(time.time()*1000)}_{new_bpm}bpm.wav")
-            
-            # Cleanup old *tempo* files for THIS deck
-            for f_name in os.listdir(temp_dir):
-                if f_name.startswith(f"deck{self.deck_number}_") and f_name.endswith(".wav") and f_name != os.path.basename(temp_output_file):
-                    try:
-                         os.remove(os.path.join(temp_dir, f_name))
-                         print(f"Deck {self.deck_number}: Cleaned old tempo file: {f_name}") 
-                    except OSError as e_del: print(f"Deck {self.deck_number}: Could not clean old tempo file {f_name}: {e_del}")
+            temp_output_file = os.path.join(temp_dir, f"deck{self.deck_number}_{safe_base[:20]}_{int(time.time()*1000)}_{new_bpm}{_TEMPO_FILE_SUFFIX}")
+            
+            # Cleanup old *tempo* files for THIS deck in the background, keeping the one
+            # still playing (and any key-shift base) until the new render replaces it
+            deck_number = self.deck_number
+            keep_names = frozenset(os.path.basename(path) for path in
+                                   (temp_output_file, self.temp_file, self._key_base_file) if path)
+            QThreadPool.globalInstance().start(lambda: _cleanup_old_tempo_files(temp_dir, deck_number, keep_names))
         except Exception as e:
-            print(f"Deck {self.deck_number}: Error creating temp dir/filename for tempo: {e}")
+            logger.warning("Deck %d: Error creating temp dir/filename for tempo: %s", self.deck_number, e)
             QApplication.restoreOverrideCursor()
             return
 
@@ -1645,16 +2818,17 @@ class DeckWidget(GlassWidget):
             if was_playing: self.player.pause()
             
             # Pass the original file path and its true duration in seconds for processing
-            self.tempo_worker = TempoChangeWorker(self.deck_number, self.audio_analyzer, original_file_for_processing, temp_output_file, stretch_factor, original_dur_ms_from_file / 1000.0, new_bpm, target_pos_for_worker, was_playing)
-            self.tempo_worker.finished.connect(self._handle_tempo_change_finished)
-            self.tempo_worker.error.connect(self._handle_tempo_change_error)
-            self.tempo_worker.start()
+            self.tempo_worker.configure(self.audio_analyzer, original_file_for_processing, temp_output_file, stretch_factor, original_dur_ms_from_file / 1000.0, new_bpm, target_pos_for_worker, was_playing)
+            if not self.tempo_worker.submit():
+                logger.debug("Deck %d: Tempo change already in progress, ignoring request for %s BPM", self.deck_number, new_bpm)
+                QApplication.restoreOverrideCursor()
+                if was_playing: self.player.play()
+                return
             self.tempoProcessing.emit(True)
             self.set_controls_enabled(False)
         except Exception as e: 
-            print(f"Deck {self.deck_number}: Exception starting tempo worker: {e}")
-            QMessageBox.critical(self, "Tempo Error", f"Error processing tempo: {e}")
-            self.tempo_worker = None
+            logger.warning("Deck %d: Exception starting tempo worker: %s", self.deck_number, e)
+            self._notify("Tempo Error", f"Error processing tempo: {e}", "error")
             self.set_controls_enabled(True)
             self.tempoProcessing.emit(False)
             QApplication.restoreOverrideCursor()
@@ -1676,7 +2850,6 @@ class DeckWidget(GlassWidget):
         QApplication.restoreOverrideCursor()
         self.set_controls_enabled(True)
         self.tempoProcessing.emit(False)
-        self.tempo_worker = None
 
         if success and os.path.exists(temp_file_path) and os.path.getsize(temp_file_path) > 0:
              # Store the original file path to prevent it from being overwritten during processing
@@ -1687,30 +2860,28 @@ class DeckWidget(GlassWidget):
              self.track_label.setText(f"{get_display_filename(preserved_original_file)} ({self.current_bpm} BPM)")
              
              self._resume_after_load = was_playing_flag
-             try:
-                 audio_data, sr = sf.read(temp_file_path, dtype='float32')
-                 self._eq_buffer = audio_data
-                 self._eq_buffer_rate = sr
-                 
-                 # Scale beat positions to match the new tempo
-                 # With the corrected stretch factor calculation: stretch_factor = original_bpm / new_bpm
-                 # Beat positions need to be scaled by the stretch factor itself: original_bpm / new_bpm
-                 if self.beat_positions and self.original_bpm > 0:
-                     beat_scale_factor = self.original_bpm / target_bpm
-                     scaled_beat_positions = [int(beat_ms * beat_scale_factor) for beat_ms in self.beat_positions]
-                 else:
-                     scaled_beat_positions = self.beat_positions
-                 
-                 self.waveform.set_waveform_data(audio_data, sr, scaled_beat_positions)
-                 self.spectrogram.set_spectrum_data(audio_data, sr)
-                 
-             except Exception as e_read:
-                 print(f"Deck {self.deck_number}: Failed to read new tempo file for EQ buffer and waveform: {e_read}")
-                 self._eq_buffer = None
-                 self._eq_buffer_rate = None
+
+             # Scale beat positions to match the new tempo
+             # With the corrected stretch factor calculation: stretch_factor = original_bpm / new_bpm
+             # Beat positions need to be scaled by the stretch factor itself: original_bpm / new_bpm
+             if self.beat_positions and self.original_bpm > 0:
+                 beat_scale_factor = self.original_bpm / target_bpm
+                 self._tempo_scaled_beats = (self._beat_positions_np * beat_scale_factor).astype(np.int64).tolist()
+             else:
+                 self._tempo_scaled_beats = self.beat_positions
+
+             # Decode the new file for the EQ buffer and displays in the background;
+             # playback is set up below without waiting for it
+             self._eq_buffer = None
+             self._eq_buffer_rate = None
+             self._tempo_load_seq += 1
+             QThreadPool.globalInstance().start(
+                 TempoAudioLoadWorker(self._tempo_load_signals, self._tempo_load_seq, temp_file_path))
 
              self._cleanup_temp_file() # Clean the *previous* self.temp_file
              self.temp_file = temp_file_path # This is the new main playable file
+             if self.key_transpose != 0:
+                 self._key_shift_debounce.start()  # Re-apply the transposition to the new file
 
              # Check if EQ settings are non-neutral and need to be reapplied
              eq_is_not_neutral = (abs(self._eq_bass_gain - 1.0) > 0.01 or
@@ -1718,94 +2889,191 @@ class DeckWidget(GlassWidget):
                                  abs(self._eq_treble_gain - 1.0) > 0.01)
              
              if eq_is_not_neutral:
-                 print(f"Deck {self.deck_number}: Non-neutral EQ detected after tempo change - Bass: {self._eq_bass_gain:.2f}, Mid: {self._eq_mid_gain:.2f}, Treble: {self._eq_treble_gain:.2f}")
-                 print(f"Deck {self.deck_number}: Will reapply EQ to tempo-processed file")
+                 logger.debug("Deck %d: Non-neutral EQ detected after tempo change - Bass: %.2f, Mid: %.2f, Treble: %.2f", self.deck_number, self._eq_bass_gain, self._eq_mid_gain, self._eq_treble_gain)
+                 logger.debug("Deck %d: Will reapply EQ to tempo-processed file", self.deck_number)
                  
                  # Store the target position and playing state for after EQ reapplication
-                 self._pending_seek_position = target_position
-                 self._pending_resume_playback = was_playing_flag
+                 self._eq_reapply_pending = (target_position, was_playing_flag)
                  
                  # Set the source to the tempo-processed file first
-                 self.player.setSource(QUrl.fromLocalFile(self.temp_file))
+                 self._set_source_if_changed(self.temp_file)
                  
                  # Restore the original file path reference to prevent confusion
                  self.original_file_path = preserved_original_file
                  
-                 # Wait a bit for the tempo file to load, then apply EQ
-                 QTimer.singleShot(150, lambda: self._reapply_eq_after_tempo_change())
+                 # EQ is reapplied once the tempo file's audio has been decoded into the EQ
+                 # buffer (see _on_tempo_audio_loaded / _on_tempo_audio_load_error)
              else:
-                 print(f"Deck {self.deck_number}: EQ is neutral, no need to reapply after tempo change")
+                 logger.debug("Deck %d: EQ is neutral, no need to reapply after tempo change", self.deck_number)
                  
                  # Normal flow - just load the tempo-processed file
-                 self.player.setSource(QUrl.fromLocalFile(self.temp_file))
+                 self._set_source_if_changed(self.temp_file)
                  
                  # Restore the original file path reference to prevent confusion
                  self.original_file_path = preserved_original_file
                  
-                 QTimer.singleShot(100, lambda: self._check_media_and_seek_resume(target_position))
+                 self._check_media_and_seek_resume(target_position)
         else:
-             QMessageBox.warning(self, "Tempo Change Failed", f"Could not process audio to {target_bpm} BPM. File: {safe_filename_for_logging(temp_file_path)}")
-             if was_playing_flag and self.player.playbackState() != QMediaPlayer.PlaybackState.PlayingState: self.player.play()
+             self._notify("Tempo Change Failed", f"Could not process audio to {target_bpm} BPM. File: {safe_filename_for_logging(temp_file_path)}")
+             if was_playing_flag and self.player.playbackState() != _PS_PLAYING: self.player.play()
+
+    def _on_tempo_audio_loaded(self, load_seq, audio_data, sr):
+        """
+        Apply the decoded tempo-processed audio to the EQ buffer, waveform and spectrogram.
+
+        Args:
+            load_seq (int): Sequence number of the tempo change the audio belongs to.
+            audio_data (np.ndarray): Decoded audio samples.
+            sr (int): Sample rate in Hz.
+        """
+        if load_seq != self._tempo_load_seq:
+            return  # A newer tempo change superseded this one
+        self._eq_buffer = audio_data
+        self._eq_buffer_rate = sr
+        try:
+            self.waveform.set_waveform_data(audio_data, sr, self._tempo_scaled_beats)
+            self.spectrogram.set_spectrum_data(audio_data, sr)
+        except Exception as e:
+            logger.warning("Deck %d: Failed to update displays from new tempo file: %s", self.deck_number, e)
+        if self._eq_reapply_pending is not None:
+            self._reapply_eq_after_tempo_change()
+
+    def _on_tempo_audio_load_error(self, load_seq, error_message):
+        """
+        Handle a failed read of the tempo-processed file.
+
+        Args:
+            load_seq (int): Sequence number of the tempo change the load belongs to.
+            error_message (str): Error message.
+        """
+        if load_seq != self._tempo_load_seq:
+            return
+        logger.warning("Deck %d: Failed to read new tempo file for EQ buffer and waveform: %s", self.deck_number, error_message)
+        self._eq_buffer = None
+        self._eq_buffer_rate = None
+        if self._eq_reapply_pending is not None:
+            self._reapply_eq_after_tempo_change()  # EQ falls back to reading the tempo file itself
 
     def _reapply_eq_after_tempo_change(self):
         """
         Reapply current EQ settings to the tempo-processed file after tempo change.
         """
+        # Position info preserved by the tempo change
+        target_position, should_resume = self._eq_reapply_pending
+        self._eq_reapply_pending = None
         try:
-            print(f"Deck {self.deck_number}: Reapplying EQ after tempo change")
-            
-            # Store position info before applying EQ
-            target_position = getattr(self, '_pending_seek_position', None)
-            should_resume = getattr(self, '_pending_resume_playback', False)
-            
-            print(f"Deck {self.deck_number}: Preserved position for EQ reapplication: {target_position}ms, Resume: {should_resume}")
-            
-            # Clear the pending attributes
-            if hasattr(self, '_pending_seek_position'):
-                delattr(self, '_pending_seek_position')
-            if hasattr(self, '_pending_resume_playback'):
-                delattr(self, '_pending_resume_playback')
+            logger.debug("Deck %d: Reapplying EQ after tempo change", self.deck_number)
+            logger.debug("Deck %d: Preserved position for EQ reapplication: %sms, Resume: %s", self.deck_number, target_position, should_resume)
             
             # Apply EQ to the current tempo-processed file, passing the target position
             self._apply_eq(reset_transitions=False, target_position_after_eq=target_position, resume_after_eq=should_resume)
             
         except Exception as e:
-            print(f"Deck {self.deck_number}: Error reapplying EQ after tempo change: {e}")
+            logger.warning("Deck %d: Error reapplying EQ after tempo change: %s", self.deck_number, e)
             # Fallback to normal tempo completion
-            target_position = getattr(self, '_pending_seek_position', None)
-            should_resume = getattr(self, '_pending_resume_playback', False)
-            QTimer.singleShot(100, lambda: self._check_media_and_seek_resume(target_position, should_resume))
+            self._check_media_and_seek_resume(target_position, should_resume)
 
     def _check_media_and_seek_resume(self, target_position, should_resume=None):
         """
-        Check if media is loaded and seek/resume playback after tempo change.
+        Seek/resume playback after a tempo, key or EQ change once the processed media is loaded. If it is
+        still loading, the work is finished by _on_seek_resume_media_status when the player
+        reports the status change.
 
         Args:
             target_position (int): Position to seek to after loading.
             should_resume (bool, optional): Override for resume playback state.
         """
+        status = self.player.mediaStatus()
+        if self._source_load_pending:
+            # Whatever mediaStatus() says may still belong to the previous source
+            self._pending_seek_resume = (target_position, should_resume)
+            self._seek_resume_timeout.start()
+        elif status in _MS_READY:
+            self._pending_seek_resume = None
+            self._seek_resume_timeout.stop()
+            self._seek_and_resume(target_position, should_resume)
+        elif status in _MS_PENDING:
+            self._pending_seek_resume = (target_position, should_resume)
+            self._seek_resume_timeout.start()
+        else:
+            self._pending_seek_resume = None
+            self._seek_resume_timeout.stop()
+            self._report_seek_resume_failure(status)
+
+    def _on_seek_resume_media_status(self, status):
+        """
+        Finish a pending seek/resume when the processed media becomes ready or fails.
+
+        Args:
+            status (QMediaPlayer.MediaStatus): The new media status.
+        """
+        if status in _MS_PENDING:
+            return  # Transient - wait for the next status change
+        self._source_load_pending = False
+        if self._pending_seek_resume is None:
+            return
+        target_position, should_resume = self._pending_seek_resume
+        self._pending_seek_resume = None
+        self._seek_resume_timeout.stop()
+        if status in _MS_READY:
+            self._seek_and_resume(target_position, should_resume)
+        else:
+            self._report_seek_resume_failure(status)
+
+    def _on_seek_resume_timeout(self):
+        """
+        Give up on a pending seek/resume if the processed media never finished loading.
+        """
+        if self._pending_seek_resume is None:
+            return
+        target_position, should_resume = self._pending_seek_resume
+        self._pending_seek_resume = None
+        self._source_load_pending = False
+        status = self.player.mediaStatus()
+        if status in _MS_READY:
+            # The status change was missed, e.g. the backend reported the new source ready
+            # without passing through a loading state
+            self._seek_and_resume(target_position, should_resume)
+        else:
+            self._report_seek_resume_failure(status)
+
+    def _seek_and_resume(self, target_position, should_resume):
+        """
+        Seek to the target position on the loaded media and resume playback if requested.
+
+        Args:
+            target_position (int): Position to seek to.
+            should_resume (bool, optional): Override for resume playback state.
+        """
         # Use the override if provided, otherwise use the stored state
         resume_playback = should_resume if should_resume is not None else self._resume_after_load
-        
-        status = self.player.mediaStatus()
-        if status == QMediaPlayer.MediaStatus.LoadedMedia or status == QMediaPlayer.MediaStatus.BufferedMedia:
-            new_duration = self.player.duration()
-            self.update_duration(new_duration)
-            
-            if target_position is not None and new_duration > 0:
-                safe_target_pos = max(0, min(int(target_position), int(new_duration)))
+
+        new_duration = self.player.duration()
+        self.update_duration(new_duration)
+
+        if target_position is not None and new_duration > 0:
+            safe_target_pos = max(0, min(int(target_position), int(new_duration)))
+            # Skip redundant seeks; they flush the decoder and can click
+            if abs(safe_target_pos - self.player.position()) >= _SEEK_TOLERANCE_MS:
                 self.player.setPosition(safe_target_pos)
-                self.update_position(safe_target_pos)
+            self.update_position(safe_target_pos)
 
-            if resume_playback:
-                self.player.play()
-            self._resume_after_load = False
-        elif status in [QMediaPlayer.MediaStatus.LoadingMedia, QMediaPlayer.MediaStatus.StalledMedia, 
-                           QMediaPlayer.MediaStatus.BufferingMedia, QMediaPlayer.MediaStatus.NoMedia]:
-            QTimer.singleShot(100, lambda: self._check_media_and_seek_resume(target_position, should_resume))
-        else: 
-            QMessageBox.warning(self, "Playback Error", f"Failed to load processed audio (Status: {status.value if hasattr(status, 'value') else status}).")
-            self._resume_after_load = False
+        if resume_playback:
+            self.player.play()
+        self._resume_after_load = False
+
+    def _report_seek_resume_failure(self, status):
+        """
+        Warn that the processed media failed to load.
+
+        Args:
+            status (QMediaPlayer.MediaStatus): The media status at failure.
+        """
+        self._notify("Playback Error", f"Failed to load processed audio (Status: {status.value if hasattr(status, 'value') else status}).")
+        self._resume_after_load = False
+        if self.temp_file and is_eq_cache_file(self.temp_file):
+            # "EQ Applied" was already shown for this render - replace it with the failure
+            self._show_eq_error("EQ Load Error ✗")
 
     def _handle_tempo_change_error(self, deck_num, error_message):
         """
@@ -1817,9 +3085,9 @@ class DeckWidget(GlassWidget):
         """
         if deck_num != self.deck_number: return
         QApplication.restoreOverrideCursor(); 
-        QMessageBox.critical(self, "Tempo Change Error", f"Error processing tempo: {error_message}")
-        self.tempo_worker = None; self.set_controls_enabled(True); self.tempoProcessing.emit(False)
-        if self._resume_after_load and self.player.playbackState() != QMediaPlayer.PlaybackState.PlayingState:
+        self._notify("Tempo Change Error", f"Error processing tempo: {error_message}", "error")
+        self.set_controls_enabled(True); self.tempoProcessing.emit(False)
+        if self._resume_after_load and self.player.playbackState() != _PS_PLAYING:
              self.player.play()
         self._resume_after_load = False
 
@@ -1830,24 +3098,8 @@ class DeckWidget(GlassWidget):
         Args:
             enabled (bool): Whether to enable or disable controls.
         """
-        self.play_btn.setEnabled(enabled)
-        self.volume_slider.setEnabled(enabled)
-        if self.tempo_text and isinstance(self.tempo_text.parentWidget(), QWidget):
-            self.tempo_text.parentWidget().setEnabled(enabled)
-        self.progress.setEnabled(enabled)
-        self.turntable.setEnabled(enabled)
-        if self.sync_button:
-            self.sync_button.setEnabled(enabled)
-        self.bass_knob.setEnabled(enabled)
-        self.mid_knob.setEnabled(enabled)
-        self.treble_knob.setEnabled(enabled)
-        # Add loop controls
-        self.loop_button.setEnabled(enabled)
-        self.loop_start_input.setEnabled(enabled)
-        self.loop_length_input.setEnabled(enabled)
-        if self.bass_knob and isinstance(self.bass_knob.parentWidget(), QWidget) and \
-           isinstance(self.bass_knob.parentWidget().parentWidget(), QWidget):
-            self.bass_knob.parentWidget().parentWidget().setEnabled(enabled)
+        for widget in self._enableable_widgets:
+            widget.setEnabled(enabled)
 
     def handle_volume_change(self, value):
         """
@@ -1863,48 +3115,18 @@ class DeckWidget(GlassWidget):
             # Update volume display text
             self.volume_display.setText(f"{value}%")
             
-            # Dynamic color based on volume level
-            if value == 0:
-                # OFF style - grayed out when muted
-                self.volume_display.setStyleSheet(
-                    "font-size: 10px; font-weight: bold; "
-                    "color: #444444; "
-                    "background: rgba(40, 40, 40, 0.4); "
-                    "border: 1px solid rgba(80, 80, 80, 0.3); "
-                    "border-radius: 4px; padding: 2px 4px;"
-                )
-            elif value < 30:
-                # Low volume - dim cyan
-                self.volume_display.setStyleSheet(
-                    "font-size: 10px; font-weight: bold; "
-                    "color: #00d4ff; "
-                    "background: rgba(0, 212, 255, 0.1); "
-                    "border-radius: 4px; padding: 2px 4px;"
-                )
-            elif value < 70:
-                # Medium volume - bright cyan
-                self.volume_display.setStyleSheet(
-                    "font-size: 10px; font-weight: bold; "
-                    "color: #00d4ff; "
-                    "background: rgba(0, 212, 255, 0.15); "
-                    "border-radius: 4px; padding: 2px 4px; "
-                    "text-shadow: 0 0 5px rgba(0, 212, 255, 0.4);"
-                )
-            else:
-                # High volume - BRIGHT YELLOW (warning)
-                self.volume_display.setStyleSheet(
-                    "font-size: 10px; font-weight: bold; "
-                    "color: #f3cf2c; "
-                    "background: rgba(243, 207, 44, 0.2); "
-                    "border: 1px solid rgba(243, 207, 44, 0.3); "
-                    "border-radius: 4px; padding: 2px 4px; "
-                    "text-shadow: 0 0 10px rgba(243, 207, 44, 0.7);"
-                )
+            # Dynamic color based on volume level - restyle only when the level bucket changes
+            bucket = (value > 0) + (value >= 30) + (value >= 70)
+            if bucket != self._last_vol_bucket:
+                self._last_vol_bucket = bucket
+                self.volume_display.setProperty("volLevel", _VOL_LEVELS[bucket])
+                self.volume_display.style().unpolish(self.volume_display)
+                self.volume_display.style().polish(self.volume_display)
             
             self.volumeChanged.emit()
         except Exception as e: 
-            print(f"Deck {self.deck_number}: Error in handle_volume_change: {e}")
-            traceback.print_exc()
+            logger.warning("Deck %d: Error in handle_volume_change: %s", self.deck_number, e)
+            if logger.isEnabledFor(logging.DEBUG): traceback.print_exc()
     
     def handle_tempo_slider_change(self, value):
         """
@@ -1916,27 +3138,56 @@ class DeckWidget(GlassWidget):
         if self.original_bpm == 0:
             return
         
+        # Update percent label right away; the tempo itself is applied once the fader settles
+        self.tempo_percent_label.setText(f"{value:+d}%")
+        self._pending_tempo_slider_value = value
+        if self._tempo_slider_bpm(value) == self.current_bpm:
+            self._tempo_slider_debounce.stop()  # Back at the playing tempo - nothing to apply
+            return
+        self._tempo_slider_debounce.start()
+
+    def _tempo_slider_bpm(self, value):
+        """
+        Map a tempo fader position to the BPM it selects.
+
+        Args:
+            value (int): Tempo adjustment in percent.
+
+        Returns:
+            int: Target BPM, clamped to the valid range.
+        """
+        new_bpm = int(self.original_bpm * (1.0 + value / 100.0))
+        return max(20, min(new_bpm, 300))  # Clamp to valid range
+
+    def _flush_tempo_slider_now(self):
+        """
+        Apply a pending tempo fader value immediately when the fader is released.
+        """
+        if self._tempo_slider_debounce.isActive():
+            self._tempo_slider_debounce.stop()
+            self._apply_tempo_slider()
+
+    def _apply_tempo_slider(self):
+        """
+        Apply the latest tempo fader value to the deck tempo and any synced slave deck.
+        """
+        if self.original_bpm == 0:
+            return
+        value = self._pending_tempo_slider_value
         try:
-            # Update percent label
-            self.tempo_percent_label.setText(f"{value:+d}%")
-            
             # Calculate new BPM based on percentage
-            percent_change = value / 100.0
-            new_bpm = int(self.original_bpm * (1.0 + percent_change))
-            new_bpm = max(20, min(new_bpm, 300))  # Clamp to valid range
+            new_bpm = self._tempo_slider_bpm(value)
             
             # Apply instantly if different from current
             if new_bpm != self.current_bpm:
                 self.set_deck_tempo_instant(new_bpm)
                 
                 # Update sync if this is master
-                if self.main_app and hasattr(self.main_app, 'sync_master') and self.main_app.sync_master == self.deck_number:
-                    if hasattr(self.main_app, 'sync_slave_deck_tempo'):
-                        self.main_app.sync_slave_deck_tempo(new_bpm)
+                self._sync_slaves_if_master(new_bpm)
                         
         except Exception as e:
-            print(f"Deck {self.deck_number}: Error in handle_tempo_slider_change: {e}")
-            traceback.print_exc()
+            logger.warning("Deck %d: Error applying tempo slider change: %s", self.deck_number, e)
+            if logger.isEnabledFor(logging.DEBUG): traceback.print_exc()
 
     def get_current_volume(self):
         """
@@ -1967,15 +3218,56 @@ class DeckWidget(GlassWidget):
     @is_playing.setter
     def is_playing(self, value):
         """
-        Set the playing state and update the play button text.
+        Set the playing state, update the play button text and emit playingChanged on a change.
 
         Args:
             value (bool): Playing state.
         """
         changed = self._is_playing != value
         self._is_playing = value
-        if changed and hasattr(self, 'play_btn'): 
-            self.play_btn.setText("Pause" if value else "Play")
+        if changed:
+            if self.play_btn is not None:
+                self.play_btn.setText("Pause" if value else "Play")
+            self.playingChanged.emit(value)
+
+    @property
+    def beat_positions(self):
+        """
+        list[int]: Beat positions of the loaded track in milliseconds.
+        """
+        return self._beat_positions
+    @beat_positions.setter
+    def beat_positions(self, value):
+        """
+        Set the beat positions and refresh the int32 array used for beat lookups.
+
+        Args:
+            value (list[int]): Beat positions in milliseconds.
+        """
+        self._beat_positions = value if value is not None else []
+        self._beat_positions_np = np.asarray(self._beat_positions, dtype=np.int32)
+
+    @property
+    def detected_key(self):
+        """
+        str: Detected musical key of the loaded track, e.g. "C Major (8B)".
+        """
+        return self._detected_key
+    @detected_key.setter
+    def detected_key(self, value):
+        """
+        Set the detected key and pre-parse the parts _update_key_display needs.
+
+        Args:
+            value (str): Key string in the form "<root> <quality> (<camelot>)".
+        """
+        self._detected_key = value or ""
+        key_part = self._detected_key.split("(")[0].strip()  # "C Major" part
+        self._detected_camelot_part = self._detected_key.split("(")[-1].strip(")")  # "8B" part
+        # Extract root note from key (sharp roots first so "C#" isn't read as "C")
+        root = key_part[:2] if len(key_part) >= 2 and key_part[1] == '#' else key_part[:1]
+        self._detected_root_index = _KEY_INDEX.get(root)
+        self._detected_quality = "Major" if "Major" in key_part else "Minor"
 
 
 
@@ -1989,7 +3281,7 @@ class DeckWidget(GlassWidget):
         try:
             rate = max(0.5, min(1.0 + (pitch_percent / 100.0), 2.0))
             self.player.setPlaybackRate(rate)
-        except Exception as e: print(f"Deck {self.deck_number}: Error adjusting playback rate: {e}"); traceback.print_exc()
+        except Exception as e: logger.warning("Deck %d: Error adjusting playback rate: %s", self.deck_number, e, exc_info=logger.isEnabledFor(logging.DEBUG))
 
     def handle_bpm_input(self):
         """
@@ -2003,16 +3295,14 @@ class DeckWidget(GlassWidget):
                 QMessageBox.warning(self, "Invalid BPM", "BPM must be between 20 and 300.")
                 self.tempo_text.setText(str(self.current_bpm)); return
             if new_bpm == self.current_bpm: return
-            print(f"Deck {self.deck_number}: ⚡ INSTANT BPM entered via text: {new_bpm}")
-            if self.main_app and hasattr(self.main_app, 'sync_master') and self.main_app.sync_master == self.deck_number:
-                if hasattr(self.main_app, 'sync_slave_deck_tempo'):
-                    self.main_app.sync_slave_deck_tempo(new_bpm)
+            logger.debug("Deck %d: ⚡ INSTANT BPM entered via text: %s", self.deck_number, new_bpm)
+            self._sync_slaves_if_master(new_bpm)
             self.set_deck_tempo_instant(new_bpm)
         except ValueError: 
             QMessageBox.warning(self, "Invalid Input", "Please enter a valid number for BPM.")
             self.tempo_text.setText(str(self.current_bpm))
         except Exception as e: 
-            print(f"Deck {self.deck_number}: Error handling BPM input: {e}"); self.tempo_text.setText(str(self.current_bpm))
+            logger.warning("Deck %d: Error handling BPM input: %s", self.deck_number, e); self.tempo_text.setText(str(self.current_bpm))
     
     def handle_vinyl_scratch(self, scratch_speed):
         """
@@ -2022,19 +3312,16 @@ class DeckWidget(GlassWidget):
         Args:
             scratch_speed (float): Scratch speed multiplier (-10 to +10).
         """
-        try:
-            # Apply scratch speed directly to playback rate
-            # Clamp to reasonable playback range
-            scratch_rate = max(0.1, min(3.0, abs(scratch_speed)))
-            
-            # Handle direction (negative = backwards, positive = forwards)
-            if scratch_speed < 0:
-                scratch_rate = -scratch_rate
-            
-            # Set playback rate instantly for responsive scratching
-            self.player.setPlaybackRate(scratch_rate)
-        except Exception as e:
-            print(f"Deck {self.deck_number}: Error in vinyl scratch: {e}")
+        # Apply scratch speed directly to playback rate, clamping its magnitude to a
+        # reasonable playback range (negative = backwards, positive = forwards)
+        rate = scratch_speed
+        if rate >= 0:
+            rate = _SCRATCH_RATE_MIN if rate < _SCRATCH_RATE_MIN else _SCRATCH_RATE_MAX if rate > _SCRATCH_RATE_MAX else rate
+        else:
+            rate = -_SCRATCH_RATE_MIN if rate > -_SCRATCH_RATE_MIN else -_SCRATCH_RATE_MAX if rate < -_SCRATCH_RATE_MAX else rate
+        
+        # Set playback rate instantly for responsive scratching
+        self.player.setPlaybackRate(rate)
     
     def handle_vinyl_stop_start(self, is_stopping):
         """
@@ -2050,52 +3337,106 @@ class DeckWidget(GlassWidget):
                 self.player.pause()
             else:
                 # Restore playback with smooth start
-                if self.player.playbackState() != QMediaPlayer.PlaybackState.PlayingState:
+                if self.player.playbackState() != _PS_PLAYING:
                     self.player.play()
         except Exception as e:
-            print(f"Deck {self.deck_number}: Error in vinyl stop/start: {e}")
+            logger.warning("Deck %d: Error in vinyl stop/start: %s", self.deck_number, e)
+
+    def _hide_eq_status(self):
+        """
+        Hide the EQ status label once its message has been shown long enough.
+        """
+        if self.eq_status_label is not None:
+            self.eq_status_label.setVisible(False)
+
+    def _schedule_eq(self):
+        """
+        Handle EQ knob changes by (re)starting the debounce timer, so a knob drag
+        results in a single EQ update once it settles.
+        """
+        self._eq_debounce.start()
+
+    def _flush_eq_now(self):
+        """
+        Apply a pending EQ change immediately when a knob is released.
+        """
+        if self._eq_debounce.isActive():
+            self._eq_debounce.stop()
+            self._apply_eq_now()
 
-    def _on_eq_changed(self):
+    def _apply_eq_now(self):
         """
-        Handle EQ knob changes with ZERO DELAY - instant response.
+        Apply the current EQ knob positions - instant volume-based response.
         """
         # Update internal gain values (0-200 -> 0.0-2.0)
-        self._eq_bass_gain = self.bass_knob.value() / 100.0
-        self._eq_mid_gain = self.mid_knob.value() / 100.0
-        self._eq_treble_gain = self.treble_knob.value() / 100.0
+        self._set_eq_gains(self.bass_knob.value() / 100.0,
+                           self.mid_knob.value() / 100.0,
+                           self.treble_knob.value() / 100.0)
         
         # ⚡ INSTANT EQ: Apply immediately with ZERO DELAY
         self._apply_eq_realtime_instant()
         
         # Update spectrogram EQ overlay (visual feedback only, doesn't affect audio)
-        try:
-            self.spectrogram.update_eq_gains(self._eq_bass_gain, self._eq_mid_gain, self._eq_treble_gain)
-        except:
-            pass  # Ignore visual errors, audio is what matters
+        self._queue_spectrogram_update((self._eq_bass_gain, self._eq_mid_gain, self._eq_treble_gain))
+
 
+    def _set_eq_gains(self, bass_gain, mid_gain, treble_gain):
+        """
+        Store the EQ band gains and their weighted average for the instant EQ.
+
+        Args:
+            bass_gain (float): Bass gain (0.0-2.0).
+            mid_gain (float): Mid gain (0.0-2.0).
+            treble_gain (float): Treble gain (0.0-2.0).
+        """
+        self._eq_bass_gain = bass_gain
+        self._eq_mid_gain = mid_gain
+        self._eq_treble_gain = treble_gain
+        # Weighted average gain (mid frequencies are most prominent)
+        self._eq_avg_gain = max(0.0, min(2.0, bass_gain * 0.25 + mid_gain * 0.50 + treble_gain * 0.25))
+
+    def _queue_spectrogram_update(self, gains, audio_data=None, sample_rate=None):
+        """
+        Schedule a spectrogram update, merging it with any update still waiting for
+        the next refresh.
+
+        Args:
+            gains (tuple): Bass, mid and treble gains for the EQ overlay.
+            audio_data (np.ndarray, optional): New spectrum audio, or None to keep the current one.
+            sample_rate (int, optional): Sample rate of audio_data.
+        """
+        if audio_data is None and self._pending_spec is not None:
+            audio_data, sample_rate = self._pending_spec[0], self._pending_spec[1]
+        self._pending_spec = (audio_data, sample_rate, gains)
+        if not self._spec_refresh_timer.isActive():
+            self._spec_refresh_timer.start()
+
+    def _refresh_spectrogram(self):
+        """
+        Push the latest pending spectrum data and EQ gains into the spectrogram.
+        """
+        pending, self._pending_spec = self._pending_spec, None
+        if pending is None:
+            return
+        audio_data, sample_rate, gains = pending
+        try:
+            if audio_data is not None:
+                self.spectrogram.set_spectrum_data(audio_data, sample_rate)
+            self.spectrogram.update_eq_gains(*gains)
+        except Exception as e:
+            logger.warning("Deck %d: Error updating spectrogram with EQ data: %s", self.deck_number, e)
 
     def _apply_eq_realtime_instant(self):
         """
         Apply EQ changes INSTANTLY with ZERO DELAY.
         Uses volume-based approximation for immediate response like professional DJ mixers.
         """
-        try:
-            # Calculate weighted average gain (mid frequencies are most prominent)
-            avg_gain = (self._eq_bass_gain * 0.25 + 
-                       self._eq_mid_gain * 0.50 + 
-                       self._eq_treble_gain * 0.25)
-            avg_gain = max(0.0, min(2.0, avg_gain))
-            
-            # Apply volume adjustment instantly (professional DJ mixer behavior)
-            current_volume = self._current_volume
-            effective_volume = max(0.0, min(1.0, current_volume * avg_gain))
-            
-            # ⚡ INSTANT APPLICATION - No delay, no processing, just works!
-            if hasattr(self, 'audio_output'):
-                self.audio_output.setVolume(effective_volume)
-            
-        except:
-            pass  # Fail silently to maintain zero-delay performance
+        # Apply volume adjustment instantly (professional DJ mixer behavior)
+        effective_volume = max(0.0, min(1.0, self._current_volume * self._eq_avg_gain))
+        
+        # ⚡ INSTANT APPLICATION - skipped when the output is already at this level
+        if self.audio_output is not None and abs(effective_volume - self.audio_output.volume()) >= 1e-3:
+            self.audio_output.setVolume(effective_volume)
     
     def _reset_eq(self):
         """
@@ -2104,257 +3445,208 @@ class DeckWidget(GlassWidget):
         Sets all EQ knobs back to their neutral position (100 = 1.0 gain)
         and forces the application of neutral EQ to actually reset the audio.
         """
-        print(f"Deck {self.deck_number}: Resetting EQ knobs to neutral")
+        logger.debug("Deck %d: Resetting EQ knobs to neutral", self.deck_number)
         
-        # Set knob values to neutral (100 = 1.0 gain)
-        self.bass_knob.setValue(100)
-        self.mid_knob.setValue(100)
-        self.treble_knob.setValue(100)
+        # Set knob values to neutral (100 = 1.0 gain) without triggering a scheduled
+        # EQ update per knob - the single apply below covers all three
+        with QSignalBlocker(self.bass_knob), QSignalBlocker(self.mid_knob), QSignalBlocker(self.treble_knob):
+            self.bass_knob.setValue(100)
+            self.mid_knob.setValue(100)
+            self.treble_knob.setValue(100)
+        self._eq_debounce.stop()  # Drop any update pending from a knob move just before the reset
         
         # Update internal gain values
-        self._eq_bass_gain = 1.0
-        self._eq_mid_gain = 1.0
-        self._eq_treble_gain = 1.0
+        self._set_eq_gains(1.0, 1.0, 1.0)
         
         # ⚡ Apply instantly first
         self._apply_eq_realtime_instant()
         
         # Reset EQ transitions in the Python equalizer
-        if hasattr(self, 'equalizer'):
+        if self.equalizer is not None:
             self.equalizer.reset_transitions()
         
         # Force application of neutral EQ to actually reset the audio
-        print(f"Deck {self.deck_number}: ⚡ Applying neutral EQ to reset audio (INSTANT)")
+        logger.debug("Deck %d: ⚡ Applying neutral EQ to reset audio (INSTANT)", self.deck_number)
         self._force_apply_neutral_eq()
         
-        print(f"Deck {self.deck_number}: ⚡ EQ reset completed")
+        logger.debug("Deck %d: ⚡ EQ reset completed", self.deck_number)
+
+    def _get_original_info(self):
+        """
+        Return the sf.info of the original file, reading it only when the cached
+        info is missing or belongs to another file.
+
+        Returns:
+            soundfile._SoundFileInfo: Info of original_file_path.
+        """
+        info = self._original_info
+        if info is None or info.name != self.original_file_path:
+            info = sf.info(self.original_file_path)
+            self._original_info = info
+        return info
 
     def _force_apply_neutral_eq(self):
         """
-        Force application of neutral EQ settings to reset audio to its base state.
+        Force application of neutral EQ settings to reset audio to its base state. When the
+        deck's tempo has no cached render, the time-stretch runs in the background and
+        playback carries on until _on_tempo_render_done loads the result.
         """
+        self._current_eq_job_id += 1  # A neutral reset supersedes any EQ render still running
         if not self.original_file_path or not os.path.exists(self.original_file_path):
-            print(f"Deck {self.deck_number}: No original file available for EQ reset")
+            logger.debug("Deck %d: No original file available for EQ reset", self.deck_number)
             return
 
-        # IMPORTANT: Capture the current position FIRST before any processing
-        # Get current playback state immediately to avoid position drift
-        was_playing = (self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState)
-        current_pos = self.player.position()
-        duration = self.player.duration()
-        
-        # Calculate actual time elapsed in seconds
-        time_elapsed_seconds = current_pos / 1000.0 if current_pos > 0 else 0.0
-        
-        # Validation: If we have almost no elapsed time but duration exists, something is wrong
-        if time_elapsed_seconds < 0.1 and duration > 1000:
-            print(f"Deck {self.deck_number}: WARNING - Very small elapsed time ({time_elapsed_seconds:.2f}s) with duration {duration}ms, position may not be valid")
-        
-        print(f"Deck {self.deck_number}: CAPTURED - Position: {current_pos}ms, Duration: {duration}ms, Time elapsed: {time_elapsed_seconds:.2f}s, Playing: {was_playing}")
-
-        # Don't proceed if we don't have valid position info and the track should have position
-        if current_pos <= 0 and duration > 1000:
-            print(f"Deck {self.deck_number}: WARNING - Position is 0 but duration is {duration}ms. This may cause restart issue.")
-        
-        # Pause immediately to prevent position from changing during processing
-        if was_playing:
-            self.player.pause()
-            print(f"Deck {self.deck_number}: Paused playback for EQ reset processing")
-
         try:
             # Clean up previous EQ file first
-            if self._last_eq_output_file and os.path.exists(self._last_eq_output_file):
-                try:
-                    os.remove(self._last_eq_output_file)
-                    print(f"Deck {self.deck_number}: Cleaned up previous EQ file")
-                except:
-                    pass
+            if self._last_eq_output_file:
+                self._remove_file_later(self._last_eq_output_file)
                 self._last_eq_output_file = None
 
             # Determine what file we need based on current BPM state
             if self.current_bpm != self.original_bpm and self.original_bpm > 0:
                 # BPM has been changed - we need a tempo-processed file
-                print(f"Deck {self.deck_number}: BPM changed ({self.original_bpm} -> {self.current_bpm}), creating tempo-only file for EQ reset")
-                
-                # Clean up old temp file if it exists
-                if self.temp_file and os.path.exists(self.temp_file):
-                    try:
-                        os.remove(self.temp_file)
-                        print(f"Deck {self.deck_number}: Cleaned up old temp file")
-                    except:
-                        pass
-                
-                # Create a fresh tempo-processed file for the current BPM
-                temp_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp_tempo")
-                os.makedirs(temp_dir, exist_ok=True)
-                
-                tempo_file = os.path.join(temp_dir, f"deck{self.deck_number}_tempo_reset_{int(time.time()*1000)}.wav")
+                logger.debug("Deck %d: BPM changed (%s -> %s), creating tempo-only file for EQ reset", self.deck_number, self.original_bpm, self.current_bpm)
                 
                 # Calculate stretch factor
                 stretch_factor = self.original_bpm / self.current_bpm
+                cache_key = (self.original_file_path, round(stretch_factor, 4))
+                cached_file = self._cached_tempo_file(cache_key)
                 
-                print(f"Deck {self.deck_number}: Creating tempo file with factor {stretch_factor:.3f}")
-                
-                # Create tempo-processed file using the analyzer
-                if hasattr(self, 'audio_analyzer') and self.audio_analyzer and self.audio_analyzer.is_available():
+                if cached_file:
+                    logger.debug("Deck %d: Reusing tempo file for factor %.3f: %s", self.deck_number, stretch_factor, cached_file)
+                    base_file = cached_file
+                # Create tempo-processed file using the analyzer, off the GUI thread
+                elif self.audio_analyzer and self.audio_analyzer.is_available():
+                    # Create a fresh tempo-processed file for the current BPM
+                    tempo_file = os.path.join(_TEMPO_TEMP_DIR, f"deck{self.deck_number}_tempo_reset_{int(time.time()*1000)}.wav")
+                    
+                    logger.debug("Deck %d: Creating tempo file with factor %.3f", self.deck_number, stretch_factor)
+                    
                     # Optimized: Get length without loading entire file (much faster for large files)
-                    try:
-                        info = sf.info(self.original_file_path)
-                        length_seconds = info.duration
-                        
-                        success = self.audio_analyzer.change_tempo(
-                            self.original_file_path,
-                            tempo_file,
-                            stretch_factor,
-                            length_seconds
-                        )
-                        
-                        if success and os.path.exists(tempo_file) and os.path.getsize(tempo_file) > 0:
-                            base_file = tempo_file
-                            # Update temp_file to point to our new tempo file
-                            self.temp_file = tempo_file
-                            print(f"Deck {self.deck_number}: Successfully created tempo file: {os.path.basename(base_file)}")
-                        else:
-                            print(f"Deck {self.deck_number}: Tempo processing failed or produced empty file, using original")
-                            # Clean up failed tempo file
-                            if os.path.exists(tempo_file):
-                                try:
-                                    os.remove(tempo_file)
-                                except:
-                                    pass
-                            base_file = self.original_file_path
-                            self.temp_file = None
-                    except Exception as tempo_error:
-                        print(f"Deck {self.deck_number}: Error during tempo processing: {tempo_error}")
-                        base_file = self.original_file_path
-                        self.temp_file = None
+                    length_seconds = self._get_original_info().duration
+                    self._tempo_render_keys[self._current_eq_job_id] = cache_key
+                    QThreadPool.globalInstance().start(TempoRenderWorker(
+                        self._tempo_render_signals, self._current_eq_job_id, self.audio_analyzer,
+                        self.original_file_path, tempo_file, stretch_factor, length_seconds))
+                    return
                 else:
-                    print(f"Deck {self.deck_number}: BPM analyzer unavailable, using original file")
+                    logger.warning("Deck %d: BPM analyzer unavailable, using original file", self.deck_number)
                     base_file = self.original_file_path
-                    self.temp_file = None
             else:
                 # No BPM change, use original file
                 base_file = self.original_file_path
-                # Clean up any old temp file since we're going back to original
-                if self.temp_file and os.path.exists(self.temp_file):
-                    try:
-                        os.remove(self.temp_file)
-                        print(f"Deck {self.deck_number}: Cleaned up temp file, using original")
-                    except:
-                        pass
-                self.temp_file = None
-                print(f"Deck {self.deck_number}: Using original file: {os.path.basename(base_file)}")
-
-            # Verify the file exists before trying to load it
-            if not os.path.exists(base_file):
-                print(f"Deck {self.deck_number}: Error - Base file doesn't exist: {base_file}")
-                return
+                logger.debug("Deck %d: Using original file: %s", self.deck_number, base_file)
 
-            # Set the player to use the base file (unprocessed by EQ, but with correct tempo)
-            print(f"Deck {self.deck_number}: Loading new source file: {os.path.basename(base_file)}")
-            self.player.setSource(QUrl.fromLocalFile(base_file))
-            
-            # Update spectrogram with neutral gains
-            if hasattr(self, 'spectrogram'):
-                self.spectrogram.update_eq_gains(1.0, 1.0, 1.0)
-            
-            print(f"Deck {self.deck_number}: EQ reset applied, using file: {os.path.basename(base_file)}")
-            
-            # Wait a bit longer for the media to load, then restore position
-            QTimer.singleShot(200, lambda: self._restore_position_and_resume_by_time(time_elapsed_seconds, was_playing))
+            self._load_neutral_base_file(base_file)
             
         except Exception as e:
-            print(f"Deck {self.deck_number}: Error applying neutral EQ: {e}")
-            traceback.print_exc()
-            # Try to resume playback even if there was an error
-            if was_playing:
-                self.player.play()
+            logger.warning("Deck %d: Error applying neutral EQ: %s", self.deck_number, e)
+            if logger.isEnabledFor(logging.DEBUG): traceback.print_exc()
 
-    def _restore_position_and_resume_by_time(self, time_elapsed_seconds, was_playing):
+    def _on_tempo_render_done(self, job_id, tempo_file, success):
         """
-        Restore playback position based on elapsed time and resume if was playing.
-        
+        Load the tempo file rendered for an EQ reset, or fall back to the original file
+        when the render failed.
+
         Args:
-            time_elapsed_seconds (float): Time elapsed in seconds from the start.
-            was_playing (bool): Whether playback was active before reset.
+            job_id (int): Id of the EQ reset the render belongs to.
+            tempo_file (str): Path of the rendered file.
+            success (bool): Whether the render produced a usable file.
+        """
+        cache_key = self._tempo_render_keys.pop(job_id, None)
+        if job_id != self._current_eq_job_id:
+            # A newer EQ apply, reset or track load superseded this reset - keep the render
+            # for later resets of the same track
+            if success and cache_key and cache_key[0] == self.original_file_path:
+                self._remember_tempo_file(cache_key, tempo_file)
+            elif success:
+                self._remove_file_later(tempo_file)
+            return
+
+        if success:
+            self._remember_tempo_file(cache_key, tempo_file)
+            logger.debug("Deck %d: Successfully created tempo file: %s", self.deck_number, tempo_file)
+            base_file = tempo_file
+        else:
+            logger.warning("Deck %d: Tempo processing failed, using original", self.deck_number)
+            base_file = self.original_file_path
+        try:
+            self._load_neutral_base_file(base_file)
+        except Exception as e:
+            logger.warning("Deck %d: Error applying neutral EQ: %s", self.deck_number, e)
+            if logger.isEnabledFor(logging.DEBUG): traceback.print_exc()
+
+    def _load_neutral_base_file(self, base_file):
+        """
+        Switch the player to the unequalized file for the deck's tempo and restore the
+        playback position.
+
+        Args:
+            base_file (str): The original file or a tempo-processed render of it.
         """
+        # Verify the file exists before trying to load it
+        if not os.path.exists(base_file):
+            logger.warning("Deck %d: Error - Base file doesn't exist: %s", self.deck_number, base_file)
+            return
+
+        # IMPORTANT: Capture the current position FIRST before switching files
+        # Get current playback state immediately to avoid position drift
+        was_playing = (self.player.playbackState() == _PS_PLAYING)
+        current_pos = self.player.position()
+        duration = self.player.duration()
+        
+        # Calculate actual time elapsed in seconds
+        time_elapsed_seconds = current_pos / 1000.0 if current_pos > 0 else 0.0
+        
+        # Validation: If we have almost no elapsed time but duration exists, something is wrong
+        if time_elapsed_seconds < 0.1 and duration > 1000:
+            logger.warning("Deck %d: WARNING - Very small elapsed time (%.2fs) with duration %sms, position may not be valid", self.deck_number, time_elapsed_seconds, duration)
+        
+        logger.debug("Deck %d: CAPTURED - Position: %sms, Duration: %sms, Time elapsed: %.2fs, Playing: %s", self.deck_number, current_pos, duration, time_elapsed_seconds, was_playing)
+
+        # Pause immediately to prevent position from changing during the switch
+        if was_playing:
+            self.player.pause()
+            logger.debug("Deck %d: Paused playback for EQ reset", self.deck_number)
+
         try:
-            print(f"Deck {self.deck_number}: Attempting to restore position to {time_elapsed_seconds:.2f}s")
+            # Clean up the old temp file (cached renders are removed by their cache)
+            if (self.temp_file and self.temp_file != base_file and self.temp_file != self._buffer_file
+                    and not self._is_shared_temp_file(self.temp_file)):
+                self._remove_file_later(self.temp_file)
+            self.temp_file = None if base_file == self.original_file_path else base_file
+
+            # Set the player to use the base file (unprocessed by EQ, but with correct tempo)
+            logger.debug("Deck %d: Loading new source file: %s", self.deck_number, base_file)
+            self._set_source_if_changed(base_file)
             
-            # Wait for media to be loaded
-            status = self.player.mediaStatus()
-            print(f"Deck {self.deck_number}: Media status: {status}")
+            # Update spectrogram with neutral gains
+            self._queue_spectrogram_update((1.0, 1.0, 1.0))
             
-            if status in [QMediaPlayer.MediaStatus.LoadedMedia, QMediaPlayer.MediaStatus.BufferedMedia]:
-                # Get the new file duration
-                new_duration = self.player.duration()
-                print(f"Deck {self.deck_number}: New file duration: {new_duration}ms")
-                
-                # Calculate position based on elapsed time
-                target_position_ms = int(time_elapsed_seconds * 1000)
-                
-                # Make sure position is within bounds
-                if new_duration > 0:
-                    target_position_ms = max(0, min(target_position_ms, new_duration - 1000))  # Leave 1 second buffer
-                else:
-                    target_position_ms = 0
-                
-                print(f"Deck {self.deck_number}: Setting position to {target_position_ms}ms (from elapsed time: {time_elapsed_seconds:.2f}s)")
-                
-                # Set the position
-                self.player.setPosition(target_position_ms)
-                
-                # Update the UI position display
-                self.update_position(target_position_ms)
-                
-                # Wait a moment for position to be set, then resume if needed
-                if was_playing:
-                    # Small delay to ensure position is set before resuming
-                    QTimer.singleShot(50, lambda: self._resume_playback_after_position_set())
-                else:
-                    print(f"Deck {self.deck_number}: Position restored, playback was paused")
-                    
-            elif status in [QMediaPlayer.MediaStatus.LoadingMedia, QMediaPlayer.MediaStatus.StalledMedia, 
-                           QMediaPlayer.MediaStatus.BufferingMedia]:
-                # Media still loading, try again with backoff
-                print(f"Deck {self.deck_number}: Media still loading (status: {status}), retrying position restore...")
-                QTimer.singleShot(200, lambda: self._restore_position_and_resume_by_time(time_elapsed_seconds, was_playing))
-            elif status == QMediaPlayer.MediaStatus.NoMedia:
-                print(f"Deck {self.deck_number}: No media loaded, retrying...")
-                QTimer.singleShot(300, lambda: self._restore_position_and_resume_by_time(time_elapsed_seconds, was_playing))
-            else:
-                print(f"Deck {self.deck_number}: Media load failed after EQ reset (status: {status})")
-                
-        except Exception as e: 
-            print(f"Deck {self.deck_number}: Error restoring position after EQ reset: {e}")
+            logger.debug("Deck %d: EQ reset applied, using file: %s", self.deck_number, base_file)
+            
+            # Restore the position as soon as the player reports the media loaded
+            self._check_media_and_seek_resume(int(time_elapsed_seconds * 1000), was_playing)
+        except Exception:
+            # Try to resume playback even if there was an error
             if was_playing:
                 self.player.play()
-
-    def _resume_playback_after_position_set(self):
-        """
-        Resume playback after position has been set.
-        """
-        try:
-            current_pos = self.player.position()
-            print(f"Deck {self.deck_number}: Resuming playback at position {current_pos}ms")
-            self.player.play()
-            print(f"Deck {self.deck_number}: Playback resumed after EQ reset")
-        except Exception as e:
-            print(f"Deck {self.deck_number}: Error resuming playback: {e}")
+            raise
 
     def _apply_eq(self, reset_transitions=False, target_position_after_eq=None, resume_after_eq=None):
         """
-        Apply EQ by processing audio file and loading the result.
+        Apply EQ by rendering the audio in the background and loading the result.
 
         Args:
             reset_transitions (bool): Whether to reset EQ transitions before processing.
             target_position_after_eq (int, optional): Specific position to seek to after EQ processing.
             resume_after_eq (bool, optional): Whether to resume playback after EQ processing.
         """
-        print(f"\nDeck {self.deck_number}: Applying EQ processing")
+        logger.debug("Deck %d: Applying EQ processing", self.deck_number)
         
         # Show processing status
-        if hasattr(self, 'eq_status_label'):
+        if self.eq_status_label is not None:
+            self._eq_status_timer.stop()
             self.eq_status_label.setText("Processing EQ...")
             self.eq_status_label.setVisible(True)
         
@@ -2364,176 +3656,274 @@ class DeckWidget(GlassWidget):
                           abs(self._eq_treble_gain - 1.0) > 0.01)
         
         if not needs_eq_change:
-            print(f"Deck {self.deck_number}: EQ gains are neutral, applying base file")
+            logger.debug("Deck %d: EQ gains are neutral, applying base file", self.deck_number)
             self._force_apply_neutral_eq()
             return
 
         if not self.original_file_path or not os.path.exists(self.original_file_path):
-            print(f"Deck {self.deck_number}: No original file available for EQ processing")
-            if hasattr(self, 'eq_status_label'):
+            logger.debug("Deck %d: No original file available for EQ processing", self.deck_number)
+            if self.eq_status_label is not None:
                 self.eq_status_label.setVisible(False)
             return
 
-        # Get current playback state and position (unless overridden)
-        if target_position_after_eq is not None and resume_after_eq is not None:
+        if reset_transitions and self.equalizer is not None:
+            self.equalizer.reset_transitions()
+        
+        # Start with the appropriate base file (original or tempo-processed)
+        base_file = self.original_file_path
+        if self.current_bpm != self.original_bpm and self.original_bpm > 0:
+            # If tempo has been changed, we need the tempo-processed file
+            # For now, let's apply EQ to the current playing file
+            if self.temp_file and os.path.exists(self.temp_file):
+                base_file = self.temp_file
+        
+        # Process the PCM already decoded for this deck (kept in sync with the playing
+        # tempo) and only fall back to decoding the base file when it isn't available yet
+        audio_data, sample_rate = None, None
+        if self._eq_buffer is not None and self._eq_buffer_rate:
+            audio_data, sample_rate = self._eq_buffer, self._eq_buffer_rate
+            logger.debug("Deck %d: Processing EQ from cached buffer", self.deck_number)
+        else:
+            logger.debug("Deck %d: Processing EQ from: %s", self.deck_number, base_file)
+        
+        gains = (self._eq_bass_gain, self._eq_mid_gain, self._eq_treble_gain)
+        key = eq_cache_key(self.original_file_path, os.path.getmtime(self.original_file_path), self.current_bpm, gains)
+        eq_file_path = os.path.join(_EQ_TEMP_DIR, f"{_EQ_CACHE_PREFIX}{key}.wav")
+        
+        # Playback keeps running while the render is in flight; the position is captured
+        # when the result is loaded unless the caller (tempo change flow) provided one
+        self._current_eq_job_id += 1
+        self._eq_job_restore = (target_position_after_eq, resume_after_eq)
+        self._eq_job_tempo_seq = self._tempo_load_seq
+        
+        if os.path.exists(eq_file_path):
+            # Rendered before at this tempo and EQ - just switch to it
+            logger.debug("Deck %d: Reusing cached EQ render %s", self.deck_number, eq_file_path)
+            try:
+                os.utime(eq_file_path)  # Mark as recently used for the cache trim
+            except OSError:
+                pass
+            self._on_eq_render_done(self._current_eq_job_id, None, 0, eq_file_path)
+            return
+        
+        self._mark_eq_files_in_use()
+        QThreadPool.globalInstance().start(EqRenderWorker(
+            self._eq_render_signals, self._current_eq_job_id, self.equalizer,
+            audio_data, sample_rate, base_file, gains, eq_file_path))
+
+    def _mark_eq_files_in_use(self):
+        """
+        Record the EQ renders this deck is playing or about to swap in, so the cache trim
+        run by render workers doesn't evict them.
+        """
+        pending = self._shadow_swap[1] if self._shadow_swap is not None else None
+        _eq_files_in_use[self.deck_number] = frozenset(
+            path for path in (self.temp_file, self._key_base_file, pending) if is_eq_cache_file(path))
+
+    def _on_eq_source_decoded(self, job_id, audio_data, sample_rate):
+        """
+        Keep the source audio an EQ render decoded as this deck's EQ buffer.
+
+        Args:
+            job_id (int): Id of the EQ apply that decoded the audio.
+            audio_data (np.ndarray): Decoded source audio, treated as read-only.
+            sample_rate (int): Sample rate in Hz.
+        """
+        # Only adopt it if no track or tempo change happened since the job started
+        if (job_id != self._current_eq_job_id or self._eq_job_tempo_seq != self._tempo_load_seq
+                or self._eq_buffer is not None):
+            return
+        self._eq_buffer = audio_data
+        self._eq_buffer_rate = sample_rate
+        logger.debug("Deck %d: Cached decoded audio for EQ processing: %s", self.deck_number, audio_data.shape)
+
+    def _on_eq_render_done(self, job_id, processed_audio, sample_rate, eq_file_path):
+        """
+        Start loading a finished EQ render on the shadow player; playback carries on from
+        the current file until the render is ready to be swapped in.
+
+        Args:
+            job_id (int): Id of the EQ apply the render belongs to.
+            processed_audio (np.ndarray or None): The equalized audio, downmixed to mono, or
+                None when a cached render is reused.
+            sample_rate (int): Sample rate in Hz.
+            eq_file_path (str): Path of the rendered file.
+        """
+        if job_id != self._current_eq_job_id:
+            return  # A newer EQ apply or reset superseded this render - it stays in the cache
+
+        logger.debug("Deck %d: EQ file created: %s", self.deck_number, eq_file_path)
+        self._shadow_swap = (job_id, eq_file_path, processed_audio, sample_rate)
+        self._mark_eq_files_in_use()
+        # Cached renders keep their path, so the URL is reused on every cache hit
+        url = self._url_for(eq_file_path)
+        if self._shadow_player.source() == url and self._shadow_player.mediaStatus() in _MS_READY:
+            self._swap_in_shadow_player()
+            return
+        self._shadow_player.setSource(url)
+        self._shadow_load_timeout.start()
+
+    def _on_shadow_media_status(self, status):
+        """
+        Swap in the shadow player once the EQ render it is loading is ready.
+
+        Args:
+            status (QMediaPlayer.MediaStatus): The shadow player's new media status.
+        """
+        if self._shadow_swap is None or status in _MS_PENDING:
+            return
+        if status in _MS_READY:
+            self._swap_in_shadow_player()
+        else:
+            self._fail_shadow_load(f"Failed to load EQ render (Status: {status.value if hasattr(status, 'value') else status})")
+
+    def _on_shadow_load_timeout(self):
+        """
+        Give up on an EQ render that never finished loading on the shadow player.
+        """
+        if self._shadow_swap is not None:
+            self._fail_shadow_load("Timed out loading EQ render")
+
+    def _fail_shadow_load(self, error_message):
+        """
+        Drop a pending shadow load and report it like a failed render.
+
+        Args:
+            error_message (str): Error message.
+        """
+        job_id = self._shadow_swap[0]
+        self._shadow_swap = None
+        self._shadow_load_timeout.stop()
+        self._shadow_player.setSource(QUrl())
+        self._on_eq_render_error(job_id, error_message)
+        if job_id == self._current_eq_job_id:
+            self._show_eq_error("EQ Load Error ✗")
+
+    def _player_connections(self, player):
+        """
+        Signal/slot pairs that bind a media player to this deck.
+
+        Args:
+            player (QMediaPlayer): The player.
+
+        Returns:
+            tuple: (signal, slot) pairs.
+        """
+        return ((player.durationChanged, self.update_duration),
+                (player.mediaStatusChanged, self._on_source_cleared),
+                (player.mediaStatusChanged, self._on_media_status),
+                (player.mediaStatusChanged, self._on_seek_resume_media_status),
+                (player.positionChanged, self._on_scrub_position),
+                (player.positionChanged, self.positionChanged),
+                (player.errorOccurred, self.handle_player_error),
+                (player.playbackStateChanged, self._update_turntable_state))
+
+    def _swap_in_shadow_player(self):
+        """
+        Make the shadow player, which has the EQ render loaded, the deck's player and
+        continue playback on it from where the previous player was.
+        """
+        job_id, eq_file_path, processed_audio, sample_rate = self._shadow_swap
+        self._shadow_swap = None
+        self._shadow_load_timeout.stop()
+        if job_id != self._current_eq_job_id:
+            self._shadow_player.setSource(QUrl())  # Superseded while loading
+            return
+
+        old_player, new_player = self.player, self._shadow_player
+        target_position, resume = self._eq_job_restore
+        if target_position is not None and resume is not None:
             # Use provided values (from tempo change flow)
-            was_playing = resume_after_eq
-            current_pos = target_position_after_eq
-            duration = self.player.duration()
-            pos_fraction = current_pos / duration if duration > 0 else 0
-            print(f"Deck {self.deck_number}: Using provided position for EQ: {current_pos}ms, Resume: {was_playing}")
+            was_playing = resume
+            current_pos = target_position
+            logger.debug("Deck %d: Using provided position for EQ: %sms, Resume: %s", self.deck_number, current_pos, was_playing)
         else:
-            # Normal EQ flow - capture current state
-            was_playing = (self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState)
-            current_pos = self.player.position()
-            duration = self.player.duration()
-            pos_fraction = current_pos / duration if duration > 0 else 0
+            # Normal EQ flow - capture current state at the moment of the swap
+            was_playing = (old_player.playbackState() == _PS_PLAYING)
+            current_pos = old_player.position()
+
+        # A reload still pending on the outgoing player is superseded by the render
+        self._pending_seek_resume = None
+        self._source_load_pending = False
+        self._seek_resume_timeout.stop()
+
+        for signal, slot in self._player_connections(old_player):
+            signal.disconnect(slot)
+        new_player.mediaStatusChanged.disconnect(self._on_shadow_media_status)
+        old_player.stop()
+        new_player.setPlaybackRate(old_player.playbackRate())
+        new_player.setAudioOutput(self.audio_output)  # Detaches it from the old player
+        self.player, self._shadow_player = new_player, old_player
+        self._player_position = new_player.position
+        for signal, slot in self._player_connections(new_player):
+            signal.connect(slot)
+        old_player.mediaStatusChanged.connect(self._on_shadow_media_status)
+
+        old_temp = self.temp_file
+        self.temp_file = eq_file_path
+        self._mark_eq_files_in_use()
+        # Release the previous file so it can be deleted; the old player is the next prewarm slot
+        old_player.setSource(QUrl())
+
+        # The render is made from unshifted audio, so an active key transposition is
+        # re-based on it and shifted again below
+        old_key_base = self._key_base_file
+        if self.key_transpose != 0:
+            if self._key_shift_file:
+                self._remove_file_later(self._key_shift_file)
+                self._key_shift_file = None
+            self._key_base_file = eq_file_path
+
+        # Update spectrogram with EQ-processed audio data and the EQ gains for the visual overlay
+        self._queue_spectrogram_update((self._eq_bass_gain, self._eq_mid_gain, self._eq_treble_gain),
+                                       processed_audio, sample_rate)
+
+        # IMPORTANT: Never delete the original file, only delete actual temp files
+        if (old_temp and old_temp != eq_file_path and
+            old_temp != self.original_file_path and old_temp != self._buffer_file and
+            old_temp != old_key_base and not self._is_shared_temp_file(old_temp)):
+            self._remove_file_later(old_temp)
+        elif old_temp == self.original_file_path:
+            logger.debug("Deck %d: Skipping cleanup of original file: %s", self.deck_number, old_temp)
+
+        # The render is already loaded - EQ doesn't change the duration, so the position
+        # carries over as-is
+        self._seek_and_resume(current_pos, was_playing)
+        if self.key_transpose != 0:
+            self._apply_key_shift()
 
-        try:
-            if reset_transitions and hasattr(self, 'equalizer'): 
-                self.equalizer.reset_transitions()
-            
-            # Start with the appropriate base file (original or tempo-processed)
-            base_file = self.original_file_path
-            if self.current_bpm != self.original_bpm and self.original_bpm > 0:
-                # If tempo has been changed, we need the tempo-processed file
-                # For now, let's apply EQ to the current playing file
-                if self.temp_file and os.path.exists(self.temp_file):
-                    base_file = self.temp_file
-            
-            print(f"Deck {self.deck_number}: Processing EQ from: {os.path.basename(base_file)}")
-            
-            # Load the base audio
-            audio_data, sample_rate = sf.read(base_file, dtype='float32')
-            
-            # Apply EQ using our Python equalizer (which calls the C++ EQ)
-            if hasattr(self, 'equalizer') and self.equalizer:
-                processed_audio = self.equalizer.process(
-                    audio_data, 
-                    sample_rate,
-                    self._eq_bass_gain,
-                    self._eq_mid_gain,
-                    self._eq_treble_gain
-                )
-            else:
-                # Fallback: no EQ processing
-                processed_audio = audio_data
-            
-            if processed_audio is None or processed_audio.size == 0:
-                print(f"Deck {self.deck_number}: EQ processing failed, using original")
-                processed_audio = audio_data
-            
-            # Save the processed file
-            temp_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp_audio")
-            os.makedirs(temp_dir, exist_ok=True)
-            
-            eq_filename = f"deck{self.deck_number}_eq_{int(time.time()*1000)}.wav"
-            eq_file_path = os.path.join(temp_dir, eq_filename)
-            
-            sf.write(eq_file_path, processed_audio, sample_rate)
-            
-            if not os.path.exists(eq_file_path):
-                raise IOError(f"Failed to create EQ processed file")
-            
-            print(f"Deck {self.deck_number}: EQ file created: {os.path.basename(eq_file_path)}")
-            
-            # Pause current playback
-            if was_playing:
-                self.player.pause()
-            
-            # Clean up old temp files
-            old_temp = self.temp_file
-            
-            # Set new file
-            self.temp_file = eq_file_path
-            
-            # Update spectrogram with EQ-processed audio data
-            try:
-                self.spectrogram.set_spectrum_data(processed_audio, sample_rate)
-                # Update EQ gains in the spectrogram for visual overlay
-                self.spectrogram.update_eq_gains(self._eq_bass_gain, self._eq_mid_gain, self._eq_treble_gain)
-                
-                print(f"Deck {self.deck_number}: Updated spectrogram with EQ-processed audio")
-            except Exception as e:
-                print(f"Deck {self.deck_number}: Error updating spectrogram with EQ data: {e}")
-            
-            # Load the new EQ-processed file
-            self.player.setSource(QUrl.fromLocalFile(self.temp_file))
-            
-            # Clean up old file after setting new source
-            # IMPORTANT: Never delete the original file, only delete actual temp files
-            if (old_temp and old_temp != eq_file_path and os.path.exists(old_temp) and 
-                old_temp != self.original_file_path):
-                try:
-                    os.remove(old_temp)
-                    print(f"Deck {self.deck_number}: Cleaned up old temp file: {os.path.basename(old_temp)}")
-                except Exception as e:
-                    print(f"Deck {self.deck_number}: Could not remove old temp file: {e}")
-            elif old_temp == self.original_file_path:
-                print(f"Deck {self.deck_number}: Skipping cleanup of original file: {os.path.basename(old_temp)}")
-            
-            # Wait for media to load, then restore position and resume
-            QTimer.singleShot(200, lambda: self._restore_eq_position_and_resume(pos_fraction, was_playing))
+        if self.eq_status_label is not None:
+            self.eq_status_label.setText("EQ Applied ✓")
+            self._eq_status_timer.start(2000)
 
-        except Exception as e: 
-            print(f"Deck {self.deck_number}: Error in EQ processing: {e}")
-            traceback.print_exc()
-            
-            # Show error status
-            if hasattr(self, 'eq_status_label'):
-                self.eq_status_label.setText("EQ Error ✗")
-                QTimer.singleShot(3000, lambda: self.eq_status_label.setVisible(False))
-                
-            if was_playing and self.player.playbackState() != QMediaPlayer.PlaybackState.PlayingState:
-                self.player.play()
-    
-    def _restore_eq_position_and_resume(self, position_fraction, was_playing):
+    def _on_eq_render_error(self, job_id, error_message):
         """
-        Restore position and resume playback after EQ processing.
+        Handle a failed EQ render.
 
         Args:
-            position_fraction (float): Fractional position to restore.
-            was_playing (bool): Whether playback was active before EQ.
+            job_id (int): Id of the EQ apply the render belongs to.
+            error_message (str): Error message.
         """
-        try:
-            # Check if media is loaded
-            status = self.player.mediaStatus()
-            if status in [QMediaPlayer.MediaStatus.LoadedMedia, QMediaPlayer.MediaStatus.BufferedMedia]:
-                # Restore position
-                new_duration = self.player.duration()
-                if new_duration > 0:
-                    target_position = int(position_fraction * new_duration)
-                    target_position = max(0, min(target_position, new_duration))
-                    self.player.setPosition(target_position)
-                    self.update_position(target_position)
-                    print(f"Deck {self.deck_number}: Restored position after EQ: {target_position}ms")
-                
-                # Resume playback if it was playing
-                if was_playing:
-                    self.player.play()
-                    print(f"Deck {self.deck_number}: Resumed playback after EQ")
-                
-                # Show success status
-                if hasattr(self, 'eq_status_label'):
-                    self.eq_status_label.setText("EQ Applied ✓")
-                    QTimer.singleShot(2000, lambda: self.eq_status_label.setVisible(False))
-                    
-            elif status in [QMediaPlayer.MediaStatus.LoadingMedia, QMediaPlayer.MediaStatus.StalledMedia, 
-                           QMediaPlayer.MediaStatus.BufferingMedia, QMediaPlayer.MediaStatus.NoMedia]:
-                # Media still loading, try again
-                print(f"Deck {self.deck_number}: Media still loading after EQ, retrying...")
-                QTimer.singleShot(200, lambda: self._restore_eq_position_and_resume(position_fraction, was_playing))
-            else:
-                print(f"Deck {self.deck_number}: Media load failed after EQ processing (status: {status})")
-                if hasattr(self, 'eq_status_label'):
-                    self.eq_status_label.setText("EQ Load Error ✗")
-                    QTimer.singleShot(3000, lambda: self.eq_status_label.setVisible(False))
-                
-        except Exception as e:
-            print(f"Deck {self.deck_number}: Error restoring after EQ: {e}")
-            if was_playing and self.player.playbackState() != QMediaPlayer.PlaybackState.PlayingState:
-                self.player.play()
+        if job_id != self._current_eq_job_id:
+            return
+        logger.warning("Deck %d: Error in EQ processing: %s", self.deck_number, error_message)
+        self._show_eq_error()
+        target_position, resume = self._eq_job_restore
+        if target_position is not None and resume is not None:
+            # Tempo change flow paused for the render - fall back to the tempo file
+            self._check_media_and_seek_resume(target_position, resume)
+
+    def _show_eq_error(self, text="EQ Error ✗"):
+        """
+        Show the EQ error status briefly.
 
+        Args:
+            text (str): Status text to show.
+        """
+        if self.eq_status_label is not None:
+            self.eq_status_label.setText(text)
+            self._eq_status_timer.start(3000)
+    
     def toggle_loop(self):
         """
         Toggle the loop state for playback.
@@ -2549,7 +3939,13 @@ class DeckWidget(GlassWidget):
         else:
             self.loop_button.setProperty("class", "neonBorder")
         
-        # Update button style
+        # Update button style once per burst of toggles
+        self._style_refresh_timer.start()
+
+    def _flush_loop_style(self):
+        """
+        Re-polish the loop button so its current class property takes effect.
+        """
         self.loop_button.style().unpolish(self.loop_button)
         self.loop_button.style().polish(self.loop_button)
 
@@ -2557,28 +3953,18 @@ class DeckWidget(GlassWidget):
         """
         Update the loop start time from the input field.
         """
-        try:
-            start_time = float(self.loop_start_input.text())
-            if start_time < 0:
-                start_time = 0
-            self._loop_start_time = int(start_time * 1000)  # Convert to milliseconds
+        loop_start = _parse_seconds_ms(self.loop_start_input.text())
+        if loop_start is not None:  # Otherwise reset to the current value
+            self._loop_start_time = loop_start
             self._loop_end_time = self._loop_start_time + self._loop_length
-            self.loop_start_input.setText(f"{start_time:.1f}")
-        except ValueError:
-            # Reset to current value if invalid input
-            self.loop_start_input.setText(f"{self._loop_start_time / 1000:.1f}")
+        self.loop_start_input.setText(_format_ms_seconds(self._loop_start_time))
 
     def _update_loop_length(self):
         """
         Update the loop length from the input field.
         """
-        try:
-            length = float(self.loop_length_input.text())
-            if length < 0.1:  # Minimum 100ms
-                length = 0.1
-            self._loop_length = int(length * 1000)  # Convert to milliseconds
+        loop_length = _parse_seconds_ms(self.loop_length_input.text())
+        if loop_length is not None:  # Otherwise reset to the current value
+            self._loop_length = max(100, loop_length)  # Minimum 100ms
             self._loop_end_time = self._loop_start_time + self._loop_length
-            self.loop_length_input.setText(f"{length:.1f}")
-        except ValueError:
-            # Reset to current value if invalid input
-            self.loop_length_input.setText(f"{self._loop_length / 1000:.1f}")
\ No newline at end of file
+        self.loop_length_input.setText(_format_ms_seconds(self._loop_length))
\ No newline at end of file
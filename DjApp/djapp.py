@@ -2,6 +2,7 @@ import sys
 import os
 import time
 import traceback
+import functools
 import logging
 import json
 
@@ -48,7 +49,7 @@ from PyQt6.QtWidgets import (
     QCheckBox,QListWidget,QListWidgetItem
 )
 from PyQt6.QtCore import (
-    Qt, QTimer, QUrl, qInstallMessageHandler, QtMsgType
+    Qt, QTimer, QUrl, QThreadPool, qInstallMessageHandler, QtMsgType
 )
 from PyQt6.QtGui import QPalette, QColor, QIcon
 from PyQt6.QtMultimedia import QMediaDevices
@@ -56,21 +57,134 @@ from PyQt6.QtMultimedia import QMediaDevices
 # Suppress Qt CSS warnings for unsupported properties
 os.environ['QT_LOGGING_RULES'] = 'qt.qpa.stylesheet.warning=false'
 
-from file_management import FileBrowserDialog
-
 from audio_analyzer_bridge import AudioAnalyzerBridge
 from cache_manager import AudioCacheManager
-from deck_widgets import DeckWidget
+from deck_widgets import DeckWidget, purge_eq_temp_files
 from tutorial import TutorialManager, ConceptsGuide, HighlightOverlay
 from PyQt6.QtGui import QIntValidator
-from recording_worker import RealTimeRecordingWorker
-from automix_dialog import AutoMixDialog
-from automix_engine import TrackInfo
-from debug_logger import debug, info, warning, error, success
+# file_management, recording_worker (sounddevice/PortAudio) and automix_dialog (numpy
+# analysis engine) are imported where first used so they stay off the startup path
+from debug_logger import DebugLogger, debug, info, warning, error, success
 import ctypes
 import stat
 import subprocess
 
+# Application files live next to this module; resolved once at import
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_ICON_PATH = os.path.join(_MODULE_DIR, "MixLabLogo.png")
+_TUTORIAL_CONFIG_PATH = os.path.join(_MODULE_DIR, "tutorial_config.json")
+_TEMP_AUDIO_DIR = os.path.join(_MODULE_DIR, "temp_audio")
+_TEMP_TEMPO_DIR = os.path.join(_MODULE_DIR, "temp_tempo")
+
+def _delete_temp_dir_files(directory, older_than=None, remove_dir=True):
+    """Force-delete the files in a temp directory with retries.
+
+    Attempts to remove each file in the specified directory, retrying on
+    transient PermissionError cases (e.g., file still in use) with a brief
+    backoff. Removes the directory itself if it becomes empty.
+
+    Args:
+        directory (str): Absolute or relative path to the directory to clean.
+        older_than (float, optional): Only delete files last modified before this time.
+        remove_dir (bool): Whether to remove the directory once it is empty.
+    """
+    if not os.path.exists(directory):
+        return
+
+    debug(f"Cleaning up directory: {directory}")
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            try:
+                if not entry.is_file():
+                    continue
+                if older_than is not None and entry.stat().st_mtime >= older_than:
+                    continue
+                # Try multiple times with increasing delays
+                max_attempts = 3
+                for attempt in range(max_attempts):
+                    try:
+                        os.unlink(entry.path)
+                        debug(f"Deleted: {entry.path}")
+                        break
+                    except PermissionError:
+                        if attempt < max_attempts - 1:
+                            debug(f"File in use, retrying: {entry.path}")
+                            time.sleep(0.5 * (attempt + 1))  # Increasing delay
+                        else:
+                            warning(f"Could not delete after {max_attempts} attempts: {entry.path}")
+                    except Exception as e:
+                        warning(f"Error deleting {entry.path}: {e}")
+                        break
+            except Exception as e:
+                warning(f"Error processing {entry.name}: {e}")
+
+    if not remove_dir:
+        return
+    # Try to remove the directory itself if empty
+    try:
+        if os.path.exists(directory) and not os.listdir(directory):
+            os.rmdir(directory)
+            debug(f"Removed empty directory: {directory}")
+    except Exception as e:
+        warning(f"Could not remove directory {directory}: {e}")
+
+def _cleanup_previous_session_files(session_start):
+    """
+    Remove temp files left behind by previous sessions. Runs on the global thread pool.
+
+    Args:
+        session_start (float): Time this session started; newer files are kept.
+    """
+    try:
+        _delete_temp_dir_files(_TEMP_AUDIO_DIR, older_than=session_start, remove_dir=False)
+        _delete_temp_dir_files(_TEMP_TEMPO_DIR, older_than=session_start, remove_dir=False)
+        # Renders this session may be playing or still writing are newer than session_start
+        purge_eq_temp_files(remove_partial=False, older_than=session_start)
+    except Exception as e:
+        error(f"Error during temp file cleanup: {e}")
+
+# Palette colors (RGB) per palette role for the forced dark and light palettes
+_PALETTE_COLORS = {
+    "dark": {
+        "Window": (26, 26, 26), "WindowText": (243, 207, 44), "Base": (42, 42, 42),
+        "AlternateBase": (66, 66, 66), "ToolTipBase": (0, 0, 0), "ToolTipText": (243, 207, 44),
+        "Text": (243, 207, 44), "Button": (53, 53, 53), "ButtonText": (243, 207, 44),
+        "BrightText": (255, 255, 255), "Link": (42, 130, 218), "Highlight": (42, 130, 218),
+        "HighlightedText": (0, 0, 0),
+    },
+    "light": {
+        "Window": (240, 240, 240), "WindowText": (0, 0, 0), "Base": (255, 255, 255),
+        "AlternateBase": (245, 245, 245), "ToolTipBase": (255, 255, 255), "ToolTipText": (0, 0, 0),
+        "Text": (0, 0, 0), "Button": (240, 240, 240), "ButtonText": (0, 0, 0),
+        "BrightText": (255, 255, 255), "Link": (44, 123, 243), "Highlight": (44, 123, 243),
+        "HighlightedText": (255, 255, 255),
+    },
+}
+
+# Mixer label texts for every slider value, so drags don't format a new string per tick
+_PERCENT_TEXT = tuple(f"{value}%" for value in range(101))
+_CROSSFADER_TEXT = tuple(
+    "CENTER" if value == 50 else f"◄ A {(50 - value) * 2}%" if value < 50 else f"B {(value - 50) * 2}% ►"
+    for value in range(101)
+)
+
+@functools.lru_cache(maxsize=None)
+def _themed_palette(name):
+    """
+    Get the forced palette for a theme, building it on first use and reusing it on
+    later theme switches.
+
+    Args:
+        name (str): "dark" or "light".
+
+    Returns:
+        QPalette: The palette.
+    """
+    palette = QPalette()
+    for role, rgb in _PALETTE_COLORS[name].items():
+        palette.setColor(getattr(QPalette.ColorRole, role), QColor(*rgb))
+    return palette
+
 class DJApp(QMainWindow):
     """
     Main DJ application window.
@@ -79,6 +193,45 @@ class DJApp(QMainWindow):
     including dual deck controls, mixing features, recording capabilities, and UI layout.
     """
 
+    # Resolution and theme presets - read-only, built once with the class rather than per window
+    resolution_presets = {
+        "1080p (1920x1080)": (1920, 1080),
+        "720p (1280x720)": (1280, 720),
+        "Small (1024x768)": (1024, 768),
+        "Compact (800x600)": (800, 600),
+    }
+
+    theme_presets = {
+        "Dark Mode": {
+            "main_bg": "#1a1a1a",
+            "accent": "#f3cf2c",
+            "text": "#f3cf2c",
+            "button_bg": "rgba(50, 50, 50, 200)",
+            "glass_bg": "rgba(40, 40, 40, 180)"
+        },
+        "Light Mode": {
+            "main_bg": "#f0f0f0",
+            "accent": "#2c7bf3",
+            "text": "#000000",
+            "button_bg": "rgba(220, 220, 220, 200)",
+            "glass_bg": "rgba(240, 240, 240, 180)"
+        },
+        "Neon Purple": {
+            "main_bg": "#1a1a1a",
+            "accent": "#bf2cf3",
+            "text": "#bf2cf3",
+            "button_bg": "rgba(50, 50, 50, 200)",
+            "glass_bg": "rgba(40, 40, 40, 180)"
+        },
+        "Forest": {
+            "main_bg": "#1c2e1c",
+            "accent": "#2cf35d",
+            "text": "#2cf35d",
+            "button_bg": "rgba(40, 60, 40, 200)",
+            "glass_bg": "rgba(40, 60, 40, 180)"
+        }
+    }
+
     def __init__(self):
         """
         Initialize the main DJ application window.
@@ -97,14 +250,12 @@ class DJApp(QMainWindow):
                 myappid = u'MixLab.DJApp.NoVersion' # An arbitrary but unique string for the app
                 ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
             except AttributeError:
-                print("Warning: ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID not found. Taskbar icon might not be optimal on Windows.")
+                warning("ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID not found. Taskbar icon might not be optimal on Windows.")
             except Exception as e:
-                print(f"Warning: Error setting AppUserModelID for taskbar: {e}")
+                warning(f"Error setting AppUserModelID for taskbar: {e}")
 
         # Determine the absolute path to the icon
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        icon_path = os.path.join(script_dir, "MixLabLogo.png")
-        self.setWindowIcon(QIcon(icon_path))
+        self.setWindowIcon(QIcon(_ICON_PATH))
         
         self.audio_directory = None
         self.file_browser = None
@@ -113,8 +264,11 @@ class DJApp(QMainWindow):
         # Add BPM cache
         self.bpm_cache = {}
         
-        # Clean up any leftover temp files from previous sessions
-        self._cleanup_all_temp_files()
+        # Clean up any leftover temp files from previous sessions on the thread pool, so the
+        # directory sweep doesn't hold up the window. Only files older than this point are
+        # removed and the directories are kept, since the decks write into them
+        session_start = time.time()
+        QThreadPool.globalInstance().start(lambda: _cleanup_previous_session_files(session_start))
         
         # Recording variables
         self.recording_folder = None
@@ -133,6 +287,7 @@ class DJApp(QMainWindow):
         self.beat_phase_monitor = QTimer(self)
         self.beat_phase_monitor.timeout.connect(self._monitor_beat_phase)
         self.beat_phase_monitor.setInterval(500)  # Check every 500ms (less aggressive)
+        self._phase_stable_ticks = 0  # Consecutive checks within tolerance, for adaptive polling
         self.beat_phase_tolerance_ms = 150  # ±150ms tolerance before auto-correction
         self.last_phase_correction_time = 0  # Track last correction to prevent loops
         self.phase_correction_cooldown_ms = 3000  # 3 seconds cooldown between corrections
@@ -143,22 +298,20 @@ class DJApp(QMainWindow):
         self.automix_current_index = 0
         self.automix_active = False
         self.automix_crossfade_duration = 15  # seconds
-        self.automix_timer = QTimer()
-        self.automix_timer.timeout.connect(self._automix_check_transition)
 
         # --- Initialize Cache Manager ---
         try:
             self.cache_manager = AudioCacheManager()
-            print(f"Cache manager initialized: {self.cache_manager.cache_dir}")
+            debug(f"Cache manager initialized: {self.cache_manager.cache_dir}")
         except Exception as e:
-            print(f"Error initializing cache manager: {e}")
+            error(f"Error initializing cache manager: {e}")
             self.cache_manager = None
 
         # --- Initialize Audio Analyzer --- 
         self.audio_analyzer = None # Initialize as None
         try:
             # Determine library path based on operating system
-            lib_folder = os.path.dirname(os.path.abspath(__file__))
+            lib_folder = _MODULE_DIR
             
             if sys.platform == 'win32': # Windows
                 lib_path = os.path.join(lib_folder, "AudioAnalyzerBridge.dll")
@@ -170,21 +323,29 @@ class DJApp(QMainWindow):
                 lib_path = os.path.join(lib_folder, "libAudioAnalyzerBridge.so")
                 lib_name = "native library"
             
-            print(f"Attempting to load Audio Analyzer Bridge {lib_name} from: {lib_path}")
+            debug(f"Attempting to load Audio Analyzer Bridge {lib_name} from: {lib_path}")
 
-            self.audio_analyzer = AudioAnalyzerBridge(lib_path, self.cache_manager)
-
-            if not self.audio_analyzer.is_available():
-                 print(f"Audio Analyzer Bridge {lib_name} loaded but failed to initialize.")
-                 QMessageBox.warning(self, "Audio Analyzer Bridge Warning", 
-                                   f"Could not initialize Audio Analyzer Bridge from:\n{lib_path}\n\n"+
+            # Probe the file first so a missing library skips building the bridge and the
+            # loader round-trip altogether
+            if not os.access(lib_path, os.R_OK):
+                 warning(f"Audio Analyzer Bridge {lib_name} not found or not readable.")
+                 QMessageBox.warning(self, "Audio Analyzer Bridge Warning",
+                                   f"Audio Analyzer Bridge {lib_name} not found at:\n{lib_path}\n\n"+
                                    "BPM detection and tempo features will be disabled.")
-                 self.audio_analyzer = None # Set back to None if unavailable
             else:
-                 print("Audio Analyzer Bridge initialized successfully.")
+                 self.audio_analyzer = AudioAnalyzerBridge(lib_path, self.cache_manager)
+
+                 if not self.audio_analyzer.is_available():
+                      warning(f"Audio Analyzer Bridge {lib_name} loaded but failed to initialize.")
+                      QMessageBox.warning(self, "Audio Analyzer Bridge Warning", 
+                                        f"Could not initialize Audio Analyzer Bridge from:\n{lib_path}\n\n"+
+                                        "BPM detection and tempo features will be disabled.")
+                      self.audio_analyzer = None # Set back to None if unavailable
+                 else:
+                      debug("Audio Analyzer Bridge initialized successfully.")
                  
         except Exception as e: # Catch potential errors during instantiation (e.g., library not found)
-             print(f"Error loading Audio Analyzer Bridge: {e}")
+             error(f"Error loading Audio Analyzer Bridge: {e}")
              error_message = f"Failed to load the Audio Analyzer Bridge {lib_name} from:\n{lib_path}\n\n{e}\n\n" + \
                            "BPM detection and tempo features will be disabled."
              
@@ -192,65 +353,26 @@ class DJApp(QMainWindow):
              self.audio_analyzer = None
         # --------------------------------
 
-        # --- List Audio Devices --- 
-        print("--- Available Audio Output Devices ---")
-        available_devices = QMediaDevices.audioOutputs()
-        if not available_devices:
-             print("  No audio output devices found by Qt Multimedia!")
-        else:
-             for device in available_devices:
-                  print(f"  - {device.description()}")
-        default_device = QMediaDevices.defaultAudioOutput()
-        if not default_device.isNull():
-             print(f"--- Default Audio Output: {default_device.description()} ---")
-        else:
-             print("--- No default audio output device found! ---")
+        # --- List Audio Devices (debug only, so the device queries are skipped otherwise) --- 
+        if DebugLogger.is_enabled():
+            debug("--- Available Audio Output Devices ---")
+            available_devices = QMediaDevices.audioOutputs()
+            if not available_devices:
+                 debug("  No audio output devices found by Qt Multimedia!")
+            else:
+                 for device in available_devices:
+                      debug(f"  - {device.description()}")
+            default_device = QMediaDevices.defaultAudioOutput()
+            if not default_device.isNull():
+                 debug(f"--- Default Audio Output: {default_device.description()} ---")
+            else:
+                 debug("--- No default audio output device found! ---")
         # ------------------------
 
 
         
-        # Add resolution presets
-        self.resolution_presets = {
-            "1080p (1920x1080)": (1920, 1080),
-            "720p (1280x720)": (1280, 720),
-            "Small (1024x768)": (1024, 768),
-            "Compact (800x600)": (800, 600),
-        }
-        
-        # Add theme presets
-        self.theme_presets = {
-            "Dark Mode": {
-                "main_bg": "#1a1a1a",
-                "accent": "#f3cf2c",
-                "text": "#f3cf2c",
-                "button_bg": "rgba(50, 50, 50, 200)",
-                "glass_bg": "rgba(40, 40, 40, 180)"
-            },
-            "Light Mode": {
-                "main_bg": "#f0f0f0",
-                "accent": "#2c7bf3",
-                "text": "#000000",
-                "button_bg": "rgba(220, 220, 220, 200)",
-                "glass_bg": "rgba(240, 240, 240, 180)"
-            },
-            "Neon Purple": {
-                "main_bg": "#1a1a1a",
-                "accent": "#bf2cf3",
-                "text": "#bf2cf3",
-                "button_bg": "rgba(50, 50, 50, 200)",
-                "glass_bg": "rgba(40, 40, 40, 180)"
-            },
-            "Forest": {
-                "main_bg": "#1c2e1c",
-                "accent": "#2cf35d",
-                "text": "#2cf35d",
-                "button_bg": "rgba(40, 60, 40, 200)",
-                "glass_bg": "rgba(40, 60, 40, 180)"
-            }
-        }
-        
         # Load saved theme or use Dark Mode as default 
-        self.settings_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "settings.json")
+        self.settings_file = os.path.join(_MODULE_DIR, "settings.json")
         debug(f"Settings file path: {self.settings_file}")
         self.current_theme = self.load_theme_setting()
         debug(f"Current theme after loading: {self.current_theme}")
@@ -272,6 +394,9 @@ class DJApp(QMainWindow):
         # Maximize window to full screen (no scrolling needed)
         self.showMaximized()
         
+        # Build the decks on the first event loop pass, after the shell has been shown
+        QTimer.singleShot(0, self._build_decks)
+        
     def define_styles(self):
         """
         Initialize the basic style framework.
@@ -306,27 +431,7 @@ class DJApp(QMainWindow):
         Force a dark color palette to override system theme settings.
         """
         try:
-            # Create a dark palette
-            dark_palette = QPalette()
-            
-            # Set dark colors for all roles
-            dark_palette.setColor(QPalette.ColorRole.Window, QColor(26, 26, 26))
-            dark_palette.setColor(QPalette.ColorRole.WindowText, QColor(243, 207, 44))
-            dark_palette.setColor(QPalette.ColorRole.Base, QColor(42, 42, 42))
-            dark_palette.setColor(QPalette.ColorRole.AlternateBase, QColor(66, 66, 66))
-            dark_palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(0, 0, 0))
-            dark_palette.setColor(QPalette.ColorRole.ToolTipText, QColor(243, 207, 44))
-            dark_palette.setColor(QPalette.ColorRole.Text, QColor(243, 207, 44))
-            dark_palette.setColor(QPalette.ColorRole.Button, QColor(53, 53, 53))
-            dark_palette.setColor(QPalette.ColorRole.ButtonText, QColor(243, 207, 44))
-            dark_palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 255, 255))
-            dark_palette.setColor(QPalette.ColorRole.Link, QColor(42, 130, 218))
-            dark_palette.setColor(QPalette.ColorRole.Highlight, QColor(42, 130, 218))
-            dark_palette.setColor(QPalette.ColorRole.HighlightedText, QColor(0, 0, 0))
-            
-            # Apply the dark palette to the application
-            QApplication.instance().setPalette(dark_palette)
-            
+            QApplication.instance().setPalette(_themed_palette("dark"))
             print("Forced dark palette applied successfully")
             
         except Exception as e:
@@ -337,27 +442,7 @@ class DJApp(QMainWindow):
         Force a light color palette to override system theme settings.
         """
         try:
-            # Create a light palette
-            light_palette = QPalette()
-            
-            # Set light colors for all roles
-            light_palette.setColor(QPalette.ColorRole.Window, QColor(240, 240, 240))
-            light_palette.setColor(QPalette.ColorRole.WindowText, QColor(0, 0, 0))
-            light_palette.setColor(QPalette.ColorRole.Base, QColor(255, 255, 255))
-            light_palette.setColor(QPalette.ColorRole.AlternateBase, QColor(245, 245, 245))
-            light_palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(255, 255, 255))
-            light_palette.setColor(QPalette.ColorRole.ToolTipText, QColor(0, 0, 0))
-            light_palette.setColor(QPalette.ColorRole.Text, QColor(0, 0, 0))
-            light_palette.setColor(QPalette.ColorRole.Button, QColor(240, 240, 240))
-            light_palette.setColor(QPalette.ColorRole.ButtonText, QColor(0, 0, 0))
-            light_palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 255, 255))
-            light_palette.setColor(QPalette.ColorRole.Link, QColor(44, 123, 243))
-            light_palette.setColor(QPalette.ColorRole.Highlight, QColor(44, 123, 243))
-            light_palette.setColor(QPalette.ColorRole.HighlightedText, QColor(255, 255, 255))
-            
-            # Apply the light palette to the application
-            QApplication.instance().setPalette(light_palette)
-            
+            QApplication.instance().setPalette(_themed_palette("light"))
             print("Forced light palette applied successfully")
             
         except Exception as e:
@@ -375,6 +460,23 @@ class DJApp(QMainWindow):
         except Exception as e:
             print(f"Error resetting to system palette: {e}")
 
+    def _config_button(self, btn, min_w, max_w, h=32, cls=None):
+        """
+        Apply the top toolbar's size constraints and optional style class to a button.
+
+        Args:
+            btn (QPushButton): The button to configure.
+            min_w (int): Minimum width in pixels.
+            max_w (int): Maximum width in pixels.
+            h (int): Minimum height in pixels.
+            cls (str, optional): Style class for styles.qss.
+        """
+        btn.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+        btn.setMinimumSize(min_w, h)
+        btn.setMaximumWidth(max_w)
+        if cls is not None:
+            btn.setProperty("class", cls)
+
     def setup_ui(self):
         """
         Set up the main application user interface.
@@ -426,19 +528,12 @@ class DJApp(QMainWindow):
         select_dir_button = QPushButton("📁 Select Directory")
         select_dir_button.setObjectName("select_dir_button")
         select_dir_button.clicked.connect(self.select_audio_directory)
-        select_dir_button.setMinimumWidth(140)
-        select_dir_button.setMaximumWidth(180)
-        select_dir_button.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
-        select_dir_button.setMinimumHeight(32)
-        select_dir_button.setProperty("class", "neonBorder")
+        self._config_button(select_dir_button, 140, 180, cls="neonBorder")
         
         self.track_list_button = QPushButton("🎵 Track List")
         self.track_list_button.clicked.connect(self.show_file_browser)
         self.track_list_button.setEnabled(False)
-        self.track_list_button.setMinimumWidth(110)
-        self.track_list_button.setMaximumWidth(140)
-        self.track_list_button.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
-        self.track_list_button.setMinimumHeight(32)
+        self._config_button(self.track_list_button, 110, 140)
         
         top_controls_layout.addWidget(select_dir_button)
         top_controls_layout.addWidget(self.track_list_button)
@@ -448,12 +543,8 @@ class DJApp(QMainWindow):
         
         # === AUTOMIX SECTION ===
         self.automix_button = QPushButton("🎚️ AutoMix")
-        self.automix_button.setProperty("class", "neonBorder")
         self.automix_button.clicked.connect(self.auto_mix)
-        self.automix_button.setMinimumWidth(100)
-        self.automix_button.setMaximumWidth(130)
-        self.automix_button.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
-        self.automix_button.setMinimumHeight(32)
+        self._config_button(self.automix_button, 100, 130, cls="neonBorder")
         top_controls_layout.addWidget(self.automix_button)
         
         # Separator
@@ -462,34 +553,22 @@ class DJApp(QMainWindow):
         # === RECORDING SECTION ===
         self.record_button = QPushButton("⏺ Record")
         self.record_button.setCheckable(True)
-        self.record_button.setProperty("class", "recordButton")
         self.record_button.clicked.connect(self.toggle_recording)
-        self.record_button.setMinimumWidth(90)
-        self.record_button.setMaximumWidth(120)
-        self.record_button.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
-        self.record_button.setMinimumHeight(32)
+        self._config_button(self.record_button, 90, 120, cls="recordButton")
         
         record_folder_button = QPushButton("📂 Rec Folder")
-        record_folder_button.setProperty("class", "recordButton")
         record_folder_button.clicked.connect(self.select_recording_folder)
-        record_folder_button.setMinimumWidth(100)
-        record_folder_button.setMaximumWidth(130)
-        record_folder_button.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
-        record_folder_button.setMinimumHeight(32)
+        self._config_button(record_folder_button, 100, 130, cls="recordButton")
         
         self.recording_status_label = QLabel("🔴 REC 00:00")
-        self.recording_status_label.setProperty("class", "recordingStatusLabel")
+        self.recording_status_label.setObjectName("recordingStatusLabel")
         self.recording_status_label.setVisible(False)
         self.recording_status_label.setMinimumHeight(32)
         
         self.view_recordings_button = QPushButton("📼 View Recs")
-        self.view_recordings_button.setProperty("class", "syncDefault")
         self.view_recordings_button.clicked.connect(self.show_recordings_list)
         self.view_recordings_button.setEnabled(False)
-        self.view_recordings_button.setMinimumWidth(120)
-        self.view_recordings_button.setMaximumWidth(150)
-        self.view_recordings_button.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
-        self.view_recordings_button.setMinimumHeight(32)
+        self._config_button(self.view_recordings_button, 120, 150, cls="syncDefault")
         
         top_controls_layout.addWidget(self.record_button)
         top_controls_layout.addWidget(record_folder_button)
@@ -501,28 +580,16 @@ class DJApp(QMainWindow):
         
         # === UTILITY BUTTONS SECTION (Right side) ===
         settings_button = QPushButton("⚙️ Settings")
-        settings_button.setProperty("class", "helpButton")
         settings_button.clicked.connect(self.show_settings_dialog)
-        settings_button.setMinimumWidth(90)
-        settings_button.setMaximumWidth(120)
-        settings_button.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
-        settings_button.setMinimumHeight(32)
+        self._config_button(settings_button, 90, 120, cls="helpButton")
         
         help_button = QPushButton("❓ Help")
-        help_button.setProperty("class", "helpButton")
         help_button.clicked.connect(self.show_help)
-        help_button.setMinimumWidth(80)
-        help_button.setMaximumWidth(110)
-        help_button.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
-        help_button.setMinimumHeight(32)
+        self._config_button(help_button, 80, 110, cls="helpButton")
         
         new_features_button = QPushButton("🆕 New")
-        new_features_button.setProperty("class", "helpButton")
         new_features_button.clicked.connect(self.show_new_features_tutorial)
-        new_features_button.setMinimumWidth(70)
-        new_features_button.setMaximumWidth(100)
-        new_features_button.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
-        new_features_button.setMinimumHeight(32)
+        self._config_button(new_features_button, 70, 100, cls="helpButton")
         
         top_controls_layout.addWidget(settings_button)
         top_controls_layout.addWidget(help_button)
@@ -533,22 +600,15 @@ class DJApp(QMainWindow):
         decks_layout.setSpacing(4)  # Professional spacing between decks
         decks_layout.setContentsMargins(0, 2, 0, 2)
         
-        # Create deck widgets with responsive sizing
-        self.deck1 = DeckWidget(1, main_app=self, audio_analyzer=self.audio_analyzer)
-        self.deck2 = DeckWidget(2, main_app=self, audio_analyzer=self.audio_analyzer)
-        
-        # Set size policies for responsive layout
-        self.deck1.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        self.deck2.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        
-        decks_layout.addWidget(self.deck1)
-        decks_layout.addWidget(self.deck2)
-        
-        # --- Connect Sync Button Signals --- 
-        # Use lambda to pass the deck number to the toggle_sync function
-        self.deck1.sync_button.clicked.connect(lambda: self.toggle_sync(1))
-        self.deck2.sync_button.clicked.connect(lambda: self.toggle_sync(2))
-        # ---------------------------------
+        # Placeholders hold the deck slots until _build_decks swaps the real decks in
+        # once the window is up, keeping deck construction off the first paint
+        self._decks_layout = decks_layout
+        self._deck_placeholders = []
+        for _ in range(2):
+            placeholder = QWidget()
+            placeholder.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+            decks_layout.addWidget(placeholder)
+            self._deck_placeholders.append(placeholder)
         
 
         
@@ -563,7 +623,6 @@ class DJApp(QMainWindow):
         master_label = QLabel("MASTER")
         master_label.setProperty("class", "mixerLabel")
         master_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        master_label.setStyleSheet("font-size: 11px; font-weight: bold; letter-spacing: 2px;")
         
         self.master_volume_slider = QSlider(Qt.Orientation.Vertical)
         self.master_volume_slider.setMinimum(0)
@@ -571,12 +630,11 @@ class DJApp(QMainWindow):
         self.master_volume_slider.setValue(100)
         self.master_volume_slider.setFixedHeight(85)  # Increased height
         self.master_volume_slider.setFixedWidth(32)   # Easier to grab
-        self.master_volume_slider.setProperty("class", "masterVolumeSlider")
+        self.master_volume_slider.setObjectName("masterVolumeSlider")
         
         self.master_volume_display = QLabel("100%")
         self.master_volume_display.setProperty("class", "volumeDisplay")
         self.master_volume_display.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.master_volume_display.setStyleSheet("font-size: 11px; font-weight: bold; padding: 2px 6px;")
         
         master_section.addWidget(master_label)
         master_section.addWidget(self.master_volume_slider, 0, Qt.AlignmentFlag.AlignCenter)
@@ -589,7 +647,6 @@ class DJApp(QMainWindow):
         crossfader_title = QLabel("CROSSFADER")
         crossfader_title.setProperty("class", "mixerLabel")
         crossfader_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        crossfader_title.setStyleSheet("font-size: 11px; font-weight: bold; letter-spacing: 2px;")
         
         # Deck indicators above crossfader - CLEAR & VISIBLE
         deck_indicators_layout = QHBoxLayout()
@@ -597,12 +654,10 @@ class DJApp(QMainWindow):
         self.deck1_indicator = QLabel("◄ DECK A")
         self.deck1_indicator.setProperty("class", "deckIndicator")
         self.deck1_indicator.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        self.deck1_indicator.setStyleSheet("font-size: 10px; font-weight: bold; padding: 2px 4px;")
         
         self.deck2_indicator = QLabel("DECK B ►")
         self.deck2_indicator.setProperty("class", "deckIndicator")
         self.deck2_indicator.setAlignment(Qt.AlignmentFlag.AlignRight)
-        self.deck2_indicator.setStyleSheet("font-size: 10px; font-weight: bold; padding: 2px 4px;")
         
         deck_indicators_layout.addWidget(self.deck1_indicator)
         deck_indicators_layout.addStretch()
@@ -615,13 +670,12 @@ class DJApp(QMainWindow):
         self.crossfader.setValue(50)
         self.crossfader.setFixedHeight(26)  # Professional height
         self.crossfader.setMinimumWidth(300)  # Longer for better control
-        self.crossfader.setProperty("class", "crossfaderSlider")
+        self.crossfader.setObjectName("crossfaderSlider")
         
         # Position display below crossfader - CLEAR & READABLE
         self.crossfader_display = QLabel("CENTER")
-        self.crossfader_display.setProperty("class", "crossfaderDisplay")
+        self.crossfader_display.setObjectName("crossfaderDisplay")
         self.crossfader_display.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.crossfader_display.setStyleSheet("font-size: 11px; font-weight: bold; padding: 2px 8px;")
         
         crossfader_section.addWidget(crossfader_title)
         crossfader_section.addLayout(deck_indicators_layout)
@@ -641,13 +695,52 @@ class DJApp(QMainWindow):
         main_layout.addLayout(mixer_section)  # Professional mixer section below decks
         
         # Connect volume control signals
-        # All volume changes trigger the main volume handler
+        # All volume changes trigger the main volume handler, coalesced to at most one
+        # recompute per frame while a slider or the crossfader is being dragged
+        self._volume_coalesce_timer = QTimer(self)
+        self._volume_coalesce_timer.setSingleShot(True)
+        self._volume_coalesce_timer.setInterval(16)
+        self._volume_coalesce_timer.timeout.connect(self._on_volume_changed)
         self.crossfader.valueChanged.connect(self._update_crossfader_display)
-        self.crossfader.valueChanged.connect(self._on_volume_changed)
+        self.crossfader.valueChanged.connect(self._schedule_volume_update)
         self.master_volume_slider.valueChanged.connect(self._update_master_volume_display)
-        self.master_volume_slider.valueChanged.connect(self._on_volume_changed)
-        self.deck1.volumeChanged.connect(self._on_volume_changed)
-        self.deck2.volumeChanged.connect(self._on_volume_changed)
+        self.master_volume_slider.valueChanged.connect(self._schedule_volume_update)
+        self._update_master_volume_display()
+
+    def _build_decks(self):
+        """
+        Create both deck widgets in place of their placeholders and wire them to the mixer.
+        """
+        # Create deck widgets with responsive sizing
+        self.deck1 = DeckWidget(1, main_app=self, audio_analyzer=self.audio_analyzer)
+        self.deck2 = DeckWidget(2, main_app=self, audio_analyzer=self.audio_analyzer)
+        
+        for deck, placeholder in zip((self.deck1, self.deck2), self._deck_placeholders):
+            deck.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+            self._decks_layout.replaceWidget(placeholder, deck)
+            placeholder.deleteLater()
+        self._deck_placeholders = []
+        
+        # --- Connect Sync Button Signals --- 
+        # Use lambda to pass the deck number to the toggle_sync function
+        self.deck1.sync_button.clicked.connect(lambda: self.toggle_sync(1))
+        self.deck2.sync_button.clicked.connect(lambda: self.toggle_sync(2))
+        # ---------------------------------
+        
+        self.deck1.volumeChanged.connect(self._schedule_volume_update)
+        self.deck2.volumeChanged.connect(self._schedule_volume_update)
+        
+        # Beat phase monitoring only runs while both synced decks play
+        self.deck1.playingChanged.connect(self._update_beat_phase_monitor)
+        self.deck2.playingChanged.connect(self._update_beat_phase_monitor)
+        self.deck1.positionChanged.connect(self._on_deck_position)
+        self.deck2.positionChanged.connect(self._on_deck_position)
+        
+        # The theme was applied before the decks existed
+        self._apply_theme_to_dialog(self.deck1)
+        self._apply_theme_to_dialog(self.deck2)
+        self._update_non_css_elements(self.current_theme)
+        self._setup_deck_tooltips()
         
         # Initial volume application
         self._on_volume_changed()
@@ -688,8 +781,11 @@ class DJApp(QMainWindow):
             "Start/Stop recording your mix.\n"
             "Make sure to set a recording folder first!"
         )
-        
-        # Deck-specific tooltips
+
+    def _setup_deck_tooltips(self):
+        """
+        Add helpful tooltips to the deck controls.
+        """
         for deck in [self.deck1, self.deck2]:
             # Volume slider
             deck.volume_slider.setToolTip(
@@ -825,6 +921,7 @@ class DJApp(QMainWindow):
             return
 
         if self.file_browser is None:
+            from file_management import FileBrowserDialog
             self.file_browser = FileBrowserDialog(self.audio_directory, parent=self, audio_analyzer=self.audio_analyzer, cache_manager=self.cache_manager)
             self.file_browser.file_selected.connect(self.load_track_from_browser)
             # Connect BPM analysis signal
@@ -881,6 +978,13 @@ class DJApp(QMainWindow):
         else:
              print(f"Error: Invalid deck number {deck_number}")
 
+    def _schedule_volume_update(self):
+        """
+        Queue a volume recompute; further changes before it runs are folded into it.
+        """
+        if not self._volume_coalesce_timer.isActive():
+            self._volume_coalesce_timer.start()
+
     def _on_volume_changed(self):
         """
         Handle volume changes from master volume, crossfader, or deck volume sliders.
@@ -924,9 +1028,6 @@ class DJApp(QMainWindow):
             # Apply volumes to decks
             self._apply_volume_to_deck(self.deck1, final_volume1)
             self._apply_volume_to_deck(self.deck2, final_volume2)
-            
-            # Update master volume display
-            self._update_master_volume_display()
                 
         except Exception as e:
             print(f"Error in volume calculation: {e}")
@@ -938,19 +1039,16 @@ class DJApp(QMainWindow):
         """
         try:
             volume_percent = self.master_volume_slider.value()
-            self.master_volume_display.setText(f"{volume_percent}%")
+            self.master_volume_display.setText(_PERCENT_TEXT[volume_percent])
             
-            # Add visual feedback for master volume
-            if volume_percent < 100:
-                # Use reduced volume class
-                self.master_volume_display.setProperty("class", "volumeDisplayReduced")
-            else:
-                # Full volume - show normal style
-                self.master_volume_display.setProperty("class", "volumeDisplay")
+            # Add visual feedback for master volume: reduced volume class below 100%
+            display_class = "volumeDisplayReduced" if volume_percent < 100 else "volumeDisplay"
                 
-            # Update the widget style
-            self.master_volume_display.style().unpolish(self.master_volume_display)
-            self.master_volume_display.style().polish(self.master_volume_display)
+            # Update the widget style only when the class changes
+            if self.master_volume_display.property("class") != display_class:
+                self.master_volume_display.setProperty("class", display_class)
+                self.master_volume_display.style().unpolish(self.master_volume_display)
+                self.master_volume_display.style().polish(self.master_volume_display)
             
         except Exception as e:
             print(f"Error updating master volume display: {e}")
@@ -981,14 +1079,16 @@ class DJApp(QMainWindow):
             # Get the deck-specific crossfader multiplier
             if (deck.deck_number == 1 and crossfader_pos > 0) or (deck.deck_number == 2 and crossfader_pos < 0):
                 # This deck is being reduced by crossfader position
-                deck.volume_slider.setProperty("class", "volumeSliderDimmed")
+                slider_class = "volumeSliderDimmed"
             else:
                 # No crossfader effect on this deck
-                deck.volume_slider.setProperty("class", "volumeSliderNormal")
+                slider_class = "volumeSliderNormal"
                 
-            # Update the style
-            deck.volume_slider.style().unpolish(deck.volume_slider)
-            deck.volume_slider.style().polish(deck.volume_slider)
+            # Update the style only when the class actually changes
+            if deck.volume_slider.property("class") != slider_class:
+                deck.volume_slider.setProperty("class", slider_class)
+                deck.volume_slider.style().unpolish(deck.volume_slider)
+                deck.volume_slider.style().polish(deck.volume_slider)
                 
         except Exception as e:
             print(f"Error applying volume to deck {deck.deck_number}: {e}")
@@ -1118,10 +1218,6 @@ class DJApp(QMainWindow):
              self.sync_master = deck_number
              self.update_sync_button_style(deck_number, "master")
              self.update_sync_button_style(other_deck_number, "default") # Ensure other is default
-             # Start beat phase monitoring
-             if not self.beat_phase_monitor.isActive():
-                 self.beat_phase_monitor.start()
-                 print("🔄 Beat phase monitoring activated")
 
         # Case 2: The clicked deck is the current sync master
         elif self.sync_master == deck_number:
@@ -1134,10 +1230,6 @@ class DJApp(QMainWindow):
              # Reset button styles
              self.update_sync_button_style(deck_number, "default")
              self.update_sync_button_style(other_deck_number, "default")
-             # Stop beat phase monitoring
-             if self.beat_phase_monitor.isActive():
-                 self.beat_phase_monitor.stop()
-                 print("⏸ Beat phase monitoring deactivated")
 
         # Case 3: The OTHER deck is the sync master
         else: 
@@ -1179,20 +1271,12 @@ class DJApp(QMainWindow):
                                    self.statusBar().showMessage(f"✓ Keys are compatible: {slave_key} ↔ {master_key}", 3000)
                                else:
                                    print(f"🎹 KEY SYNC: Adjusting {slave_key} → {master_key} ({key_diff:+d} semitones)")
-                                   # Store the key transpose for display
-                                   this_deck.key_transpose = key_diff
-                                   this_deck._update_key_display()
-                                   
-                                   # In professional apps, key sync uses pitch shift or playback rate adjustment
-                                   # We'll use a subtle playback rate adjustment for key matching
-                                   # Note: 1 semitone ≈ 5.95% change in frequency
-                                   pitch_adjust = 2 ** (key_diff / 12.0)  # Musical semitone formula
-                                   current_rate = this_deck.player.playbackRate()
-                                   new_rate = current_rate * pitch_adjust
-                                   new_rate = max(0.5, min(new_rate, 2.0))  # Safety limits
-                                   
-                                   this_deck.player.setPlaybackRate(new_rate)
-                                   print(f"✓ Playback rate adjusted: {current_rate:.3f}x → {new_rate:.3f}x for key match")
+                                   # Pitch shift the slave through the deck's key transposition, so the
+                                   # displayed transpose always matches the rendered audio and later
+                                   # manual transposes start from it
+                                   if key_diff != this_deck.key_transpose:
+                                       this_deck.transpose_key(key_diff - this_deck.key_transpose)
+                                   print(f"✓ Key transposed {key_diff:+d} semitones for key match")
                                    # Show notification for key adjustment
                                    self.statusBar().showMessage(f"🎹 Key Synced: {slave_key} → {master_key} ({key_diff:+d} semitones)", 5000)
                            else:
@@ -1259,7 +1343,8 @@ class DJApp(QMainWindow):
     def _monitor_beat_phase(self):
         """
         Professional beat phase monitoring - continuously checks and corrects beat alignment.
-        Runs every 500ms when sync is active to maintain perfect beat lock with intelligent dampening.
+        Runs every 500ms while a synced deck plays against its master (backing off to 1s once
+        the phase has held steady) to maintain perfect beat lock with intelligent dampening.
         """
         if self.sync_master is None or not self.sync_lock_enabled:
             return
@@ -1308,6 +1393,7 @@ class DJApp(QMainWindow):
                 # 2. Drift is increasing (not a temporary fluctuation)
                 # 3. Cooldown period has passed
                 if phase_diff > self.beat_phase_tolerance_ms:
+                    self._set_phase_check_interval(500)  # Out of tolerance - back to close tracking
                     # Check if drift is actually increasing (not just fluctuating)
                     if self.last_phase_drift > 0 and phase_diff < self.last_phase_drift * 1.5:
                         # Drift is stable or decreasing, don't correct
@@ -1335,10 +1421,50 @@ class DJApp(QMainWindow):
                 else:
                     # Within tolerance - update drift tracking
                     self.last_phase_drift = phase_diff
+                    self._phase_stable_ticks += 1
+                    if self._phase_stable_ticks >= 4:
+                        self._set_phase_check_interval(1000)  # Phase is holding - check less often
         except Exception as e:
             # Fail silently to not interrupt playback
             pass
     
+    def _set_phase_check_interval(self, interval_ms):
+        """
+        Change how often the beat phase is checked.
+        
+        Args:
+            interval_ms (int): Check interval in milliseconds.
+        """
+        if interval_ms == 500:
+            self._phase_stable_ticks = 0
+        if self.beat_phase_monitor.interval() != interval_ms:
+            self.beat_phase_monitor.setInterval(interval_ms)
+
+    def _update_beat_phase_monitor(self, _playing=None):
+        """
+        Run the beat phase monitor only while a synced deck and its master are both
+        playing, so the event loop isn't woken for nothing the rest of the time.
+        
+        Args:
+            _playing (bool, optional): New playing state when called from a deck signal (unused).
+        """
+        active = False
+        if self.sync_master is not None and self.sync_lock_enabled:
+            master_deck = self.deck1 if self.sync_master == 1 else self.deck2
+            slave_deck = self.deck2 if self.sync_master == 1 else self.deck1
+            active = (slave_deck._sync_active and
+                      master_deck.is_playing and slave_deck.is_playing)
+        
+        if active and not self.beat_phase_monitor.isActive():
+            self.last_phase_drift = 0
+            self._set_phase_check_interval(500)
+            self.beat_phase_monitor.start()
+            print("🔄 Beat phase monitoring activated")
+        elif not active and self.beat_phase_monitor.isActive():
+            self.beat_phase_monitor.stop()
+            self.last_phase_drift = 0  # Reset drift tracking
+            print("⏸ Beat phase monitoring deactivated")
+    
     def sync_slave_deck_tempo(self, master_new_bpm):
          """
          Called when the master deck's tempo changes, updates the slave if synced.
@@ -1355,6 +1481,21 @@ class DJApp(QMainWindow):
              print(f"⚡ Sync Master (Deck {self.sync_master}) tempo changed to {master_new_bpm}. INSTANT update Slave (Deck {slave_deck_number}).")
              slave_deck.set_deck_tempo_instant(master_new_bpm)
          
+    def notify(self, title, message, level="info", timeout_ms=5000):
+        """
+        Show a non-modal notification in the status bar, so deck errors don't open
+        nested dialog event loops while audio is playing.
+
+        Args:
+            title (str): Short notification title.
+            message (str): Notification text.
+            level (str): "info", "warning" or "error".
+            timeout_ms (int): How long the message stays visible in milliseconds.
+        """
+        icon = {"warning": "⚠", "error": "✖"}.get(level, "ℹ")
+        text = " ".join(message.split())  # Status bar is a single line
+        self.statusBar().showMessage(f"{icon} {title}: {text}", timeout_ms)
+
     def update_sync_button_style(self, deck_number, state="default"):
         """
         Updates the visual style and text of a sync button.
@@ -1366,6 +1507,9 @@ class DJApp(QMainWindow):
         deck = self.deck1 if deck_number == 1 else self.deck2
         if not deck or not deck.sync_button: return
 
+        # Cache the sync state on the deck so its beat indicator doesn't compare button text per tick
+        deck._sync_active = state in ("master", "synced")
+
         if state == "master":
              deck.sync_button.setText("MASTER")
              # Apply direct inline styling for guaranteed blue color
@@ -1449,6 +1593,9 @@ class DJApp(QMainWindow):
              deck.sync_button.setProperty("class", "syncDefault")
              deck.sync_button.style().unpolish(deck.sync_button)
              deck.sync_button.style().polish(deck.sync_button)
+        
+        # Sync state changed - start or stop beat phase monitoring to match
+        self._update_beat_phase_monitor()
              
     def _update_crossfader_display(self):
         """
@@ -1456,42 +1603,25 @@ class DJApp(QMainWindow):
         """
         value = self.crossfader.value()
         
-        # Create descriptive position text
         if value == 50:
-            position_text = "CENTER"
             # Set both deck indicators to normal brightness
-            self.deck1_indicator.setProperty("class", "deckIndicator")
-            self.deck2_indicator.setProperty("class", "deckIndicator")
-            self.deck1_indicator.setStyleSheet("font-size: 9px; font-weight: bold; padding: 1px; color: #888;")
-            self.deck2_indicator.setStyleSheet("font-size: 9px; font-weight: bold; padding: 1px; color: #888;")
+            deck1_class, deck2_class = "deckIndicator", "deckIndicator"
         elif value < 50:
-            # Calculate percentage bias toward Deck A
-            bias_percent = int((50 - value) * 2)
-            position_text = f"◄ A {bias_percent}%"
-            
             # Highlight Deck A, dim Deck B
-            self.deck1_indicator.setProperty("class", "deckIndicatorActive")
-            self.deck2_indicator.setProperty("class", "deckIndicatorDimmed")
-            self.deck1_indicator.setStyleSheet("font-size: 9px; font-weight: bold; padding: 1px; color: #f3cf2c;")
-            self.deck2_indicator.setStyleSheet("font-size: 9px; font-weight: bold; padding: 1px; color: #444;")
+            deck1_class, deck2_class = "deckIndicatorActive", "deckIndicatorDimmed"
         else:
-            # Calculate percentage bias toward Deck B
-            bias_percent = int((value - 50) * 2)
-            position_text = f"B {bias_percent}% ►"
-            
             # Highlight Deck B, dim Deck A
-            self.deck2_indicator.setProperty("class", "deckIndicatorActive")
-            self.deck1_indicator.setProperty("class", "deckIndicatorDimmed")
-            self.deck2_indicator.setStyleSheet("font-size: 9px; font-weight: bold; padding: 1px; color: #f3cf2c;")
-            self.deck1_indicator.setStyleSheet("font-size: 9px; font-weight: bold; padding: 1px; color: #444;")
+            deck1_class, deck2_class = "deckIndicatorDimmed", "deckIndicatorActive"
         
-        # Update the styles
-        self.deck1_indicator.style().unpolish(self.deck1_indicator)
-        self.deck1_indicator.style().polish(self.deck1_indicator)
-        self.deck2_indicator.style().unpolish(self.deck2_indicator)
-        self.deck2_indicator.style().polish(self.deck2_indicator)
+        # Update the styles only when a class changes, i.e. when the crossfader crosses center
+        for indicator, indicator_class in ((self.deck1_indicator, deck1_class), (self.deck2_indicator, deck2_class)):
+            if indicator.property("class") != indicator_class:
+                indicator.setProperty("class", indicator_class)
+                indicator.style().unpolish(indicator)
+                indicator.style().polish(indicator)
             
-        self.crossfader_display.setText(position_text)
+        # Descriptive position text, e.g. "◄ A 40%" for the bias toward Deck A
+        self.crossfader_display.setText(_CROSSFADER_TEXT[value])
 
     def _cleanup_all_temp_files(self):
         """
@@ -1512,59 +1642,13 @@ class DJApp(QMainWindow):
                 if hasattr(self.deck2, 'position_timer') and self.deck2.position_timer.isActive():
                     self.deck2.position_timer.stop()
 
-            # Get directory paths
-            temp_audio_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp_audio")
-            temp_tempo_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp_tempo")
-
-            # Function to forcefully delete files in a directory
-            def force_delete_files(directory):
-                """Force-delete all files in a directory with retries.
-
-                Attempts to remove each file in the specified directory, retrying on
-                transient PermissionError cases (e.g., file still in use) with a brief
-                backoff. Removes the directory itself if it becomes empty.
-
-                Args:
-                    directory (str): Absolute or relative path to the directory to clean.
-                """
-                if not os.path.exists(directory):
-                    return
-
-                print(f"Cleaning up directory: {directory}")
-                for filename in os.listdir(directory):
-                    file_path = os.path.join(directory, filename)
-                    try:
-                        if os.path.isfile(file_path):
-                            # Try multiple times with increasing delays
-                            max_attempts = 3
-                            for attempt in range(max_attempts):
-                                try:
-                                    os.remove(file_path)
-                                    print(f"Deleted: {file_path}")
-                                    break
-                                except PermissionError:
-                                    if attempt < max_attempts - 1:
-                                        print(f"File in use, retrying: {file_path}")
-                                        time.sleep(0.5 * (attempt + 1))  # Increasing delay
-                                    else:
-                                        print(f"Could not delete after {max_attempts} attempts: {file_path}")
-                                except Exception as e:
-                                    print(f"Error deleting {file_path}: {e}")
-                                    break
-                    except Exception as e:
-                        print(f"Error processing {filename}: {e}")
-
-                # Try to remove the directory itself if empty
-                try:
-                    if os.path.exists(directory) and not os.listdir(directory):
-                        os.rmdir(directory)
-                        print(f"Removed empty directory: {directory}")
-                except Exception as e:
-                    print(f"Could not remove directory {directory}: {e}")
+            # Let queued background deletions finish before sweeping the directories
+            QThreadPool.globalInstance().waitForDone(2000)
 
             # Clean up temp directories
-            force_delete_files(temp_audio_dir)
-            force_delete_files(temp_tempo_dir)
+            _delete_temp_dir_files(_TEMP_AUDIO_DIR)
+            _delete_temp_dir_files(_TEMP_TEMPO_DIR)
+            purge_eq_temp_files(on_exit=True)
 
         except Exception as e:
             print(f"Error during temp file cleanup: {e}")
@@ -1618,6 +1702,7 @@ class DJApp(QMainWindow):
             print(f"Starting recording to: {self.recording_file_path}")
 
             # --- Start Recording Worker ---
+            from recording_worker import RealTimeRecordingWorker
             self.recording_worker = RealTimeRecordingWorker(self.recording_file_path)
             self.recording_worker.finished.connect(self._handle_recording_finished)
             self.recording_worker.error.connect(self._handle_recording_error)
@@ -1988,6 +2073,7 @@ class DJApp(QMainWindow):
         Open AI-powered auto-mix dialog for intelligent playlist generation.
         """
         # Open auto-mix dialog
+        from automix_dialog import AutoMixDialog
         dialog = AutoMixDialog(self.audio_analyzer, self)
         dialog.playlist_ready.connect(self._load_automix_playlist)
         dialog.exec()
@@ -2019,9 +2105,6 @@ class DJApp(QMainWindow):
             self.deck2.load_file(second_track.file_path)
             print(f"AutoMix: Preloaded track 2 into Deck 2")
         
-        # Start auto-mix monitoring
-        self.automix_timer.start(1000)  # Check every second
-        
         # Auto-start playback after a short delay (to ensure files are loaded)
         QTimer.singleShot(1500, self._start_automix_playback)
         
@@ -2037,28 +2120,29 @@ class DJApp(QMainWindow):
             print("AutoMix: Starting playback of first track")
             self.deck1.toggle_playback()
     
+    def _on_deck_position(self, _position):
+        """
+        Check for an auto-mix transition whenever a deck's playback position advances.
+
+        Args:
+            _position (int): New deck position in milliseconds (unused).
+        """
+        if self.automix_active:
+            self._automix_check_transition()
+
     def _automix_check_transition(self):
         """
-        Monitor playback and handle automatic transitions between tracks.
+        Handle automatic transitions between tracks as playback advances.
         """
-        if not self.automix_active or not self.automix_playlist:
-            self.automix_timer.stop()
+        if not self.automix_playlist:
             return
         
         # Check which deck is currently playing
         deck1_playing = self.deck1.is_playing
         deck2_playing = self.deck2.is_playing
         
-        # Debug info
-        if deck1_playing or deck2_playing:
-            current_idx = self.automix_current_index
-            total_tracks = len(self.automix_playlist)
-            print(f"AutoMix Monitor: Deck1={deck1_playing}, Deck2={deck2_playing}, Track {current_idx+1}/{total_tracks}")
-        
-        # If both decks stopped, something went wrong
+        # Nothing to do while both decks are stopped, maybe they're loading
         if not deck1_playing and not deck2_playing:
-            print("AutoMix: WARNING - Both decks stopped!")
-            # Don't stop immediately, maybe they're loading
             return
         
         # Get current deck's position and duration
@@ -2070,7 +2154,6 @@ class DJApp(QMainWindow):
             
             # Check if next deck has a track loaded and ready
             if not next_deck.current_file:
-                print(f"AutoMix: Waiting for Deck 2 to have a track loaded...")
                 return  # Wait for track to be loaded
             
             # Time remaining until crossfade should start
@@ -2092,7 +2175,6 @@ class DJApp(QMainWindow):
             
             # Check if next deck has a track loaded and ready
             if not next_deck.current_file:
-                print(f"AutoMix: Waiting for Deck 1 to have a track loaded...")
                 return  # Wait for track to be loaded
             
             time_remaining = current_duration - current_position
@@ -2128,7 +2210,6 @@ class DJApp(QMainWindow):
             # Playlist finished
             print("AutoMix: Reached end of playlist!")
             self.automix_active = False
-            self.automix_timer.stop()
             QMessageBox.information(self, "Auto-Mix Complete", "Playlist finished!")
             return
         
@@ -2167,11 +2248,6 @@ class DJApp(QMainWindow):
                 else:
                     print(f"AutoMix: No more tracks to load, current track will be the last")
                 
-                # Ensure automix timer continues running for next transition
-                if self.automix_active and not self.automix_timer.isActive():
-                    print("AutoMix: Restarting timer to monitor next transition")
-                    self.automix_timer.start(1000)  # Check every second
-                
                 # Reset crossfading flag to allow next transition
                 self._automix_crossfading = False
                 print("AutoMix: Ready for next transition")
@@ -2303,7 +2379,7 @@ class DJApp(QMainWindow):
             stats_text = "Cache manager not available"
             
         stats_label = QLabel(stats_text)
-        stats_label.setProperty("class", "cacheStats")
+        stats_label.setObjectName("cacheStats")
         stats_label.setWordWrap(True)
         cache_layout.addWidget(stats_label)
         
@@ -2584,14 +2660,16 @@ Cache Statistics:
         """Load the saved theme setting or return Dark Mode as default."""
         default_theme = "Dark Mode"
         
+        # Parsed once here and kept, so saving a setting doesn't re-read the file
+        self._settings = {}
         try:
             if os.path.exists(self.settings_file):
                 with open(self.settings_file, 'r') as f:
-                    settings = json.load(f)
-                    saved_theme = settings.get('theme', default_theme)
-                    if saved_theme in self.theme_presets:
-                        print(f"Loaded saved theme: {saved_theme}")
-                        return saved_theme
+                    self._settings = json.load(f)
+                saved_theme = self._settings.get('theme', default_theme)
+                if saved_theme in self.theme_presets:
+                    print(f"Loaded saved theme: {saved_theme}")
+                    return saved_theme
         except Exception as e:
             print(f"Error loading theme setting: {e}")
         
@@ -2601,15 +2679,14 @@ Cache Statistics:
     def save_theme_setting(self, theme_name):
         """Save the current theme setting."""
         try:
-            settings = {}
-            if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r') as f:
-                    settings = json.load(f)
-            
-            settings['theme'] = theme_name
-            
-            with open(self.settings_file, 'w') as f:
-                json.dump(settings, f, indent=4)
+            self._settings['theme'] = theme_name
+            
+            # Write next to the file and rename it into place, so a crash mid-write
+            # can't leave a truncated settings file behind
+            partial_path = self.settings_file + ".part"
+            with open(partial_path, 'w') as f:
+                json.dump(self._settings, f, indent=4)
+            os.replace(partial_path, self.settings_file)
             print(f"Saved theme setting: {theme_name}")
         except Exception as e:
             print(f"Error saving theme setting: {e}")
@@ -2635,8 +2712,7 @@ Cache Statistics:
         
         # Load styles from styles.qss file and set theme property
         try:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            qss_path = os.path.join(script_dir, "styles.qss")
+            qss_path = os.path.join(_MODULE_DIR, "styles.qss")
             
             if os.path.exists(qss_path):
                 print(f"Loading styles from: {qss_path}")
@@ -2835,7 +2911,7 @@ Cache Statistics:
     def load_tutorial_setting(self):
         """Load tutorial enabled setting from config file."""
         try:
-            config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tutorial_config.json")
+            config_path = _TUTORIAL_CONFIG_PATH
             if os.path.exists(config_path):
                 with open(config_path, 'r') as f:
                     config = json.load(f)
@@ -2849,7 +2925,7 @@ Cache Statistics:
     def save_tutorial_setting(enabled):
         """Save tutorial enabled setting to config file."""
         try:
-            config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tutorial_config.json")
+            config_path = _TUTORIAL_CONFIG_PATH
             
             # Load existing config or create new one
             config = {}
@@ -2882,7 +2958,7 @@ Cache Statistics:
     def _reset_tutorial_from_settings(self):
         """Reset tutorial completion status."""
         try:
-            config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tutorial_config.json")
+            config_path = _TUTORIAL_CONFIG_PATH
             
             # Load existing config or create new one
             config = {}
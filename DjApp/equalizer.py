@@ -75,6 +75,12 @@ class ThreeBandEQ:
             self.treble_sos = signal.butter(3, self.treble_freq, 
                                            btype='highpass', fs=self.sample_rate, output='sos')
             
+            # Decoded audio is float32; float64 sections would make sosfilt upcast every
+            # band to float64, doubling the memory traffic of each pass
+            self.bass_sos = self.bass_sos.astype(np.float32)
+            self.mid_sos = self.mid_sos.astype(np.float32)
+            self.treble_sos = self.treble_sos.astype(np.float32)
+            
             # Keep old format for compatibility
             self.bass_b, self.bass_a = signal.butter(3, self.bass_freq, btype='lowpass', fs=self.sample_rate)
             self.mid_b, self.mid_a = signal.butter(3, [self.mid_freq_low, self.mid_freq_high], 
@@ -157,9 +163,12 @@ class ThreeBandEQ:
                 # Mono audio
                 return self._process_mono_realtime(audio_data, bass_gain, mid_gain, treble_gain)
             elif audio_data.ndim == 2:
-                # Stereo audio - process each channel separately
-                left_channel = audio_data[:, 0]
-                right_channel = audio_data[:, 1]
+                # Stereo audio - process each channel separately. Transpose to channel-major
+                # once so each channel is contiguous, instead of every filter pass copying a
+                # strided column
+                channels = np.ascontiguousarray(audio_data.T)
+                left_channel = channels[0]
+                right_channel = channels[1]
                 
                 left_processed = self._process_mono_realtime(left_channel, bass_gain, mid_gain, treble_gain)
                 right_processed = self._process_mono_realtime(right_channel, bass_gain, mid_gain, treble_gain)
@@ -233,10 +242,14 @@ class ThreeBandEQ:
             # When a gain is 0, that frequency band is effectively muted
             # When a gain is 1.0, that frequency band is unchanged
             # When a gain is > 1.0, that frequency band is amplified
-            processed = np.zeros_like(audio_data)
-            processed += bass * bass_gain  # Bass frequencies (0-250 Hz)
-            processed += mid * mid_gain    # Mid frequencies (250-4000 Hz)
-            processed += treble * treble_gain  # Treble frequencies (4000+ Hz)
+            # The band arrays are fresh filter outputs, so they are scaled and summed in
+            # place instead of allocating a temporary per band
+            processed = bass
+            processed *= bass_gain  # Bass frequencies (0-250 Hz)
+            mid *= mid_gain         # Mid frequencies (250-4000 Hz)
+            processed += mid
+            treble *= treble_gain   # Treble frequencies (4000+ Hz)
+            processed += treble
             
             # Apply crossfading with previous block if available (for real-time use)
             if self.prev_block is not None and len(self.prev_block) >= self.overlap:
@@ -264,10 +277,10 @@ class ThreeBandEQ:
             # Soft-clip to safeguard against digital clipping while preserving
             # overall gain. This keeps values within the valid range without
             # scaling the entire signal back down (so boosts remain audible).
-            processed = np.clip(processed, -1.0, 1.0)
+            np.clip(processed, -1.0, 1.0, out=processed)
             
             print("Python scipy EQ processing completed successfully")
-            return processed.astype(np.float32)
+            return processed.astype(np.float32, copy=False)
             
         except Exception as e:
             print(f"Error in scipy EQ processing: {e}")
@@ -150,7 +150,8 @@ class TempoShifter:
                 y = y.reshape(-1, 1)  # Make it 2D for pyrubberband
             
             # Apply time stretch (Rubber Band preserves pitch by default)
-            y_stretched = pyrb.time_stretch(y, sr, stretch_factor)
+            # pyrubberband's rate > 1 is faster, the inverse of stretch_factor
+            y_stretched = pyrb.time_stretch(y, sr, 1.0 / stretch_factor)
             
             # Ensure output is 2D for soundfile
             if y_stretched.ndim == 1:
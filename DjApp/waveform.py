@@ -543,6 +543,15 @@ class WaveformDisplay(QWidget):
             file_path (str): Path to the current audio file.
         """
         self._current_file_path = file_path
+
+    def ms_per_pixel(self):
+        """
+        Get how many milliseconds of audio one horizontal pixel of the scrolling view covers.
+
+        Returns:
+            float: Milliseconds per pixel.
+        """
+        return self._view_window_ms / max(1, self.width())
     
     def _process_fft_data_to_colors(self, fft_data):
         """